@@ -4,6 +4,8 @@ from src.data.processor import DataProcessor
 from src.visualization.pitch import PitchVisualizer  
 from src.visualization.charts import ChartCreator   
 from src.data.playersLoader import PlayerLoader 
+from src.data.facts import team_facts_path
+from src.data.ingest import SEASON_PROCESSES
 
 # Configuration de la page
 st.set_page_config(page_title="Analyse de Matchs", layout="wide")
@@ -13,57 +15,48 @@ st.title("Analyse de Matchs de la Premier League")
 EVENTS_PATH = "../EPL 2011-12/Events"
 LOGOS_PATH = "../EPL 2011-12/Logos"
 PLAYERS_PATH = "../EPL 2011-12/Players"
-loader = DataLoader(EVENTS_PATH, LOGOS_PATH)
+STORE_PATH = "../EPL 2011-12/Store"
+loader = DataLoader(EVENTS_PATH, LOGOS_PATH, STORE_PATH)
 players_loader = PlayerLoader(PLAYERS_PATH)
 processor = DataProcessor()
 
 try:
-    # Chargement des matches disponibles
-    match_files = loader.load_match_files()
+    # Chargement des matches disponibles depuis le manifeste
+    manifest = loader.get_manifest().set_index('File')
+    match_files = manifest.index.tolist()
     
     # Sélection du match
     selected_match = st.selectbox(
         "Sélectionner un match",
         match_files,
-        format_func=lambda x: x.replace('.csv', '')
+        format_func=lambda x: manifest.at[x, 'Match Name']
     )
     
     # Chargement des données du match sélectionné
-    print(selected_match)
     df = loader.load_match_data(selected_match)
-    teams = loader.get_teams(df)
-    logo_team1 = loader.load_logos(teams[0])
-    logo_team2 = loader.load_logos(teams[1])
+    teams = [manifest.at[selected_match, 'Home'], manifest.at[selected_match, 'Away']]
+    logo_team1 = loader.load_logo_asset(teams[0])
+    logo_team2 = loader.load_logo_asset(teams[1])
 
     df_players = players_loader.load_player_data(selected_match.replace("- Events.csv","- Players.csv"))
     
 
     # Calcul des statistiques
-    team_stats = processor.get_team_stats(df, teams)
+    team_stats = loader.load_match_object(
+        selected_match, "team_stats", lambda data: processor.get_team_stats(data, teams)
+    )
 
     # Affichage du score finale et des logos
     col1, col2, col3 = st.columns([1, 1, 1],vertical_alignment= "center")
 
     with col1:
         if logo_team1 is not None:
-            # Convertir l'image OpenCV en base64 avec correction BGR → RGB
-            import base64
-            import cv2
-            
-            # Convertir BGR en RGB
-            rgb_image = cv2.cvtColor(logo_team1, cv2.COLOR_BGR2RGB)
-            
-            # Encoder l'image RGB en PNG
-            success, encoded_image = cv2.imencode('.png', rgb_image)
-            if success:
-                base64_img = base64.b64encode(encoded_image).decode('utf-8')
-                
-                # Afficher l'image centrée avec HTML
-                st.markdown(f"""
-                    <div style="display: flex; justify-content: center;">
-                        <img src="data:image/png;base64,{base64_img}" width="100">
-                    </div>
-                """, unsafe_allow_html=True)
+            # Logo déjà encodé en PNG/base64 par le cache d'images
+            st.markdown(f"""
+                <div style="display: flex; justify-content: center;">
+                    <img src="{logo_team1.data_uri}" width="100">
+                </div>
+            """, unsafe_allow_html=True)
         
         st.write(f"<h3 style='text-align: center;'>{teams[0]}</h3>", unsafe_allow_html=True)
 
@@ -74,24 +67,12 @@ try:
 
     with col3:
         if logo_team2 is not None:
-            # Convertir l'image OpenCV en base64 avec correction BGR → RGB
-            import base64
-            import cv2
-            
-            # Convertir BGR en RGB
-            rgb_image = cv2.cvtColor(logo_team2, cv2.COLOR_BGR2RGB)
-            
-            # Encoder l'image RGB en PNG
-            success, encoded_image = cv2.imencode('.png', rgb_image)
-            if success:
-                base64_img = base64.b64encode(encoded_image).decode('utf-8')
-                
-                # Afficher l'image centrée avec HTML
-                st.markdown(f"""
-                    <div style="display: flex; justify-content: center;">
-                        <img src="data:image/png;base64,{base64_img}" width="100">
-                    </div>
-                """, unsafe_allow_html=True)
+            # Logo déjà encodé en PNG/base64 par le cache d'images
+            st.markdown(f"""
+                <div style="display: flex; justify-content: center;">
+                    <img src="{logo_team2.data_uri}" width="100">
+                </div>
+            """, unsafe_allow_html=True)
         
         st.write(f"<h3 style='text-align: center;'>{teams[1]}</h3>", unsafe_allow_html=True)
     
@@ -101,7 +82,11 @@ try:
     }
 
     # Création du graphique des statistiques
-    chart_creator = ChartCreator()
+    season_facts = processor.get_team_match_facts(team_facts_path(loader))
+    if season_facts is None:
+        st.info("Table de faits de la saison absente : le graphique utilise des maxima par défaut. "
+                "Pour la construire : `python -m src.data.facts`.")
+    chart_creator = ChartCreator(season_facts)
     stats_chart = chart_creator.create_centered_bar_chart(stats_data)
     st.plotly_chart(stats_chart, use_container_width=True)
 
@@ -237,10 +222,10 @@ try:
         # Selection de la visualisation
         # traduiser Choose Data to Visualize
         # Choisir les données à visualiser
-        data_choice = st.selectbox("Choisir les données à visualiser", ["Shots", "Passes", "Activity map"])
+        data_choice = st.selectbox("Choisir les données à visualiser", ["Shots", "Passes", "Activity map", "Expected Threat", "Passing network"])
         
         # Calcul et sélection de la plage de temps
-        max_minute = processor.get_max_minute(df)
+        max_minute = processor.get_max_minute(loader, selected_match)
         selected_minute = st.slider("Sélectionner la minute",0, max_minute)
 
         # Création de la visualisation du terrain
@@ -248,15 +233,32 @@ try:
 
         events_type = processor.get_events_types(data_choice)
         
-        if data_choice in (['Shots', 'Passes']):
+        if data_choice == 'Expected Threat':
+            # Passes et conduites des joueurs sélectionnés, notées par la surface xT de la saison
+            # Hors cache (pas de prébuild `python -m src.data.processor`) : construite ici, un processus par cœur
+            xt_progress = st.empty()
+            with st.spinner("Construction de la surface xT de la saison..."):
+                xt_model = processor.get_expected_threat(
+                    EVENTS_PATH, STORE_PATH, processes=SEASON_PROCESSES,
+                    progress=lambda done, total: xt_progress.progress(done / total, text=f"Matchs lus : {done}/{total}"),
+                )
+            xt_progress.empty()
+            actions = processor.get_xt_added(df, xt_model)
+            actions = actions[actions['Player1 Name'].isin(selected_players) & (actions['Minute'] <= selected_minute)]
+            pitch_plot = pitch_viz.create_xt_plot(actions, xt_model.surface, data_choice)
+        elif data_choice == 'Passing network':
+            # Réseaux des deux équipes jusqu'à la minute choisie (extraction faite une fois par match)
+            networks = processor.get_passing_network(loader, selected_match, 0, selected_minute)
+            pitch_plot = pitch_viz.create_passing_network(networks, data_choice, teams)
+        elif data_choice in (['Shots', 'Passes']):
             filtered_events = processor.get_events_vector_by_time(
-                df, selected_players, events_type,
+                loader, selected_match, selected_players, events_type,
                 selected_minute
             )
             pitch_plot = pitch_viz.create_vector_plot(filtered_events, data_choice, teams)
         else :
             filtered_events = processor.get_events_point_by_time(
-                df, selected_players, events_type,
+                loader, selected_match, selected_players, events_type,
                 selected_minute
             )    
             pitch_plot = pitch_viz.creat_heat_map(filtered_events, data_choice)
@@ -9,8 +9,10 @@ import plotly.express as px
 from src.data.loader import DataLoader
 from src.data.processor import DataProcessor
 from src.data.playersLoader import PlayerLoader
+from src.data.standings import StandingsCube
+from src.data.assets import get_asset_cache
+from src.data.disk_cache import disk_cached
 from src.visualization.xgScore import visualise_correlation_by_player, visualise_correlation_by_bins
-from datetime import datetime, timedelta
 
 
 
@@ -18,12 +20,13 @@ from datetime import datetime, timedelta
 EVENTS_PATH = "../EPL 2011-12/Events"
 LOGOS_PATH = "../EPL 2011-12/Logos"
 PLAYERS_PATH = "../EPL 2011-12/Players"
+STORE_PATH = "../EPL 2011-12/Store"
 TOTAL_MJ = 38
 TEAM_NB = 20
 
 processor = DataProcessor()
 
-loader = DataLoader(EVENTS_PATH, LOGOS_PATH)
+loader = DataLoader(EVENTS_PATH, LOGOS_PATH, STORE_PATH)
 players_loader = PlayerLoader(PLAYERS_PATH)
 
 def load_teams_names() -> List[str]:
@@ -34,168 +37,24 @@ def load_teams_names() -> List[str]:
 
 teams_names = load_teams_names()
 
-# Initialize ranking data properly with correct data types
-ranking_data = {
-    'Teams': teams_names,
-    'Played': [0] * TEAM_NB,
-    'Won': [0] * TEAM_NB,
-    'Drawn': [0] * TEAM_NB,
-    'Lost': [0] * TEAM_NB,
-    'GF': [0] * TEAM_NB,
-    'GA': [0] * TEAM_NB,
-    'GD': [0] * TEAM_NB,
-    'Points': [0] * TEAM_NB
-}
-
-ranking = pd.DataFrame(ranking_data)
+# Match manifest, refreshed once per rerun (only new or modified event files are read)
+manifest = loader.get_manifest()
 
-# Function to update ranking table based on match results
-def update_ranking(home_team, away_team, home_score, away_score):
-    # Get team indices
-    home_idx = ranking[ranking['Teams'] == home_team].index[0]
-    away_idx = ranking[ranking['Teams'] == away_team].index[0]
-    
-    # Update matches played
-    ranking.at[home_idx, 'Played'] += 1
-    ranking.at[away_idx, 'Played'] += 1
-    
-    # Update goals
-    ranking.at[home_idx, 'GF'] += home_score
-    ranking.at[home_idx, 'GA'] += away_score
-    ranking.at[away_idx, 'GF'] += away_score
-    ranking.at[away_idx, 'GA'] += home_score
-    
-    # Update goal difference
-    ranking.at[home_idx, 'GD'] = ranking.at[home_idx, 'GF'] - ranking.at[home_idx, 'GA']
-    ranking.at[away_idx, 'GD'] = ranking.at[away_idx, 'GF'] - ranking.at[away_idx, 'GA']
-    
-    # Update wins, draws, losses and points
-    if home_score > away_score:
-        # Home team wins
-        ranking.at[home_idx, 'Won'] += 1
-        ranking.at[home_idx, 'Points'] += 3
-        ranking.at[away_idx, 'Lost'] += 1
-    elif home_score < away_score:
-        # Away team wins
-        ranking.at[away_idx, 'Won'] += 1
-        ranking.at[away_idx, 'Points'] += 3
-        ranking.at[home_idx, 'Lost'] += 1
-    else:
-        # Draw
-        ranking.at[home_idx, 'Drawn'] += 1
-        ranking.at[away_idx, 'Drawn'] += 1
-        ranking.at[home_idx, 'Points'] += 1
-        ranking.at[away_idx, 'Points'] += 1
-
-# Function to calculate final score from match data
-def get_final_score(match_data, home_team, away_team):
-    # Count goals for each team
-    home_goals = len(match_data[(match_data['Event Name'] == 'Goal') & (match_data['Player1 Team'] == home_team)])
-    away_goals = len(match_data[(match_data['Event Name'] == 'Goal') & (match_data['Player1 Team'] == away_team)])
-    return home_goals, away_goals
-
-# Function to extract date from match name
-def extract_date(match_name):
-    # Example: '11.08.13 Blackburn Rovers v Wolverhampton Wanderers'
-    date_str = match_name.split(' ')[0]
-    try:
-        return datetime.strptime(date_str, '%y.%m.%d')
-    except ValueError:
-        return None
-
-# Group match files by matchday with a 3-day window
-@st.cache_data
+# Matchdays come from the persisted match manifest: no event file is opened
 def group_matches_by_matchday():
-    match_files = loader.load_match_files()
-    
-    # Dictionary to store matches with their metadata
-    match_info = {}
-    
-    # Extract match info for all matches
-    for match_file in match_files:
-        match_data = loader.load_match_data(match_file)
-        if not match_data.empty and 'Match Name' in match_data.columns:
-            match_name = match_data['Match Name'].iloc[0]
-            date = extract_date(match_name)
-            print(date)
-            if date:
-                home_team, away_team = loader.get_teams(match_data)
-                match_info[match_file] = {
-                    'date': date,
-                    'home_team': home_team,
-                    'away_team': away_team,
-                    'match_name': match_name
-                }
-    
-    # Sort matches by date
-    sorted_matches = sorted(match_info.items(), key=lambda x: x[1]['date'])
-    
-    # Group matches that occur within 3 days of each other
-    matchdays = []
-    current_matchday = []
-    reference_date = None
-    
-    for match_file, info in sorted_matches:
-        match_date = info['date']
-        
-        if reference_date is None or (match_date - reference_date).days > 3:
-            # Start a new matchday
-            if current_matchday:
-                matchdays.append(current_matchday)
-            current_matchday = [match_file]
-            reference_date = match_date
-        else:
-            # Add to current matchday
-            current_matchday.append(match_file)
-    
-    # Add the last matchday
-    if current_matchday:
-        matchdays.append(current_matchday)
-    
-    # Make sure we have exactly TOTAL_MJ matchdays
-    # If we have more, combine some adjacent matchdays
-    while len(matchdays) > TOTAL_MJ:
-        # Find the smallest matchday
-        smallest_idx = min(range(len(matchdays)-1), key=lambda i: len(matchdays[i]))
-        # Merge with the next one
-        matchdays[smallest_idx].extend(matchdays[smallest_idx + 1])
-        del matchdays[smallest_idx + 1]
-    
-    # If we have fewer, add empty matchdays
-    while len(matchdays) < TOTAL_MJ:
-        matchdays.append([])
-    
-    return matchdays
+    return loader.manifest.matchdays()
+
+# Cumulative standings for every matchweek, rebuilt only when the results in the manifest change
+# (a few hundred rows: kept in memory across reruns, no disk cache needed)
+@st.cache_resource
+def load_standings(results_key):
+    return StandingsCube(loader.manifest.table, teams_names, TOTAL_MJ)
 
-# Process all matches up to the selected matchweek
+standings = load_standings(tuple(manifest[['File', 'Home Score', 'Away Score', 'Matchday']].itertuples(index=False, name=None)))
+
+# Standings after the selected matchweek (direct lookup in the cube)
 def process_matches_up_to_matchweek(matchweek):
-    # Reset ranking table
-    for col in ['Played', 'Won', 'Drawn', 'Lost', 'GF', 'GA', 'GD', 'Points']:
-        ranking[col] = 0
-    
-    # Group matches by matchday
-    matchdays = group_matches_by_matchday()
-    
-    # Process matches up to the selected matchweek
-    for i in range(min(matchweek, len(matchdays))):
-        for match_file in matchdays[i]:
-            # Load match data
-            match_data = loader.load_match_data(match_file)
-            
-            if not match_data.empty:
-                # Get team names
-                teams = loader.get_teams(match_data)
-                if len(teams) >= 2:
-                    home_team, away_team = teams[0], teams[1]
-                    
-                    # Calculate final score
-                    home_score, away_score = get_final_score(match_data, home_team, away_team)
-                    
-                    # Update ranking
-                    update_ranking(home_team, away_team, home_score, away_score)
-    
-    # Sort ranking by points (descending), goal difference (descending), and goals for (descending)
-    return ranking.sort_values(by=['Points', 'GD', 'GF'], ascending=[False, False, False]).reset_index(drop=True)
+    return standings.table(matchweek)
 
 # Streamlit app layout
 st.title("EPL 2011-12 Analyse de la Saison")
@@ -212,21 +71,12 @@ selected_matchweek = st.sidebar.slider("Sélectionner la semaine ", 0, total_mat
 st.subheader(f"Table de la Ligue")
 if selected_matchweek == 0:
     # Display initial ranking (sorted) without any matches processed
-    initial_ranking = ranking.sort_values(by=['Points', 'GD', 'GF'], ascending=[False, False, False]).reset_index(drop=True)
+    initial_ranking = process_matches_up_to_matchweek(0)
     st.dataframe(initial_ranking.style.apply(lambda x: ['background-color: #e6f7ff' if i < 4 else
                                           'background-color: #fff0e6' if i > len(initial_ranking) - 4 else '' 
                                           for i in range(len(initial_ranking))], axis=0))
     st.info("Select a matchweek to view updated standings and match results.")
 else:
-    # Sample match details
-    if selected_matchweek <= len(matchdays) and matchdays[selected_matchweek-1]:
-        # Get a sample match from the selected matchweek
-        sample_match_file = matchdays[selected_matchweek-1][0]
-        sample_match_data = loader.load_match_data(sample_match_file)
-        
-        if not sample_match_data.empty and 'Match Name' in sample_match_data.columns:
-            sample_match_name = sample_match_data['Match Name'].iloc[0]
-
     sorted_ranking = process_matches_up_to_matchweek(selected_matchweek)
     
     st.subheader(f"League Table after Matchweek {selected_matchweek}")
@@ -255,55 +105,74 @@ else:
         matches_in_week = matchdays[selected_matchweek-1]
         
         if matches_in_week:  # Check if there are matches for this matchweek
+            results = manifest.set_index('File')
             for match_file in matches_in_week:
-                match_data = loader.load_match_data(match_file)
+                match = results.loc[match_file]
+                home_team, away_team = match['Home'], match['Away']
+                home_score, away_score = match['Home Score'], match['Away Score']
+                
+                # Display match result
+                col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 2])
+                
+                home_logo = loader.load_logos(home_team)
+                away_logo = loader.load_logos(away_team)
+                
+                with col1:
+                    st.write(home_team)
+                    if home_logo is not None:
+                        st.image(home_logo, width=50)
                 
-                if not match_data.empty:
-                    teams = loader.get_teams(match_data)
-                    if len(teams) >= 2:
-                        home_team, away_team = teams[0], teams[1]
-                        home_score, away_score = get_final_score(match_data, home_team, away_team)
-                        
-                        # Display match result
-                        col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 2])
-                        
-                        home_logo = loader.load_logos(home_team)
-                        away_logo = loader.load_logos(away_team)
-                        
-                        with col1:
-                            st.write(home_team)
-                            if home_logo is not None:
-                                st.image(home_logo, width=50)
-                        
-                        with col2:
-                            st.write(f"{home_score}")
-                        
-                        with col3:
-                            st.write("vs")
-                        
-                        with col4:
-                            st.write(f"{away_score}")
-                        
-                        with col5:
-                            st.write(away_team)
-                            if away_logo is not None:
-                                st.image(away_logo, width=50)
-                        
-                        st.write("---")
+                with col2:
+                    st.write(f"{home_score}")
+                
+                with col3:
+                    st.write("vs")
+                
+                with col4:
+                    st.write(f"{away_score}")
+                
+                with col5:
+                    st.write(away_team)
+                    if away_logo is not None:
+                        st.image(away_logo, width=50)
+                
+                st.write("---")
         else:
             st.info("No matches available for this matchweek.")
 
+    # Evolution of every team's position up to the selected matchweek
+    st.subheader("Évolution du classement")
+    trajectory = standings.trajectory().loc[:selected_matchweek]
+    fig_positions = px.line(
+        trajectory.reset_index().melt(id_vars='Matchday', var_name='Team', value_name='Position'),
+        x='Matchday',
+        y='Position',
+        color='Team',
+        markers=True
+    )
+    fig_positions.update_yaxes(autorange="reversed", dtick=1)
+    fig_positions.update_layout(height=600, xaxis_title="Journée", yaxis_title="Position")
+    st.plotly_chart(fig_positions, use_container_width=True)
+
 
 #st.table(ranking)
 
 # visualizing the correlation between angle of shoot and xgscore
 
 
-df_shots_aggregated_by_player_shots = loader.get_angle_xg()
+@disk_cached(lambda: ["shots.csv"])
+def load_angle_xg():
+    return loader.get_angle_xg()
+
+@disk_cached(lambda: ["shots.csv"])
+def load_angle_bins():
+    return loader.get_angle_bins()
+
+df_shots_aggregated_by_player_shots = load_angle_xg()
 
 #visualise_correlation_by_player(df_shots_aggregated_by_player_shots)
 
-df_shots_by_bins = loader.get_angle_bins()
+df_shots_by_bins = load_angle_bins()
 #visualise_correlation_by_bins(df_shots_by_bins)
 
 
@@ -357,19 +226,14 @@ top_scorers,top_passers,top_shooters,top_defenders = players_loader.get_top_perf
 
 
 
-# Génération dynamique des images des joueurs
-photos = [f"players/{player}.jpg" for player in top_scorers["Player Name"][0:3]]
-print(f" photos are ={photos}")
+# Photos des joueurs, décodées et encodées une seule fois par processus
+photos_cache = get_asset_cache("players", max_size=500)
+photos = [photos_cache.get(player) or photos_cache.get("default") for player in top_scorers["Player Name"][0:3]]
 
-# Vérifier si les images existent sinon utiliser une image par défaut
-photos = [photo if os.path.exists(photo) else "players/default.jpg" for photo in photos]
-print("real photos are = ", photos)
+# Utiliser le chemin de l'image par défaut si aucune photo n'est disponible
+photos = [photo.png if photo is not None else "players/default.jpg" for photo in photos]
 top_scorers = top_scorers.reset_index(drop=True)
 
-# Vérification des trois meilleurs joueurs
-print(f"Top scorers names and goals:")
-print(top_scorers[["Player Name", "Goals"]].head(3))
-
 # Récupération des trois meilleurs joueurs
 players = {
     "🥇": (top_scorers.loc[0, "Player Name"], top_scorers.loc[0, "Goals"], photos[0]),
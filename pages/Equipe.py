@@ -9,6 +9,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import seaborn as sns
 from src.data.processor import DataProcessor
+from src.data.ingest import SEASON_PROCESSES
 
 from src.visualization.pitch import PitchVisualizer  
 
@@ -19,9 +20,10 @@ from src.visualization.pitch import PitchVisualizer
 EVENTS_PATH = "../EPL 2011-12/Events"
 LOGOS_PATH = "../EPL 2011-12/Logos"
 PLAYERS_PATH = "../EPL 2011-12/Players"
+STORE_PATH = "../EPL 2011-12/Store"
 
 
-events_loader = DataLoader(EVENTS_PATH, LOGOS_PATH)
+events_loader = DataLoader(EVENTS_PATH, LOGOS_PATH, STORE_PATH)
 players_loader = PlayerLoader(PLAYERS_PATH)
 
 
@@ -136,6 +138,29 @@ try :
     st.plotly_chart(fig)  # Affichage du graphique Plotly
     st.markdown("</div>", unsafe_allow_html=True)
 
+    # Flux de passes de l'équipe : saison (somme des matrices par match) ou un seul match
+    st.markdown("<h2 style='text-align: center;'>🔀 Flux de passes</h2>", unsafe_allow_html=True)
+    # Matchs de l'équipe, lus une fois depuis le manifeste (flux de passes et analyse des tirs)
+    extension = " - Events.csv"
+    matches = [file.replace(extension, '') for file in events_loader.get_team_matches(selected_team_name)['File']]
+    flow_choice = st.selectbox("Période", ["Saison"] + matches, key="flow_match")
+    if flow_choice == "Saison":
+        # Hors cache (pas de prébuild `python -m src.data.processor`) : construits ici, un processus par cœur
+        flow_progress = st.empty()
+        with st.spinner("Construction des flux de passes de la saison..."):
+            flows = processor.get_season_pass_flows(
+                EVENTS_PATH, STORE_PATH, processes=SEASON_PROCESSES,
+                progress=lambda done, total: flow_progress.progress(done / total, text=f"Matchs lus : {done}/{total}"),
+            )
+        flow_progress.empty()
+    else:
+        flows = processor.get_match_pass_flows(events_loader, flow_choice + extension)
+    flow_map = PitchVisualizer().create_flow_map(
+        flows.select(selected_team_name), flows.length_bins, flows.width_bins,
+        f"Flux de passes : {selected_team_name} ({flow_choice})"
+    )
+    st.plotly_chart(flow_map, use_container_width=False)
+
 
 
 
@@ -483,11 +508,6 @@ try :
         # Center the title
         st.markdown("<h2 style='text-align: center;'>⚽ Analyse des tirs et des distributions</h2>", unsafe_allow_html=True)
 
-        # Chargement des fichiers de match
-        match_files = events_loader.load_match_files()
-        extension = " - Events.csv"
-        matches = [file.replace(extension, '') for file in match_files if selected_team_name in file]
-
         # Sélecteur pour choisir entre analyse globale ou par match
         col1,col2,col3 = st.columns([1,2,1])
         with col2:
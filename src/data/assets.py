@@ -0,0 +1,88 @@
+from typing import Dict, NamedTuple, Optional, Tuple
+import base64
+import os
+import threading
+import cv2
+import numpy as np
+
+
+class Asset(NamedTuple):
+    """Image décodée et réduite une seule fois, avec ses encodages prêts à afficher."""
+    image: np.ndarray  # RGB, lecture seule
+    png: bytes
+    base64: str
+
+    @property
+    def data_uri(self) -> str:
+        return f"data:image/png;base64,{self.base64}"
+
+
+class AssetCache:
+    """Cache des images d'un répertoire (logos, photos de joueurs), indexé par nom de fichier.
+
+    Chaque image est décodée, réduite à `max_size` pixels sur son plus grand côté, puis encodée
+    en PNG et en base64 ; elle n'est relue que si le fichier change sur le disque.
+    """
+
+    def __init__(self, directory: str, max_size: int = 200, extension: str = ".jpg"):
+        self.directory = directory
+        self.max_size = max_size
+        self.extension = extension
+        self._assets: Dict[str, Tuple[float, Asset]] = {}
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, str(name) + self.extension)
+
+    def get(self, name: str) -> Optional[Asset]:
+        """Image `name` (sans extension), ou None si le fichier est absent ou illisible."""
+        path = self.path(name)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._assets.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        asset = self._encode(path)
+        if asset is not None:
+            with self._lock:
+                self._assets[name] = (mtime, asset)
+        return asset
+
+    def _encode(self, path: str) -> Optional[Asset]:
+        img = cv2.imread(path)
+        if img is None:
+            return None
+        height, width = img.shape[:2]
+        scale = self.max_size / max(height, width)
+        if scale < 1:
+            img = cv2.resize(img, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
+        success, encoded = cv2.imencode(".png", img)
+        if not success:
+            return None
+        image = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        image.setflags(write=False)
+        png = encoded.tobytes()
+        return Asset(image, png, base64.b64encode(png).decode("utf-8"))
+
+    def html(self, name: str, width: int = 100) -> str:
+        """Balise <img> embarquant l'image (chaîne vide si elle n'existe pas)."""
+        asset = self.get(name)
+        if asset is None:
+            return ""
+        return f'<img src="{asset.data_uri}" width="{width}">'
+
+
+_caches: Dict[Tuple[str, int], AssetCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_asset_cache(directory: str, max_size: int = 200) -> AssetCache:
+    """Cache partagé par tout le processus pour un répertoire d'images."""
+    key = (os.path.abspath(directory), max_size)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = AssetCache(directory, max_size)
+        return _caches[key]
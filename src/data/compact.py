@@ -0,0 +1,118 @@
+from typing import Dict, List
+import json
+import os
+import numpy as np
+import pandas as pd
+from src.data.events import EVENT_NAMES
+
+
+# Colonnes texte répétées dans chaque fichier d'événements, et le dictionnaire qu'elles partagent
+CATEGORICAL_COLUMNS = {
+    'Competition': 'Competition',
+    'Match Name': 'Match Name',
+    'Team A': 'Team',
+    'Team B': 'Team',
+    'Player1 Team': 'Team',
+    'Player1 Name': 'Player',
+    'Event Name': 'Event Name',
+}
+
+# Colonnes numériques réduites : coordonnées au centimètre, temps au dixième de seconde, xG et BMP
+FLOAT32_COLUMNS = ['X', 'Y', 'Time', 'xG Score', 'BMP']
+INT8_COLUMNS = ['Half']
+
+# Valeur réservée (dernière catégorie de chaque dictionnaire) pour les valeurs absentes des dictionnaires
+UNKNOWN_VALUE = '<unknown>'
+
+
+class SeasonDictionaries:
+    """Dictionnaires catégoriels communs à toute la saison (équipes, joueurs, matchs, événements).
+
+    Tous les matchs chargés en mode compact partagent les mêmes catégories : ils se concatènent
+    sans repasser par des objets Python. Les dictionnaires ne font que grandir (une valeur
+    nouvelle est ajoutée à la fin) et sont enregistrés en JSON. Ils ne sont construits et
+    étendus qu'à l'ingestion (`DataLoader.build_store`) ; la lecture (`apply`) ne les modifie
+    jamais et range les valeurs inconnues sous `UNKNOWN_VALUE`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.categories: Dict[str, List[str]] = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.categories = json.load(f)
+
+    def save(self):
+        """Écrit les dictionnaires (écriture atomique : un lecteur ne voit jamais de fichier partiel)."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.categories, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def build(self, season: pd.DataFrame):
+        """Construit les dictionnaires à partir des colonnes texte de toute la saison."""
+        values: Dict[str, set] = {}
+        for column, dictionary in CATEGORICAL_COLUMNS.items():
+            if column in season.columns:
+                values.setdefault(dictionary, set()).update(season[column].dropna().unique())
+        self.categories = {dictionary: sorted(map(str, found)) for dictionary, found in values.items()}
+        # Les événements suivent l'ordre du vocabulaire (mêmes codes que EVENTS)
+        extra_events = sorted(set(self.categories.get('Event Name', [])) - set(EVENT_NAMES))
+        self.categories['Event Name'] = EVENT_NAMES + extra_events
+        self.save()
+
+    def extend(self, data: pd.DataFrame) -> bool:
+        """Ajoute les valeurs encore inconnues d'un match ; renvoie True si un dictionnaire a changé."""
+        changed = False
+        for column, dictionary in CATEGORICAL_COLUMNS.items():
+            if column not in data.columns:
+                continue
+            known = self.categories.setdefault(dictionary, [])
+            missing = pd.Index(data[column].dropna().unique().astype(str)).difference(known)
+            if len(missing):
+                known.extend(missing.tolist())
+                changed = True
+        if changed:
+            self.save()
+        return changed
+
+    def apply(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Version compacte d'un tableau d'événements (catégories de la saison, numériques réduits).
+
+        Lecture seule : une valeur absente de son dictionnaire prend le code réservé (`UNKNOWN_VALUE`),
+        une valeur manquante reste manquante.
+        """
+        compact = data.copy()
+        for column, dictionary in CATEGORICAL_COLUMNS.items():
+            if column in compact.columns:
+                categories = self.categories.get(dictionary, []) + [UNKNOWN_VALUE]
+                values = compact[column]
+                codes = pd.Index(categories).get_indexer(values.to_numpy(dtype=object))
+                codes[(codes < 0) & values.notna().to_numpy()] = len(categories) - 1
+                compact[column] = pd.Categorical.from_codes(codes, categories=categories)
+        return downcast(compact)
+
+
+def downcast(data: pd.DataFrame) -> pd.DataFrame:
+    """Réduit les colonnes numériques des événements à float32 / int8."""
+    for column in FLOAT32_COLUMNS:
+        if column in data.columns:
+            data[column] = data[column].astype(np.float32)
+    for column in INT8_COLUMNS:
+        if column in data.columns and not data[column].isna().any():
+            data[column] = data[column].astype(np.int8)
+    return data
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Mémoire occupée par colonne (octets) avant et après compaction, avec le total."""
+    report = pd.DataFrame({
+        'Before': before.memory_usage(deep=True, index=False),
+        'After': after.memory_usage(deep=True, index=False).reindex(before.columns),
+    })
+    report.loc['Total'] = report.sum()
+    report['Ratio'] = report['After'] / report['Before']
+    return report
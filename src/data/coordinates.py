@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Tuple
+import os
+import threading
+import numpy as np
+import pandas as pd
+from src.data.registry import REGISTRY_FILE, get_registry
+
+
+COORDINATE_COLUMNS = ["X", "Y", "Half"]
+KEY_COLUMNS = ["Player1 Name", "Match Name"]
+
+
+class CoordinateIndex:
+    """Table de coordonnées (Shots_cords.csv, Touch_cords.csv) triée par joueur puis par match.
+
+    Les lignes d'un joueur, et celles d'un couple (joueur, match), sont contiguës : chaque
+    requête est une recherche dans un dictionnaire (clé : identifiants du registre) suivie
+    d'une tranche `iloc[start:stop]`, sans copie des données.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+
+        # Registre voisin de la table, lu sans enregistrer de nom (identifiants provisoires au besoin)
+        self.registry = get_registry(os.path.join(os.path.dirname(path), REGISTRY_FILE))
+        data = pd.read_csv(path, usecols=COORDINATE_COLUMNS + KEY_COLUMNS)
+        players = self.registry.ids("player", data["Player1 Name"], assign=False)
+        matches = self.registry.ids("match", data["Match Name"], assign=False)
+
+        order = np.lexsort((matches, players))
+        players, matches = players[order], matches[order]
+        self.coordinates = data[COORDINATE_COLUMNS].iloc[order].reset_index(drop=True)
+
+        # Début de chaque bloc (joueur, match) dans la table triée
+        changed = np.ones(len(data), dtype=bool)
+        changed[1:] = (players[1:] != players[:-1]) | (matches[1:] != matches[:-1])
+        starts = np.flatnonzero(changed)
+        stops = np.append(starts[1:], len(data))
+
+        self.match_ranges: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.player_ranges: Dict[int, Tuple[int, int]] = {}
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            player = int(players[start])
+            self.match_ranges[(player, int(matches[start]))] = (start, stop)
+            first = self.player_ranges.get(player, (start, stop))[0]
+            self.player_ranges[player] = (first, stop)
+
+    def _slice(self, bounds: Optional[Tuple[int, int]]) -> pd.DataFrame:
+        start, stop = bounds if bounds is not None else (0, 0)
+        return self.coordinates.iloc[start:stop]
+
+    def player(self, player_name: str) -> pd.DataFrame:
+        """Coordonnées d'un joueur sur toute la saison."""
+        return self._slice(self.player_ranges.get(self.registry.lookup("player", player_name)))
+
+    def player_match(self, player_name: str, match_name: str) -> pd.DataFrame:
+        """Coordonnées d'un joueur pour un match."""
+        key = (self.registry.lookup("player", player_name), self.registry.lookup("match", match_name))
+        return self._slice(self.match_ranges.get(key))
+
+
+_indexes: Dict[str, CoordinateIndex] = {}
+_lock = threading.Lock()
+
+
+def get_coordinate_index(path: str) -> CoordinateIndex:
+    """Index partagé par tout le processus, reconstruit seulement si le fichier a changé."""
+    key = os.path.abspath(path)
+    with _lock:
+        index = _indexes.get(key)
+        if index is None or index.mtime != os.path.getmtime(path):
+            index = CoordinateIndex(path)
+            _indexes[key] = index
+        return index
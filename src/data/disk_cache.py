@@ -0,0 +1,333 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+from src.data.hashing import file_hash
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow absent : les tableaux restent dans le pickle
+    pa = None
+
+
+# Cache de résultats par défaut, relatif au répertoire de l'application
+RESULT_CACHE_DIRECTORY = os.path.join(".cache", "results")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Version du format des entrées : la changer rend toutes les anciennes entrées inaccessibles
+CACHE_FORMAT = 3
+
+# Au plus un parcours du répertoire (éviction) par intervalle, sauf si le budget est dépassé
+EVICT_INTERVAL = 600
+
+# Taille à partir de laquelle un tableau ou un DataFrame est écrit hors du pickle
+PAYLOAD_MIN_BYTES = 1024 * 1024
+
+
+def _feed(digest, value):
+    """Ajoute au hash une sérialisation canonique de `value` (indépendante de `repr`).
+
+    Les conteneurs sont parcourus récursivement (dictionnaires et ensembles triés), les
+    tableaux et DataFrames hachés sur leur contenu complet ; les autres objets passent par
+    pickle, déterministe pour des valeurs simples.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(type(value).__name__.encode())
+        digest.update(repr(value).encode("utf-8") if not isinstance(value, bytes) else value)
+    elif isinstance(value, np.generic):
+        _feed(digest, value.item())
+    elif isinstance(value, (tuple, list)):
+        digest.update(f"{type(value).__name__}:{len(value)}".encode())
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict:{len(value)}".encode())
+        for item_key, item in sorted(((_digest(k), v) for k, v in value.items()), key=lambda kv: kv[0]):
+            digest.update(item_key.encode())
+            _feed(digest, item)
+    elif isinstance(value, (set, frozenset)):
+        digest.update(f"set:{len(value)}".encode())
+        for item in sorted(_digest(v) for v in value):
+            digest.update(item.encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"ndarray:{value.dtype.str}:{value.shape}".encode())
+        if value.dtype.hasobject:
+            _feed(digest, value.tolist())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        _feed(digest, [str(c) for c in value.columns] if isinstance(value, pd.DataFrame) else str(value.name))
+        _feed(digest, [str(t) for t in (value.dtypes if isinstance(value, pd.DataFrame) else [value.dtype])])
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    else:
+        digest.update(type(value).__qualname__.encode())
+        digest.update(pickle.dumps(value, protocol=4))
+
+
+def _digest(value) -> str:
+    digest = hashlib.sha256()
+    _feed(digest, value)
+    return digest.hexdigest()
+
+
+class _PayloadPickler(pickle.Pickler):
+    """Pickle dont les gros DataFrames (Arrow) et tableaux numériques (.npy) sont écrits à part.
+
+    Les petits tableaux, y compris ceux imbriqués dans des objets, restent dans le pickle.
+    """
+
+    def __init__(self, file, directory: str):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory = directory
+        self.payloads = 0
+
+    def _next_path(self, extension: str) -> Tuple[str, str]:
+        name = f"{self.payloads}{extension}"
+        self.payloads += 1
+        return name, os.path.join(self.directory, name)
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject and obj.nbytes >= PAYLOAD_MIN_BYTES:
+            name, path = self._next_path(".npy")
+            np.save(path, obj, allow_pickle=False)
+            return ("npy", name)
+        if pa is not None and isinstance(obj, pd.DataFrame) \
+                and obj.memory_usage(index=True).sum() >= PAYLOAD_MIN_BYTES \
+                and all(isinstance(c, str) for c in obj.columns):
+            try:
+                table = pa.Table.from_pandas(obj, preserve_index=True)
+            except (pa.ArrowException, TypeError, ValueError):
+                return None  # colonnes mixtes : gardées dans le pickle
+            name, path = self._next_path(".arrow")
+            with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            return ("arrow", name)
+        return None
+
+
+class _PayloadUnpickler(pickle.Unpickler):
+    """Relit les tableaux écrits à part en les projetant en mémoire (memory map).
+
+    Les tableaux NumPy sont projetés en copie sur écriture : modifiables comme après un calcul,
+    sans que la modification n'atteigne l'entrée du cache.
+    """
+
+    def __init__(self, file, directory: str):
+        super().__init__(file)
+        self.directory = directory
+
+    def persistent_load(self, pid):
+        kind, name = pid
+        path = os.path.join(self.directory, name)
+        if kind == "npy":
+            return np.load(path, mmap_mode="c")
+        return pa.ipc.open_file(pa.memory_map(path)).read_all().to_pandas()
+
+
+class DiskCache:
+    """Cache disque des résultats coûteux, adressé par le contenu.
+
+    La clé d'une entrée combine le nom de la fonction, ses arguments et le hash du contenu de
+    ses fichiers d'entrée : un fichier modifié donne une autre clé, l'ancienne entrée finit
+    évincée. Chaque entrée est un répertoire (pickle + gros tableaux Arrow / NumPy relus en
+    memory map) ; au-delà de `max_bytes`, les entrées les moins récemment lues sont supprimées.
+    Un résultat relu se modifie comme un résultat calculé, sans altérer l'entrée.
+    """
+
+    def __init__(self, directory: str = RESULT_CACHE_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        # Octets estimés du cache depuis le dernier parcours (None : jamais parcouru)
+        self._estimated_bytes: Optional[int] = None
+        self._last_evict = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def _file_hash(self, path: str) -> str:
+        """Hash du contenu d'un fichier, recalculé seulement si sa date ou sa taille change."""
+        stat = os.stat(path)
+        with self._lock:
+            known = self._hashes.get(path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        # Lecture du fichier hors du verrou : les autres sessions ne l'attendent pas
+        digest = file_hash(path)
+        with self._lock:
+            self._hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def inputs_hash(self, inputs: Iterable[str]) -> str:
+        """Hash combiné de fichiers et de répertoires (tous les fichiers qu'ils contiennent)."""
+        digest = hashlib.sha256()
+        for path in inputs:
+            files = [path]
+            if os.path.isdir(path):
+                files = sorted(
+                    os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+                )
+            for file_path in files:
+                digest.update(os.path.relpath(file_path, path).encode("utf-8"))
+                digest.update(self._file_hash(file_path).encode() if os.path.exists(file_path) else b"-")
+        return digest.hexdigest()
+
+    def key(self, name: str, args: tuple, kwargs: dict, inputs: Iterable[str]) -> str:
+        return _digest((CACHE_FORMAT, name, args, kwargs, self.inputs_hash(inputs)))
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def load(self, key: str):
+        """(True, valeur) si l'entrée existe, (False, None) sinon.
+
+        Une entrée illisible (pickle ou tableau corrompu, classe renommée...) compte comme
+        absente et est supprimée : le résultat sera recalculé.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(os.path.join(path, "value.pkl"), "rb") as f:
+                value = _PayloadUnpickler(f, path).load()
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            return False, None
+        os.utime(path)  # date de dernière lecture, pour l'éviction
+        return True, value
+
+    def store(self, key: str, value):
+        """Écrit une entrée (répertoire temporaire puis renommage : jamais d'entrée partielle)."""
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        staging = tempfile.mkdtemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with open(os.path.join(staging, "value.pkl"), "wb") as f:
+                _PayloadPickler(f, staging).dump(value)
+            size = sum(f.stat().st_size for f in os.scandir(staging))
+            os.replace(staging, path)
+        except OSError:
+            # Entrée écrite entre-temps par un autre processus
+            shutil.rmtree(staging, ignore_errors=True)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        else:
+            self._after_store(size)
+
+    def _after_store(self, size: int):
+        """Évince seulement si l'estimation dépasse le budget ou si le dernier parcours est ancien."""
+        with self._lock:
+            due = (self._estimated_bytes is None
+                   or self._estimated_bytes + size > self.max_bytes
+                   or time.monotonic() - self._last_evict > EVICT_INTERVAL)
+            if not due:
+                self._estimated_bytes += size
+                return
+        self.evict()
+
+    def entries(self) -> pd.DataFrame:
+        """Entrées du cache avec leur taille et leur date de dernière lecture."""
+        rows = []
+        if os.path.isdir(self.directory):
+            for prefix in os.scandir(self.directory):
+                if not prefix.is_dir():
+                    continue
+                for entry in os.scandir(prefix.path):
+                    if entry.name.startswith(".tmp-") or not entry.is_dir():
+                        continue
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    rows.append({"Key": entry.name, "Path": entry.path, "Bytes": size,
+                                 "Used": entry.stat().st_mtime})
+        return pd.DataFrame(rows, columns=["Key", "Path", "Bytes", "Used"])
+
+    def evict(self):
+        """Supprime les entrées les moins récemment lues tant que le cache dépasse son budget."""
+        entries = self.entries().sort_values("Used")
+        total = int(entries["Bytes"].sum())
+        for path, size in zip(entries["Path"], entries["Bytes"]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+        with self._lock:
+            self._estimated_bytes = total
+            self._last_evict = time.monotonic()
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_or_compute(self, name: str, args: tuple, kwargs: dict, inputs: Iterable[str],
+                       compute: Callable[[], object]):
+        """Résultat en cache de `compute()` pour ces arguments et ce contenu des fichiers d'entrée."""
+        try:
+            key = self.key(name, args, kwargs, inputs)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return compute()  # arguments non sérialisables : pas de cache
+        found, value = self.load(key)
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if found:
+            return value
+        value = compute()
+        self.store(key, value)
+        return value
+
+
+_caches: Dict[str, DiskCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_disk_cache(directory: str = RESULT_CACHE_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES) -> DiskCache:
+    """Cache disque partagé par tout le processus."""
+    key = os.path.abspath(directory)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = DiskCache(directory, max_bytes)
+            _caches[key] = cache
+        cache.max_bytes = max_bytes
+        return cache
+
+
+def disk_cached(inputs: Callable[..., Iterable[str]], name: Optional[str] = None,
+                ignore: Tuple[str, ...] = ("processes", "progress")):
+    """Décorateur : met en cache disque le résultat d'une fonction ou d'une méthode.
+
+    `inputs` reçoit les mêmes arguments que la fonction et renvoie les fichiers (ou
+    répertoires) dont dépend le résultat. Pour une méthode, `self` n'entre pas dans la clé :
+    l'état de l'instance doit se retrouver dans les fichiers d'entrée. Les paramètres de
+    `ignore` (nombre de processus, rappel de progression) ne changent pas le résultat et
+    n'entrent pas non plus dans la clé : une entrée construite hors ligne sert aux pages.
+    """
+    def decorator(function):
+        cache_name = name or function.__qualname__
+        signature = inspect.signature(function)
+        is_method = list(signature.parameters)[:1] == ["self"]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_kwargs = {
+                parameter: value for parameter, value in bound.arguments.items()
+                if parameter not in ignore and not (is_method and parameter == "self")
+            }
+            return get_disk_cache().get_or_compute(
+                cache_name, (), key_kwargs, list(inputs(*args, **kwargs)),
+                lambda: function(*args, **kwargs),
+            )
+        return wrapper
+    return decorator
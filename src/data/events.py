@@ -0,0 +1,136 @@
+from typing import Dict, Iterable, List, Optional, Set
+import numpy as np
+import pandas as pd
+
+
+# Vocabulaire des noms d'événements des fichiers "- Events.csv" ; le code d'un nom est sa position
+EVENT_NAMES = [
+    'Start Of Half', 'Pass', 'Block', 'Touch', 'Cross', 'Header', 'Tackle', 'Dribble', 'Shot',
+    'Offside', 'Kick Off', 'Foul', 'Clearance', 'Header Shot', 'Goal', 'Throw In', 'Substitution',
+    'Deflection', 'Yellow Card', 'Direct Free Kick Shot', 'Corner Pass', 'Direct Free Kick Pass',
+    'Handball', 'Penalty Shot', 'Red Card', 'Indirect Free Kick Pass', 'Goalkeeper Catch',
+    'Goalkeeper Throw', 'Goal Kick', 'Goalkeeper Pick Up', 'Goalkeeper Kick', 'Goalkeeper Save Catch',
+    'Goalkeeper Save', 'Goalkeeper Punch', 'Goalkeeper Drop Catch', 'Ball Out Of Play', 'End Of Half',
+    'Post', 'Crossbar', 'Stoppage', 'Drop Ball', 'Corner Cross', 'Direct Free Kick Cross', 'Own Goal',
+    'Foul Throw', 'Goalkeeper Fumble', 'Indirect Free Kick Cross'
+]
+
+# Code réservé aux noms absents du vocabulaire
+UNKNOWN_CODE = len(EVENT_NAMES)
+
+# Catégories d'événements (un bit chacune)
+LEGACY_SHOT = 1
+PASS = 2
+SAVE = 4
+ACTIVITY = 8
+GOAL = 16
+SHOT_ATTEMPT = 32
+
+CATEGORY_MEMBERS = {
+    # Tirs des statistiques de match historiques (parité avec test.py) : 'Direct Free Kick Cross' y
+    # figure, coups francs directs et penalties n'y sont pas. À ne pas utiliser pour les modèles.
+    LEGACY_SHOT: {"Shot", "Direct Free Kick Cross", "Header Shot"},
+    PASS: {
+        "Pass", "Cross", "Corner Pass", "Clearance", "Direct Free Kick Pass", "Goal Kick",
+        "Goalkeeper Kick", "Indirect Free Kick Pass"
+    },
+    SAVE: {"Goalkeeper Save", "Goalkeeper Save Catch"},
+    ACTIVITY: {
+        'Pass', 'Touch', 'Tackle', 'Block', 'Dribble', 'Throw In', 'Header', 'Clearance', 'Cross',
+        'Goal Kick', 'Goalkeeper Pick Up', 'Goalkeeper Kick', 'Shot',
+        'Goalkeeper Save', 'Corner Pass', 'Goal', 'Goalkeeper Throw', 'Direct Free Kick Pass',
+        'Goalkeeper Save Catch', 'Corner Cross', 'Header Shot',
+        'Goalkeeper Catch', 'Goalkeeper Punch', 'Direct Free Kick Shot', 'Penalty Shot'
+    },
+    GOAL: {"Goal"},
+    # Tentatives de tir (modèles xG, xT, possessions)
+    SHOT_ATTEMPT: {"Shot", "Header Shot", "Direct Free Kick Shot", "Penalty Shot"},
+}
+
+
+def _key(name: str) -> str:
+    """Forme de comparaison d'un nom : casse et espaces ignorés."""
+    return " ".join(str(name).split()).casefold()
+
+
+class EventVocabulary:
+    """Codes entiers des noms d'événements et table de catégories indexée par code.
+
+    Les noms sont reconnus sans tenir compte de la casse ni des espaces ; les noms mal
+    orthographiés et inconnus sont signalés une seule fois, au moment de l'encodage.
+    """
+
+    def __init__(self, names: List[str] = EVENT_NAMES, categories: Dict[int, Set[str]] = CATEGORY_MEMBERS):
+        self.names = list(names)
+        self.codes = {name: code for code, name in enumerate(self.names)}
+        self._keys = {_key(name): code for code, name in enumerate(self.names)}
+        self.unknown_code = len(self.names)
+        self.reported: Dict[str, Optional[str]] = {}
+
+        # Dernière case : événements inconnus, sans catégorie
+        self.categories = np.zeros(len(self.names) + 1, dtype=np.uint8)
+        for bit, members in categories.items():
+            self.categories[[self.code(name) for name in members]] |= bit
+
+    def code(self, name: str) -> int:
+        """Code d'un nom d'événement (casse et espaces tolérés), `unknown_code` s'il est inconnu."""
+        code = self.codes.get(name)
+        if code is None:
+            code = self._keys.get(_key(name), self.unknown_code)
+            self._report(name, code)
+        return code
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Orthographe du vocabulaire pour un nom d'événement (None s'il est inconnu)."""
+        code = self.code(name)
+        return self.names[code] if code < self.unknown_code else None
+
+    def _report(self, name: str, code: int):
+        if name in self.reported or pd.isna(name):
+            return
+        self.reported[name] = self.names[code] if code < self.unknown_code else None
+        if code < self.unknown_code:
+            print(f"Event name '{name}' should be spelled '{self.names[code]}'")
+        else:
+            print(f"Unknown event name: '{name}'")
+
+    def encode(self, names: Iterable[str]) -> np.ndarray:
+        """Codes (int8) d'une colonne de noms ; chaque nom distinct n'est résolu qu'une fois."""
+        inverse, uniques = pd.factorize(pd.Series(names, copy=False))
+        lookup = np.array([self.code(name) for name in uniques] + [self.unknown_code], dtype=np.int8)
+        return lookup[inverse]  # les valeurs manquantes (-1) tombent sur la dernière case
+
+    def mask(self, codes: np.ndarray, categories: int) -> np.ndarray:
+        """Vrai pour les codes appartenant à l'une des catégories demandées."""
+        return (self.categories[codes] & categories) != 0
+
+    def members(self, categories: int) -> Set[str]:
+        """Noms d'événements appartenant à l'une des catégories."""
+        return {name for code, name in enumerate(self.names) if self.categories[code] & categories}
+
+
+EVENTS = EventVocabulary()
+
+
+def event_codes(data: pd.DataFrame) -> np.ndarray:
+    """Codes d'événements d'un match : colonne `Event Code` si le chargeur l'a ajoutée, sinon encodés."""
+    if "Event Code" in data.columns:
+        return data["Event Code"].to_numpy()
+    return EVENTS.encode(data["Event Name"])
+
+
+def event_flag(data: pd.DataFrame, column: str) -> np.ndarray:
+    """Colonne booléenne des fichiers d'événements (`Possession Loss`, `Move Start`...) en tableau numpy.
+
+    Seules les valeurs vraies comptent, qu'elles soient lues depuis le CSV (objet), le stockage
+    Parquet (`boolean`) ou un ancien stockage texte ("True") : une valeur manquante, "False" ou une
+    colonne absente donnent faux.
+    """
+    if column not in data.columns:
+        return np.zeros(len(data), dtype=bool)
+    values = data[column]
+    if values.dtype == bool:
+        return values.to_numpy()
+    if isinstance(values.dtype, pd.BooleanDtype):
+        return values.fillna(False).to_numpy(dtype=bool)
+    return values.isin([True, "True"]).to_numpy()
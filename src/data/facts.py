@@ -0,0 +1,210 @@
+from typing import List, Optional
+from functools import partial
+import json
+import os
+import re
+import pandas as pd
+from src.data.loader import DataLoader
+from src.data.processor import DataProcessor
+from src.data.store import read_table, save_table
+from src.data.registry import get_registry, with_ids
+from src.data.ingest import SEASON_PROCESSES, Progress, season_map
+
+
+# Colonnes des fichiers d'événements nécessaires à la table de faits ('xG Score' est facultative)
+FACT_SOURCE_COLUMNS = [
+    'Match Name', 'Team A', 'Team B', 'Event Name', 'Player1 Team', 'Possession Loss', 'xG Score'
+]
+
+TEAM_FACT_COLUMNS = [
+    'File', 'Match Name', 'Team', 'Opponent', 'Home', 'Shots', 'Passes', 'Successful Passes',
+    'Pass Success', 'Saves', 'Fouls', 'Goals', 'xG'
+]
+
+
+def team_match_rows(data: pd.DataFrame, file_name: str, processor: Optional[DataProcessor] = None) -> pd.DataFrame:
+    """Lignes (match, équipe) de la table de faits pour un match déjà chargé."""
+    processor = processor or DataProcessor()
+    home_team, away_team = data['Team A'].iloc[0], data['Team B'].iloc[0]
+    stats = processor.get_team_stats(data, [home_team, away_team])
+    fouls = data[data['Event Name'] == 'Foul'].groupby('Player1 Team').size()
+    xg = data.groupby('Player1 Team')['xG Score'].sum() if 'xG Score' in data.columns else pd.Series(dtype=float)
+
+    rows = []
+    for team, opponent in ((home_team, away_team), (away_team, home_team)):
+        team_stats = stats[team]
+        rows.append({
+            'File': file_name,
+            'Match Name': data['Match Name'].iloc[0],
+            'Team': team,
+            'Opponent': opponent,
+            'Home': team == home_team,
+            'Shots': team_stats.shots,
+            'Passes': team_stats.passes,
+            'Successful Passes': team_stats.successful_passes,
+            'Pass Success': team_stats.successful_passes_rate,
+            'Saves': team_stats.saves,
+            'Fouls': int(fouls.get(team, 0)),
+            'Goals': team_stats.score,
+            'xG': float(xg.get(team, 0.0)),
+        })
+    return pd.DataFrame(rows, columns=TEAM_FACT_COLUMNS)
+
+
+def build_team_match_facts(loader: DataLoader, processes: Optional[int] = None,
+                           progress: Optional[Progress] = None) -> pd.DataFrame:
+    """Construit la table (match, équipe) de toute la saison, les matchs étant répartis entre processus."""
+    frames: List[pd.DataFrame] = loader.ingest_season(
+        team_match_rows, FACT_SOURCE_COLUMNS, processes=processes, progress=progress
+    )
+    if not frames:
+        return pd.DataFrame(columns=TEAM_FACT_COLUMNS)
+    return add_team_fact_ids(pd.concat(frames, ignore_index=True))
+
+
+def add_team_fact_ids(facts: pd.DataFrame) -> pd.DataFrame:
+    """Identifiants entiers (registre de la saison) des équipes et des matchs de la table de faits."""
+    facts = with_ids(facts, 'Team', 'team')
+    facts = with_ids(facts, 'Opponent', 'team', 'Opponent ID')
+    return with_ids(facts, 'Match Name', 'match')
+
+
+def team_facts_path(loader: DataLoader) -> str:
+    """Emplacement par défaut de la table de faits, à côté du manifeste."""
+    return os.path.join(os.path.dirname(loader.manifest.manifest_path), "team_match_facts.parquet")
+
+
+def load_team_match_facts(loader: DataLoader, path: Optional[str] = None,
+                          processes: Optional[int] = None, progress: Optional[Progress] = None) -> pd.DataFrame:
+    """Lit la table de faits persistée, ou la reconstruit si un fichier d'événements est plus récent."""
+    path = path or team_facts_path(loader)
+    facts = read_table(path)
+    if facts is not None:
+        built_at = os.path.getmtime(path if os.path.exists(path) else os.path.splitext(path)[0] + ".csv")
+        newest = max(
+            (os.path.getmtime(os.path.join(loader.events_directory, f)) for f in loader.load_match_files()),
+            default=0
+        )
+        if (built_at >= newest and len(facts) == 2 * len(loader.load_match_files()) and 'Team ID' in facts
+                and _registry_matches(path)):
+            return facts
+    facts = build_team_match_facts(loader, processes, progress)
+    save_facts(facts, path)
+    return facts
+
+
+def _registry_stamp_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".registry.json"
+
+
+def save_facts(facts: pd.DataFrame, path: str):
+    """Écrit une table de faits avec la version du registre qui a produit ses identifiants."""
+    save_table(facts, path)
+    with open(_registry_stamp_path(path), "w", encoding="utf-8") as f:
+        json.dump(get_registry().version(), f)
+
+
+def _registry_matches(path: str) -> bool:
+    """Vrai si les identifiants de la table persistée correspondent toujours au registre actuel."""
+    stamp_path = _registry_stamp_path(path)
+    if not os.path.exists(stamp_path):
+        return False
+    with open(stamp_path, encoding="utf-8") as f:
+        return get_registry().matches(json.load(f))
+
+
+# Colonnes lues dans les fichiers "- Players.csv"
+PLAYER_SOURCE_COLUMNS = ['Player Name', 'Team', 'Opposition', 'Result', 'Minutes Played', 'Goals', 'xGoals Shot']
+
+PLAYER_FACT_COLUMNS = [
+    'Match', 'Date', 'Home Team', 'Away Team', 'Home', 'Team', 'Opposition', 'Result',
+    'Player Name', 'Goals', 'xG', 'Minutes Played'
+]
+
+PLAYER_FACT_CATEGORIES = ['Match', 'Home Team', 'Away Team', 'Team', 'Opposition', 'Result', 'Player Name']
+
+PLAYERS_FILE_SUFFIX = "- Players.csv"
+
+
+def _player_match_rows(players_directory: str, file_name: str) -> pd.DataFrame:
+    """Lignes (match, joueur) d'un fichier "- Players.csv"."""
+    data = pd.read_csv(os.path.join(players_directory, file_name), usecols=PLAYER_SOURCE_COLUMNS)
+    match = file_name.replace(PLAYERS_FILE_SUFFIX, "")
+    teams = re.search(r"\d{2}\.\d{2}\.\d{2} (.*?) v (.*?) - Players\.csv", file_name)
+    home_team, away_team = teams.groups() if teams else (None, None)
+    return pd.DataFrame({
+        'Match': match,
+        'Date': pd.to_datetime(match[:8], format='%y.%m.%d', errors='coerce'),
+        'Home Team': home_team,
+        'Away Team': away_team,
+        'Home': data['Team'] == home_team,
+        'Team': data['Team'],
+        'Opposition': data['Opposition'],
+        'Result': data['Result'],
+        'Player Name': data['Player Name'],
+        'Goals': data['Goals'].fillna(0).astype('int16'),
+        'xG': data['xGoals Shot'].fillna(0.0),
+        'Minutes Played': data['Minutes Played'].fillna(0).astype('int16'),
+    }, columns=PLAYER_FACT_COLUMNS)
+
+
+def _player_files(players_directory: str) -> List[str]:
+    return sorted(f for f in os.listdir(players_directory) if f.endswith(PLAYERS_FILE_SUFFIX))
+
+
+def build_player_match_facts(players_directory: str, processes: Optional[int] = None,
+                             progress: Optional[Progress] = None) -> pd.DataFrame:
+    """Concatène tous les fichiers joueurs de la saison en une table (match, joueur) catégorielle.
+
+    Les fichiers sont lus en parallèle ; seules les colonnes utiles reviennent au processus principal.
+    """
+    frames = season_map(partial(_player_match_rows, players_directory), _player_files(players_directory),
+                        processes, progress=progress)
+    if not frames:
+        return pd.DataFrame(columns=PLAYER_FACT_COLUMNS)
+    facts = pd.concat(frames, ignore_index=True)
+    facts = facts.astype({column: 'category' for column in PLAYER_FACT_CATEGORIES})
+    return add_player_fact_ids(facts)
+
+
+def add_player_fact_ids(facts: pd.DataFrame) -> pd.DataFrame:
+    """Identifiants entiers (registre de la saison) des joueurs, équipes et matchs."""
+    facts = with_ids(facts, 'Player Name', 'player')
+    facts = with_ids(facts, 'Team', 'team')
+    facts = with_ids(facts, 'Opposition', 'team', 'Opposition ID')
+    return with_ids(facts, 'Match', 'match')
+
+
+def player_facts_path(players_directory: str) -> str:
+    """Emplacement par défaut de la table (match, joueur), à côté du répertoire des joueurs."""
+    return os.path.join(os.path.dirname(os.path.normpath(players_directory)), "player_match_facts.parquet")
+
+
+def load_player_match_facts(players_directory: str, path: Optional[str] = None,
+                            processes: Optional[int] = None, progress: Optional[Progress] = None) -> pd.DataFrame:
+    """Lit la table (match, joueur) persistée, ou la reconstruit si un fichier joueurs a changé."""
+    path = path or player_facts_path(players_directory)
+    files = _player_files(players_directory)
+    facts = read_table(path)
+    if facts is not None:
+        built_at = os.path.getmtime(path if os.path.exists(path) else os.path.splitext(path)[0] + ".csv")
+        newest = max((os.path.getmtime(os.path.join(players_directory, f)) for f in files), default=0)
+        if (built_at >= newest and facts['Match'].nunique() == len(files) and 'Player ID' in facts
+                and _registry_matches(path)):
+            # La copie CSV de secours ne conserve ni les types catégoriels ni les dates
+            facts['Date'] = pd.to_datetime(facts['Date'])
+            return facts.astype({column: 'category' for column in PLAYER_FACT_CATEGORIES})
+    facts = build_player_match_facts(players_directory, processes, progress)
+    save_facts(facts, path)
+    return facts
+
+
+if __name__ == "__main__":
+    # Usage : python -m src.data.facts "../EPL 2011-12/Events" "../EPL 2011-12/Store"
+    import sys
+    events_directory = sys.argv[1] if len(sys.argv) > 1 else "../EPL 2011-12/Events"
+    store_directory = sys.argv[2] if len(sys.argv) > 2 else "../EPL 2011-12/Store"
+    season_loader = DataLoader(events_directory, None, store_directory)
+    facts = build_team_match_facts(season_loader, SEASON_PROCESSES)
+    save_facts(facts, team_facts_path(season_loader))
+    print(f"{len(facts)} lignes (match, équipe) écrites dans {team_facts_path(season_loader)}")
@@ -0,0 +1,10 @@
+import hashlib
+
+
+def file_hash(file_path: str) -> str:
+    """Empreinte MD5 du contenu d'un fichier (lu par blocs de 1 Mo)."""
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
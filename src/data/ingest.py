@@ -0,0 +1,52 @@
+from typing import Callable, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+
+
+# Signature du rappel de progression : (tâches terminées, nombre total de tâches)
+Progress = Callable[[int, int], None]
+
+# Processus d'une construction de saison : scripts hors ligne (`python -m ...`) et pages sur un
+# échec du cache disque ; les petites mises à jour (manifeste) restent dans le processus courant
+SEASON_PROCESSES = os.cpu_count() or 1
+
+
+def _run_chunk(function: Callable, chunk: Sequence) -> list:
+    """Tâche exécutée dans un processus : applique `function` à un lot de fichiers."""
+    return [function(task) for task in chunk]
+
+
+def season_map(function: Callable, tasks: Sequence, processes: Optional[int] = None,
+               chunk_size: Optional[int] = None, progress: Optional[Progress] = None) -> list:
+    """Applique `function` à chaque tâche (un fichier de la saison) dans un pool de processus.
+
+    Les tâches sont regroupées en lots (par défaut environ quatre lots par processus, pour
+    équilibrer la charge sans multiplier les échanges) ; les résultats sont rendus dans l'ordre
+    des tâches. `function` doit être picklable (fonction de module ou `functools.partial`).
+    Sans `processes`, avec un seul processus ou un seul lot, tout s'exécute dans le processus
+    courant ; les constructions de toute la saison passent `processes=SEASON_PROCESSES`.
+    """
+    tasks = list(tasks)
+    workers = processes or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(tasks) // (workers * 4)))
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    results: List[Optional[list]] = [None] * len(chunks)
+    done = 0
+    if workers == 1 or len(chunks) <= 1:
+        for i, chunk in enumerate(chunks):
+            results[i] = _run_chunk(function, chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, len(tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = {executor.submit(_run_chunk, function, chunk): i for i, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += len(chunks[i])
+                if progress is not None:
+                    progress(done, len(tasks))
+    return [result for chunk in results for result in chunk]
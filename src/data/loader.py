@@ -1,12 +1,34 @@
-from typing import List
+from typing import Callable, List, Optional
+from functools import partial
 import os
 import pandas as pd
-import cv2
+from src.data.store import SeasonStore, nullable_booleans
+from src.data.manifest import MatchManifest
+from src.data.assets import Asset, get_asset_cache
+from src.data.events import EVENTS
+from src.data.compact import CATEGORICAL_COLUMNS, SeasonDictionaries, memory_report
+from src.data.registry import with_ids
+from src.data.match_cache import MatchCache, get_match_cache
+from src.data.ingest import Progress, season_map
 
 class DataLoader:
-    def __init__(self, events_directory: str, logos_directory):
+    def __init__(self, events_directory: str, logos_directory, store_directory: Optional[str] = None,
+                 manifest_path: Optional[str] = None, compact: bool = False,
+                 cache: Optional[MatchCache] = None):
         self.events_directory = events_directory
         self.logos_directory = logos_directory
+        # Stockage Parquet optionnel ; les CSV restent la source de repli
+        self.store = SeasonStore(store_directory) if store_directory else None
+        if manifest_path is None:
+            manifest_path = os.path.join(store_directory or os.path.dirname(events_directory), "manifest.csv")
+        self.manifest = MatchManifest(manifest_path)
+        # Mode compact : colonnes texte en catégories communes à la saison, numériques réduits
+        self.compact = compact
+        self.dictionaries = SeasonDictionaries(
+            os.path.join(os.path.dirname(manifest_path), "dictionaries.json")
+        ) if compact else None
+        # Matchs déjà lus et objets calculés par match, partagés entre les exécutions Streamlit
+        self.cache = cache if cache is not None else get_match_cache()
 
     def load_match_files(self) -> List[str]:
         """Liste tous les fichiers CSV dans le répertoire des événements."""
@@ -16,29 +38,148 @@ class DataLoader:
         ])
     
     def load_logos(self, team_name):
-        """Charge le logo de l'équipe spécifiée."""
+        """Charge le logo de l'équipe spécifiée (image RGB décodée une seule fois par processus)."""
+        asset = self.load_logo_asset(team_name)
+        return asset.image if asset is not None else None
+
+    def load_logo_asset(self, team_name) -> Optional[Asset]:
+        """Logo de l'équipe avec ses encodages PNG et base64 mis en cache."""
         # Convert team_name to string to handle potential float inputs
         team_name_str = str(team_name)
-        
-        file_path = os.path.join(self.logos_directory, team_name_str + ".jpg")
-        
         try:
-            img = cv2.imread(file_path)
-            
-            if img is not None:
-                # Convertir BGR en RGB pour Streamlit
-                return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            else:
-                print(f"Logo not found for team: {team_name_str}")
-                return None
+            asset = get_asset_cache(self.logos_directory).get(team_name_str)
         except Exception as e:
             print(f"Error loading logo for {team_name_str}: {e}")
             return None
+        if asset is None:
+            print(f"Logo not found for team: {team_name_str}")
+        return asset
+
+    def load_match_data(self, file_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Charge les données d'un match spécifique (éventuellement limitées à quelques colonnes)."""
+        key = ("match", tuple(columns) if columns is not None else None, self.compact)
+        data = self.cache.get(self._match_path(file_name), key, lambda: self._parse_match(file_name, columns))
+        # Copie superficielle : l'appelant peut ajouter des colonnes sans toucher au cache
+        return data.copy(deep=False)
+
+    def load_match_object(self, file_name: str, name: str, build: Callable[[pd.DataFrame], object]):
+        """Objet dérivé d'un match (`build(données du match)`), calculé une fois tant que le fichier ne change pas."""
+        return self.cache.get(self._match_path(file_name), ("object", name, self.compact),
+                              lambda: build(self.load_match_data(file_name)))
+
+    def cache_stats(self):
+        """Compteurs du cache de matchs (succès, échecs, évictions, octets utilisés)."""
+        return self.cache.stats()
+
+    def _match_path(self, file_name: str) -> str:
+        return os.path.join(self.events_directory, file_name)
+
+    def _parse_match(self, file_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        data = self._read_match(file_name, columns)
+        if self.compact:
+            data = self.get_dictionaries().apply(data)
+        # Codes entiers des événements, pour les filtres par catégorie
+        if "Event Name" in data.columns:
+            data["Event Code"] = EVENTS.encode(data["Event Name"])
+        return data
+
+    def _read_match(self, file_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lit un match tel qu'il est stocké (Parquet si à jour, sinon CSV).
+
+        Les colonnes demandées absentes du fichier (par ex. 'xG Score') sont ignorées.
+        """
+        file_path = self._match_path(file_name)
+        if self.store is not None and self.store.has_match(file_name, file_path):
+            return self.store.read_match(file_name, columns)
+        usecols = None if columns is None else (lambda column: column in columns)
+        data = pd.read_csv(file_path, usecols=usecols)
+        if columns is not None:
+            data = data[[column for column in columns if column in data.columns]]
+        # Mêmes types que le stockage Parquet (booléens avec valeurs manquantes en `boolean`)
+        return nullable_booleans(data)
+
+    def load_season_data(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Charge tous les matchs de la saison en un seul tableau."""
+        match_files = self.load_match_files()
+        if self.store is not None and all(
+            self.store.has_match(f, os.path.join(self.events_directory, f)) for f in match_files
+        ):
+            season = self.store.scan(columns, match_files)
+            return self.get_dictionaries().apply(season) if self.compact else season
+        frames = self.ingest_season(columns=columns, files=match_files)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+    def ingest_season(self, reduce: Optional[Callable[[pd.DataFrame, str], object]] = None,
+                      columns: Optional[List[str]] = None, files: Optional[List[str]] = None,
+                      processes: Optional[int] = None, chunk_size: Optional[int] = None,
+                      progress: Optional[Progress] = None) -> list:
+        """Lit tous les matchs (ou `files`) en parallèle, un lot de fichiers par tâche.
+
+        Chaque processus charge ses matchs et applique `reduce(données, nom du fichier)` ; seul
+        le résultat réduit revient au processus principal. Sans `reduce`, les tableaux des
+        matchs sont rendus tels quels. Les résultats suivent l'ordre des fichiers ;
+        `progress(terminés, total)` est appelé après chaque lot.
+        """
+        files = self.load_match_files() if files is None else files
+        store_directory = self.store.store_directory if self.store is not None else None
+        task = partial(_ingest_match, self.events_directory, store_directory, columns, reduce)
+        results = season_map(task, files, processes, chunk_size, progress)
+        if reduce is None and self.compact:
+            # Les dictionnaires de la saison ne sont étendus que par le processus principal
+            results = [self.get_dictionaries().apply(data) for data in results]
+        return results
 
-    def load_match_data(self, file_name: str) -> pd.DataFrame:
-        """Charge les données d'un match spécifique."""
-        file_path = os.path.join(self.events_directory, file_name)
-        return pd.read_csv(file_path)
+    def get_dictionaries(self) -> SeasonDictionaries:
+        """Dictionnaires catégoriels de la saison, tels qu'écrits par `build_store` (lecture seule)."""
+        if self.dictionaries is None:
+            self.dictionaries = SeasonDictionaries(self._dictionaries_path())
+        return self.dictionaries
+
+    def _dictionaries_path(self) -> str:
+        return os.path.join(os.path.dirname(self.manifest.manifest_path), "dictionaries.json")
+
+    def update_dictionaries(self, files: Optional[List[str]] = None):
+        """Construit les dictionnaires de la saison, ou les étend avec les valeurs de `files`."""
+        dictionaries = SeasonDictionaries(self._dictionaries_path())
+        columns = list(CATEGORICAL_COLUMNS)
+        if not dictionaries.categories:
+            files = self.load_match_files()
+        frames = [self._read_match(f, columns) for f in (files or [])]
+        if frames:
+            season = pd.concat(frames, ignore_index=True)
+            if dictionaries.categories:
+                dictionaries.extend(season)
+            else:
+                dictionaries.build(season)
+        self.dictionaries = dictionaries
+
+    def memory_report(self, file_name: Optional[str] = None) -> pd.DataFrame:
+        """Mémoire d'un match (ou de toute la saison) avant et après le mode compact."""
+        files = [file_name] if file_name else self.load_match_files()
+        frames = [self._read_match(f) for f in files]
+        raw = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        return memory_report(raw, self.get_dictionaries().apply(raw))
+
+    def build_store(self, force: bool = False) -> List[str]:
+        """Convertit les CSV d'événements vers le stockage Parquet (matchs nouveaux ou modifiés) et
+        met à jour les dictionnaires du mode compact avec ces matchs."""
+        converted = self.store.ingest(self.events_directory, force=force) if self.store is not None else []
+        self.update_dictionaries(converted)
+        return converted
+
+    def get_manifest(self) -> pd.DataFrame:
+        """Retourne le manifeste des matchs (fichier, date, équipes, score, journée), mis à jour si besoin."""
+        return self.manifest.refresh(self)
+
+    def get_matchdays(self) -> List[List[str]]:
+        """Retourne les fichiers de match regroupés par journée."""
+        self.get_manifest()
+        return self.manifest.matchdays()
+
+    def get_team_matches(self, team_name: str) -> pd.DataFrame:
+        """Retourne les lignes du manifeste correspondant aux matchs d'une équipe."""
+        self.get_manifest()
+        return self.manifest.matches_of_team(team_name)
 
     def get_teams(self, data: pd.DataFrame) -> List[str]:
         """Récupère la liste des équipes du match."""
@@ -51,7 +192,14 @@ class DataLoader:
         """Calcule l'angle de tir et le xG pour chaque événement."""
         df_shots = pd.read_csv("shots.csv")
         df_shots["TotalShots"] = 1
-        df_shots_aggregated_by_player = df_shots.groupby(["playerName", "playerTeam"]).agg({"xG Score": "sum", "Angle": "mean","TotalShots" :"sum"}).reset_index()
+        # Requête : identifiants lus sans enregistrer de nom
+        with_ids(df_shots, "playerName", "player", assign=False)
+        with_ids(df_shots, "playerTeam", "team", assign=False)
+        df_shots_aggregated_by_player = (
+            df_shots.groupby(["Player ID", "Team ID"], sort=False)
+            .agg({"playerName": "first", "playerTeam": "first", "xG Score": "sum", "Angle": "mean", "TotalShots": "sum"})
+            .reset_index()
+        )
         top_scorers = ["Robin VAN PERSIE", "Wayne ROONEY", "Sergio AGUERO", "Clint DEMPSEY", "Emmanuel ADEBAYOR", "Demba BA", "Yakubu AYEGBENI", "Grant HOLT", "Edin DZEKO", "Mario BALOTELLI"]
         df_shots_aggregated_by_player_shots = df_shots_aggregated_by_player[df_shots_aggregated_by_player["TotalShots"] >50]
         df_shots_aggregated_by_player_shots["color"] = df_shots_aggregated_by_player["playerName"].apply(
@@ -69,3 +217,15 @@ class DataLoader:
         df_shots_aggregated_by_bins.rename(columns={"xG Score": "Total_xG"}, inplace=True)
 
         return df_shots_aggregated_by_bins
+
+
+def _ingest_match(events_directory: str, store_directory: Optional[str], columns: Optional[List[str]],
+                  reduce: Optional[Callable[[pd.DataFrame, str], object]], file_name: str):
+    """Tâche d'ingestion exécutée dans un processus : charge un match et le réduit.
+
+    Chaque fichier n'est lu qu'une fois par ingestion : il est parsé directement, sans passer
+    par le cache de matchs (ni signature à calculer, ni tableau gardé en mémoire).
+    """
+    loader = DataLoader(events_directory, None, store_directory)
+    data = loader._parse_match(file_name, columns)
+    return reduce(data, file_name) if reduce is not None else data
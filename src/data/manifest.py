@@ -0,0 +1,140 @@
+from typing import List, Optional
+from datetime import datetime
+import os
+import pandas as pd
+
+
+# Colonnes lues dans les fichiers d'événements pour décrire un match
+MANIFEST_SOURCE_COLUMNS = ['Match Name', 'Team A', 'Team B', 'Event Name', 'Player1 Team']
+
+
+class MatchManifest:
+    """Index persistant des matchs de la saison (équipes, score, journée, date et taille du fichier)."""
+
+    columns = [
+        'File', 'Match Name', 'Date', 'Home', 'Away', 'Home Score', 'Away Score',
+        'Matchday', 'Mtime', 'Size'
+    ]
+
+    def __init__(self, manifest_path: str, total_matchdays: int = 38):
+        self.manifest_path = manifest_path
+        self.total_matchdays = total_matchdays
+        self.table: Optional[pd.DataFrame] = None
+
+    def load(self) -> pd.DataFrame:
+        """Charge le manifeste depuis le disque (table vide s'il n'existe pas encore)."""
+        if os.path.exists(self.manifest_path):
+            table = pd.read_csv(self.manifest_path, parse_dates=['Date'])
+        else:
+            table = pd.DataFrame(columns=self.columns)
+        self.table = table
+        return table
+
+    def save(self):
+        """Écrit le manifeste sur le disque."""
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.table.to_csv(self.manifest_path, index=False)
+
+    def refresh(self, loader) -> pd.DataFrame:
+        """Met à jour le manifeste : seuls les fichiers nouveaux ou modifiés sont relus."""
+        table = self.table if self.table is not None else self.load()
+        known = {row['File']: row for row in table.to_dict('records')}
+
+        rows = {}
+        stale = []
+        for file_name in loader.load_match_files():
+            stat = os.stat(os.path.join(loader.events_directory, file_name))
+            row = known.get(file_name)
+            if row is not None and row['Mtime'] == stat.st_mtime and row['Size'] == stat.st_size:
+                rows[file_name] = row
+            else:
+                stale.append(file_name)
+
+        # Les matchs nouveaux ou modifiés sont relus en parallèle
+        if stale:
+            descriptions = loader.ingest_season(describe_match, MANIFEST_SOURCE_COLUMNS, stale)
+            for file_name, description in zip(stale, descriptions):
+                stat = os.stat(os.path.join(loader.events_directory, file_name))
+                rows[file_name] = dict(description, Mtime=stat.st_mtime, Size=stat.st_size)
+        changed = bool(stale)
+        rows = list(rows.values())
+
+        if changed or len(rows) != len(table) or list(table.columns) != self.columns:
+            table = pd.DataFrame(rows, columns=self.columns)
+            table['Date'] = pd.to_datetime(table['Date'])
+            table = table.sort_values(['Date', 'File']).reset_index(drop=True)
+            table['Matchday'] = assign_matchdays(table['Date'], self.total_matchdays)
+            self.table = table
+            self.save()
+        return self.table
+
+    def matchdays(self) -> List[List[str]]:
+        """Liste des fichiers de match par journée (toujours `total_matchdays` journées)."""
+        grouped = self.table.groupby('Matchday')['File'].apply(list)
+        return [grouped.get(day, []) for day in range(1, self.total_matchdays + 1)]
+
+    def matches_of_team(self, team: str) -> pd.DataFrame:
+        """Matchs (domicile et extérieur) d'une équipe, par ordre chronologique."""
+        return self.table[(self.table['Home'] == team) | (self.table['Away'] == team)]
+
+
+def describe_match(data: pd.DataFrame, file_name: str) -> dict:
+    """Ligne du manifeste d'un match, à partir de ses quelques colonnes utiles (sans Mtime/Size)."""
+    home_team, away_team = data['Team A'].iloc[0], data['Team B'].iloc[0]
+    goals = data[data['Event Name'] == 'Goal']['Player1 Team']
+    match_name = data['Match Name'].iloc[0]
+    return {
+        'File': file_name,
+        'Match Name': match_name,
+        'Date': extract_date(match_name),
+        'Home': home_team,
+        'Away': away_team,
+        'Home Score': int((goals == home_team).sum()),
+        'Away Score': int((goals == away_team).sum()),
+        'Matchday': 0,
+    }
+
+
+def extract_date(match_name: str) -> Optional[datetime]:
+    """Extrait la date d'un nom de match, par ex. '11.08.13 Blackburn Rovers v Wolverhampton Wanderers'."""
+    date_str = match_name.split(' ')[0]
+    try:
+        return datetime.strptime(date_str, '%y.%m.%d')
+    except ValueError:
+        return None
+
+
+def assign_matchdays(dates: pd.Series, total_matchdays: int = 38) -> List[int]:
+    """Regroupe des matchs triés par date en journées (fenêtre de 3 jours), numérotées à partir de 1."""
+    matchdays = []
+    current_matchday = []
+    reference_date = None
+
+    for position, match_date in enumerate(dates):
+        if pd.isna(match_date):
+            continue
+        if reference_date is None or (match_date - reference_date).days > 3:
+            # Nouvelle journée
+            if current_matchday:
+                matchdays.append(current_matchday)
+            current_matchday = [position]
+            reference_date = match_date
+        else:
+            current_matchday.append(position)
+
+    if current_matchday:
+        matchdays.append(current_matchday)
+
+    # S'il y a trop de journées, fusionner la plus petite avec la suivante
+    while len(matchdays) > total_matchdays:
+        smallest_idx = min(range(len(matchdays) - 1), key=lambda i: len(matchdays[i]))
+        matchdays[smallest_idx].extend(matchdays[smallest_idx + 1])
+        del matchdays[smallest_idx + 1]
+
+    numbers = [0] * len(dates)
+    for day, positions in enumerate(matchdays, 1):
+        for position in positions:
+            numbers[position] = day
+    return numbers
@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional
+import os
+import sys
+import threading
+import numpy as np
+import pandas as pd
+from src.data.hashing import file_hash
+
+
+# Budget par défaut : quelques dizaines de matchs complets
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class SourceSignature(NamedTuple):
+    """État du fichier source au moment du chargement (hash seulement avec `verify_hash`)."""
+    mtime_ns: int
+    size: int
+    hash: Optional[str]
+
+
+class _Entry(NamedTuple):
+    signature: SourceSignature
+    value: object
+    size: int
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+def estimate_size(value) -> int:
+    """Taille mémoire approximative (octets) d'une valeur mise en cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+class MatchCache:
+    """Cache LRU, borné en octets, des matchs chargés et des objets calculés par match.
+
+    Chaque entrée est liée à un fichier source et invalidée quand sa date de modification
+    (ns) ou sa taille change. Avec `verify_hash`, le contenu décide : le hash MD5 est calculé
+    au chargement, puis seulement si la date ou la taille a bougé (un fichier simplement
+    touché reste en cache). Les lectures et les hash se font hors du verrou, qui ne protège
+    que la table des entrées : les autres sessions Streamlit ne sont jamais bloquées par un
+    chargement.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, verify_hash: bool = False):
+        self.max_bytes = max_bytes
+        self.verify_hash = verify_hash
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _is_current(self, signature: SourceSignature, stat: os.stat_result, path: str) -> bool:
+        if signature.mtime_ns == stat.st_mtime_ns and signature.size == stat.st_size:
+            return True
+        return self.verify_hash and signature.hash is not None and signature.hash == file_hash(path)
+
+    def get(self, path: str, key: Hashable, load: Callable[[], object]):
+        """Valeur `key` du fichier `path`, calculée par `load()` si elle est absente ou périmée."""
+        path = os.path.abspath(path)
+        entry_key = (path, key)
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+
+        if entry is not None and self._is_current(entry.signature, stat, path):
+            with self._lock:
+                if self._entries.get(entry_key) is entry:
+                    # Fichier touché mais identique : la nouvelle date évite de le rehasher
+                    signature = entry.signature._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    self._entries[entry_key] = entry._replace(signature=signature)
+                    self._entries.move_to_end(entry_key)
+                self.hits += 1
+            return entry.value
+
+        with self._lock:
+            if entry is not None and self._entries.get(entry_key) is entry:
+                self._remove(entry_key)
+                self.invalidations += 1
+            self.misses += 1
+
+        # Signature prise avant la lecture : un fichier modifié pendant le chargement sera relu
+        signature = SourceSignature(stat.st_mtime_ns, stat.st_size, file_hash(path) if self.verify_hash else None)
+        value = load()
+        size = estimate_size(value)
+        with self._lock:
+            if entry_key in self._entries:
+                self._remove(entry_key)
+            if size <= self.max_bytes:
+                self._entries[entry_key] = _Entry(signature, value, size)
+                self.bytes += size
+                self._evict()
+        return value
+
+    def _remove(self, entry_key):
+        self.bytes -= self._entries.pop(entry_key).size
+
+    def _evict(self):
+        """Retire les entrées les moins récemment utilisées jusqu'à respecter le budget."""
+        while self.bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None):
+        """Vide le cache, ou seulement les entrées d'un fichier."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self.bytes = 0
+                return
+            path = os.path.abspath(path)
+            for entry_key in [k for k in self._entries if k[0] == path]:
+                self._remove(entry_key)
+
+    def resize(self, max_bytes: int):
+        """Change le budget (les entrées en trop sont évincées)."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, self.invalidations,
+                              len(self._entries), self.bytes, self.max_bytes)
+
+
+_cache: Optional[MatchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_match_cache(max_bytes: Optional[int] = None) -> MatchCache:
+    """Cache partagé par tout le processus ; `max_bytes` ajuste son budget."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MatchCache(max_bytes or DEFAULT_MAX_BYTES)
+        elif max_bytes is not None and max_bytes != _cache.max_bytes:
+            _cache.resize(max_bytes)
+        return _cache
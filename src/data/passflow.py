@@ -0,0 +1,88 @@
+from typing import List, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, PASS
+from src.data.xthreat import XT_SOURCE_COLUMNS, ExpectedThreat
+
+
+# Colonnes des fichiers d'événements nécessaires aux flux (mêmes besoins que le modèle xT)
+PASS_FLOW_SOURCE_COLUMNS = XT_SOURCE_COLUMNS
+
+
+class PassFlows(NamedTuple):
+    """Matrices origine-destination des passes réussies, une par (équipe, match)."""
+    index: pd.DataFrame   # Team, Match Name : une ligne par matrice
+    matrices: np.ndarray  # (lignes, zones, zones) : passes de la zone de départ vers la zone d'arrivée
+    length_bins: int
+    width_bins: int
+
+    def select(self, team: Optional[str] = None, matches: Optional[List[str]] = None) -> np.ndarray:
+        """Somme des matrices d'une équipe (toutes ou certaines rencontres) ; sans équipe : tout le monde."""
+        mask = np.ones(len(self.index), dtype=bool)
+        if team is not None:
+            mask &= (self.index['Team'] == team).to_numpy()
+        if matches is not None:
+            mask &= self.index['Match Name'].isin(matches).to_numpy()
+        zones = self.length_bins * self.width_bins
+        return self.matrices[mask].sum(axis=0) if mask.any() else np.zeros((zones, zones), dtype=np.int64)
+
+
+class PassFlowEngine:
+    """Découpe le terrain en zones et compte les passes réussies d'une zone vers une autre.
+
+    Les coordonnées sont celles de `ExpectedThreat.match_actions` (sens d'attaque de l'équipe
+    qui passe, deuxième mi-temps retournée) : les matrices de matchs différents s'additionnent
+    directement. L'arrivée d'une passe est la position de l'événement suivant (`end_x`/`end_y`).
+    """
+
+    def __init__(self, length_bins: int = 6, width_bins: int = 4):
+        self.length_bins = length_bins
+        self.width_bins = width_bins
+        self._grid = ExpectedThreat(length_bins, width_bins)
+
+    @property
+    def zones(self) -> int:
+        return self.length_bins * self.width_bins
+
+    def zone(self, x, y) -> np.ndarray:
+        """Zone (indice aplati, longueur puis largeur) de positions exprimées dans le sens d'attaque."""
+        return self._grid.cell(x, y)
+
+    def match_flows(self, data: pd.DataFrame, file_name: Optional[str] = None) -> PassFlows:
+        """Matrices des deux équipes d'un match (utilisable comme réduction de `ingest_season`)."""
+        if data.empty:
+            return self.combine([])
+        teams = [data['Team A'].iloc[0], data['Team B'].iloc[0]]
+        actions = self._grid.match_actions(data)
+        passes = actions[EVENTS.mask(EVENTS.encode(actions['Event Name']), PASS) & actions['Success'].to_numpy()]
+
+        # Une seule passe de bincount pour les deux équipes : (équipe, départ, arrivée) aplatis ;
+        # seules les passes d'une des deux équipes, de départ et d'arrivée finis, sont comptées
+        team = pd.Categorical(passes['Player1 Team'], categories=teams).codes.astype(np.intp)
+        positions = passes[['X', 'Y', 'end_x', 'end_y']].to_numpy(dtype=float)
+        keep = (team >= 0) & np.isfinite(positions).all(axis=1)
+        start = self.zone(positions[keep, 0], positions[keep, 1])
+        end = self.zone(positions[keep, 2], positions[keep, 3])
+        zones = self.zones
+        matrices = np.bincount(
+            team[keep] * zones * zones + start * zones + end, minlength=2 * zones * zones
+        ).reshape(2, zones, zones)
+
+        match_name = data['Match Name'].iloc[0] if 'Match Name' in data.columns else file_name
+        index = pd.DataFrame({'Team': teams, 'Match Name': [match_name] * 2})
+        return PassFlows(index, matrices, self.length_bins, self.width_bins)
+
+    def combine(self, flows: List[PassFlows]) -> PassFlows:
+        """Empile les matrices de plusieurs matchs."""
+        zones = self.zones
+        if not flows:
+            return PassFlows(pd.DataFrame(columns=['Team', 'Match Name']), np.zeros((0, zones, zones), dtype=np.int64),
+                             self.length_bins, self.width_bins)
+        index = pd.concat([f.index for f in flows], ignore_index=True)
+        return PassFlows(index, np.concatenate([f.matrices for f in flows]), self.length_bins, self.width_bins)
+
+    def season(self, loader, processes: Optional[int] = None, progress=None) -> PassFlows:
+        """Matrices de toute la saison, calculées match par match en parallèle."""
+        flows = loader.ingest_season(self.match_flows, PASS_FLOW_SOURCE_COLUMNS, processes=processes,
+                                     progress=progress)
+        return self.combine(flows)
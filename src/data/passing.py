@@ -0,0 +1,120 @@
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, PASS, event_codes
+from src.data.timeline import MatchTimeline
+
+
+class TeamNetwork(NamedTuple):
+    """Réseau de passes d'une équipe sur une plage de minutes."""
+    team: str
+    players: List[str]
+    adjacency: np.ndarray     # adjacency[i, j] : passes réussies de players[i] vers players[j]
+    positions: pd.DataFrame   # Player, X, Y (moyenne des événements localisés, 2e mi-temps retournée), Touches, Passes
+    edges: pd.DataFrame       # Passer, Receiver, Passes (liens non nuls, du plus au moins fréquent)
+
+
+class _TeamEvents(NamedTuple):
+    players: List[str]
+    event_minutes: np.ndarray
+    event_players: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    pass_minutes: np.ndarray
+    passers: np.ndarray
+    receivers: np.ndarray
+
+
+class PassingNetwork:
+    """Passes passeur → receveur d'un match, prêtes à être agrégées sur n'importe quelle plage de minutes.
+
+    Le receveur d'une passe est l'auteur de l'événement suivant sur la timeline (même logique
+    que `end_x`/`end_y` de `MatchTimeline`), s'il est de la même équipe et différent du passeur.
+    Tout est préparé à la construction ; une requête ne fait que deux recherches dichotomiques
+    et quelques `np.bincount`.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        timeline = MatchTimeline(data)
+        frame = timeline.frame
+        minutes = timeline.clock / 60
+        team = frame['Player1 Team'].to_numpy()
+        player = frame['Player1 Name'].to_numpy()
+        next_team = np.append(team[1:], None)
+        next_player = np.append(player[1:], None)
+        passes = (EVENTS.mask(event_codes(frame), PASS) & (next_team == team)
+                  & pd.notna(next_player) & (next_player != player))
+
+        # Même repère que l'affichage : la deuxième mi-temps est retournée
+        flip = np.where(frame['Half'].to_numpy() == 1, -1.0, 1.0)
+        x = frame['X'].to_numpy(dtype=float) * flip
+        y = frame['Y'].to_numpy(dtype=float) * flip
+
+        self.teams: List[str] = [frame['Team A'].iloc[0], frame['Team B'].iloc[0]] if len(frame) else []
+        self._teams: Dict[str, _TeamEvents] = {}
+        for name in self.teams:
+            rows = np.flatnonzero((team == name) & pd.notna(player))
+            codes, players = pd.factorize(player[rows])
+            index = pd.Index(players)
+            team_passes = np.flatnonzero(passes & (team == name))
+            self._teams[name] = _TeamEvents(
+                players=[str(p) for p in players],
+                event_minutes=minutes[rows],
+                event_players=codes,
+                x=x[rows],
+                y=y[rows],
+                pass_minutes=minutes[team_passes],
+                passers=index.get_indexer(player[team_passes]),
+                receivers=index.get_indexer(next_player[team_passes]),
+            )
+
+    @staticmethod
+    def _slice(minutes: np.ndarray, start: float, end: float):
+        return np.searchsorted(minutes, start, side='left'), np.searchsorted(minutes, end, side='right')
+
+    def team(self, team: str, start: float = 0, end: Optional[float] = None) -> TeamNetwork:
+        """Réseau d'une équipe entre les minutes `start` et `end` (incluses)."""
+        events = self._teams.get(team)
+        if events is None:
+            return TeamNetwork(team, [], np.zeros((0, 0), dtype=np.int64),
+                               pd.DataFrame(columns=['Player', 'X', 'Y', 'Touches', 'Passes']),
+                               pd.DataFrame(columns=['Passer', 'Receiver', 'Passes']))
+        end = np.inf if end is None else end
+        count = len(events.players)
+
+        # Les minutes sont triées : une plage est une tranche
+        lo, hi = self._slice(events.pass_minutes, start, end)
+        adjacency = np.bincount(
+            events.passers[lo:hi] * count + events.receivers[lo:hi], minlength=count * count
+        ).reshape(count, count)
+
+        lo, hi = self._slice(events.event_minutes, start, end)
+        players = events.event_players[lo:hi]
+        touches = np.bincount(players, minlength=count)
+        # Position moyenne sur les seuls événements localisés (X et Y finis), avec leur propre compte
+        x, y = events.x[lo:hi], events.y[lo:hi]
+        located = np.isfinite(x) & np.isfinite(y)
+        located_touches = np.bincount(players[located], minlength=count)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_x = np.bincount(players[located], weights=x[located], minlength=count) / located_touches
+            mean_y = np.bincount(players[located], weights=y[located], minlength=count) / located_touches
+
+        positions = pd.DataFrame({
+            'Player': events.players,
+            'X': mean_x,
+            'Y': mean_y,
+            'Touches': touches,
+            'Passes': adjacency.sum(axis=1),
+        })
+        passer, receiver = np.nonzero(adjacency)
+        order = np.argsort(-adjacency[passer, receiver], kind='stable')
+        edges = pd.DataFrame({
+            'Passer': np.array(events.players, dtype=object)[passer[order]],
+            'Receiver': np.array(events.players, dtype=object)[receiver[order]],
+            'Passes': adjacency[passer[order], receiver[order]],
+        })
+        return TeamNetwork(team, list(events.players), adjacency, positions, edges)
+
+    def networks(self, start: float = 0, end: Optional[float] = None) -> List[TeamNetwork]:
+        """Réseaux des deux équipes sur la même plage de minutes."""
+        return [self.team(team, start, end) for team in self.teams]
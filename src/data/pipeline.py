@@ -0,0 +1,330 @@
+from typing import Dict, List, Optional, Set
+import os
+import sys
+import numpy as np
+import pandas as pd
+from src.data.registry import ID_COLUMNS, REGISTRY_FILE, get_registry, with_ids
+from src.data.ingest import SEASON_PROCESSES, season_map
+from src.data.xg import GOAL_X, GOAL_WIDTH
+
+
+# Colonnes des fichiers d'événements utilisées par les tables dérivées
+EVENT_SOURCE_COLUMNS = ['Match Name', 'Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y', 'Half', 'xG Score']
+COORDINATE_COLUMNS = ['X', 'Y', 'Half', 'Player1 Name', 'Player1 Team', 'Match Name']
+SHOT_XG_COLUMNS = ['xG Score', 'Angle', 'playerName', 'playerTeam']
+
+# Statistiques des fichiers joueurs : sommées sur la saison, ou moyennées par match joué
+SUM_ATTRIBUTES = [
+    'Goals', 'xGoals Shot', 'DP Passes Made', 'Cr Crosses Made',
+    'CA Regains', 'HP Regains', 'BMP+', 'On-pitch xG Generated'
+]
+MEAN_ATTRIBUTES = [
+    'Possessions', 'ST Involvement', 'BU Involvement', 'Ma Involvement',
+    'Player Points', 'Average X', 'Average Y'
+]
+PERFORMANCE_COLUMNS = [
+    'Goals', 'xGoals Shot', 'DP Passes Made', 'Cr Crosses Made', 'CA Regains', 'HP Regains', 'BMP+',
+    'Possessions', 'On-pitch xG Generated', 'ST Involvement', 'BU Involvement', 'Ma Involvement',
+    'Player Points', 'Average X', 'Average Y'
+]
+
+# Indice de performance défensive
+IPD_WEIGHTS = {'Tackle': 0.4, 'Block': 0.3, 'Clearance': 0.2, 'Foul': -0.1, 'Yellow Card': -0.2}
+
+# Les gardiens sont exclus des performances (position moyenne très reculée)
+GOALKEEPER_MAX_AVERAGE_X = -39
+GOALKEEPER_EXCEPTIONS = ['Paul ROBINSON']
+
+# Tables produites, et le type de fichiers source dont chacune dépend
+TARGETS = {
+    'Shots_cords.csv': {'events'},
+    'Touch_cords.csv': {'events'},
+    'shots.csv': {'events'},
+    'players_performance_not_scaled.csv': {'players'},
+    'players_performance.csv': {'players'},
+    'players.csv': {'events', 'players'},
+    'players_not_scaled.csv': {'events', 'players'},
+}
+
+# Colonnes de noms de chaque table produite, et le type d'identifiant qui leur correspond
+_PLAYER_TABLE_IDS = {'Player Name': 'player', 'Team': 'team'}
+ID_SOURCE_COLUMNS = {
+    'Shots_cords.csv': {'Player1 Name': 'player', 'Player1 Team': 'team', 'Match Name': 'match'},
+    'Touch_cords.csv': {'Player1 Name': 'player', 'Player1 Team': 'team', 'Match Name': 'match'},
+    'shots.csv': {'playerName': 'player', 'playerTeam': 'team'},
+    'players_performance_not_scaled.csv': _PLAYER_TABLE_IDS,
+    'players_performance.csv': _PLAYER_TABLE_IDS,
+    'players.csv': _PLAYER_TABLE_IDS,
+    'players_not_scaled.csv': _PLAYER_TABLE_IDS,
+}
+
+SOURCE_SUFFIXES = {'events': '- Events.csv', 'players': '- Players.csv'}
+
+
+def shot_angles(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Angle de tir (degrés) sous lequel le but x = +52 est vu depuis chaque position."""
+    distance = np.hypot(np.asarray(x, dtype=float) - GOAL_X, np.asarray(y, dtype=float))
+    with np.errstate(divide='ignore'):
+        angle = 2 * np.arctan((GOAL_WIDTH / 2) / distance)
+    return np.degrees(np.where(distance == 0, 0.0, angle))
+
+
+def extract_events(path: str) -> Dict[str, pd.DataFrame]:
+    """Tables partielles d'un fichier d'événements (comptages, tirs, touches, angles des tirs)."""
+    data = pd.read_csv(path, usecols=lambda c: c in EVENT_SOURCE_COLUMNS)
+    named = data.dropna(subset=['Player1 Name'])
+    counts = (
+        named.groupby(['Player1 Name', 'Event Name'], sort=False).size()
+        .rename('Count').reset_index().rename(columns={'Player1 Name': 'Player Name'})
+    )
+    shots = data.loc[data['Event Name'] == 'Shot', COORDINATE_COLUMNS].reset_index(drop=True)
+    touches = data.loc[data['Event Name'] == 'Touch', COORDINATE_COLUMNS].reset_index(drop=True)
+    with_xg = data[data['xG Score'] > 0]
+    xg_shots = pd.DataFrame({
+        'xG Score': with_xg['xG Score'].to_numpy(),
+        'Angle': shot_angles(with_xg['X'].to_numpy(), with_xg['Y'].to_numpy()),
+        'playerName': with_xg['Player1 Name'].to_numpy(),
+        'playerTeam': with_xg['Player1 Team'].to_numpy(),
+    }, columns=SHOT_XG_COLUMNS)
+    return {'counts': counts, 'shots': shots, 'touches': touches, 'xg_shots': xg_shots}
+
+
+def extract_players(path: str) -> Dict[str, pd.DataFrame]:
+    """Table partielle d'un fichier joueurs : une ligne par joueur du match."""
+    data = pd.read_csv(path)
+    rows = data.reindex(columns=['Player Name', 'Team'] + PERFORMANCE_COLUMNS + ['Score Opposition'])
+    rows[PERFORMANCE_COLUMNS + ['Score Opposition']] = rows[PERFORMANCE_COLUMNS + ['Score Opposition']].fillna(0)
+    return {'players': rows.dropna(subset=['Player Name']).reset_index(drop=True)}
+
+
+def _extract(task) -> Dict[str, pd.DataFrame]:
+    """Tâche exécutée dans un processus : extrait les tables partielles d'un fichier source."""
+    kind, path = task
+    return extract_events(path) if kind == 'events' else extract_players(path)
+
+
+def min_max_scale(frame: pd.DataFrame) -> pd.DataFrame:
+    """Mise à l'échelle [0, 1] colonne par colonne (une colonne constante vaut 0)."""
+    low = frame.min()
+    spread = (frame.max() - low).replace(0, 1)
+    return (frame - low) / spread
+
+
+def add_ipd(players: pd.DataFrame) -> pd.DataFrame:
+    """Ajoute la colonne IPD (indice de performance défensive)."""
+    players['IPD'] = sum(weight * players[column] for column, weight in IPD_WEIGHTS.items())
+    return players
+
+
+class BuildPipeline:
+    """Construit les tables dérivées de la saison à partir des répertoires Events et Players.
+
+    Chaque fichier source est réduit une seule fois à des tables partielles, mises en cache
+    avec la date et la taille du fichier : une reconstruction ne relit que les fichiers
+    nouveaux ou modifiés, puis ne réécrit que les tables qui dépendent de ce type de fichier.
+    """
+
+    def __init__(self, events_directory: str, players_directory: str, output_directory: str = ".",
+                 cache_directory: Optional[str] = None):
+        self.directories = {'events': events_directory, 'players': players_directory}
+        self.output_directory = output_directory
+        self.cache_directory = cache_directory or os.path.join(output_directory, ".build")
+        self.index_path = os.path.join(self.cache_directory, "sources.csv")
+        # Les identifiants entiers des tables produites viennent du registre rangé à côté d'elles
+        self.registry = get_registry(os.path.join(output_directory, REGISTRY_FILE))
+
+    def _partial_path(self, kind: str, file_name: str) -> str:
+        return os.path.join(self.cache_directory, kind, file_name + ".pkl")
+
+    def _sources(self) -> pd.DataFrame:
+        """Fichiers sources actuels avec leur date et leur taille."""
+        rows = []
+        for kind, directory in self.directories.items():
+            for file_name in sorted(os.listdir(directory)):
+                if file_name.endswith(SOURCE_SUFFIXES[kind]):
+                    stat = os.stat(os.path.join(directory, file_name))
+                    rows.append((kind, file_name, stat.st_mtime_ns, stat.st_size))
+        return pd.DataFrame(rows, columns=['Kind', 'File', 'Mtime', 'Size'])
+
+    def update_partials(self, force: bool = False, processes: Optional[int] = None) -> Set[str]:
+        """Réextrait les fichiers nouveaux ou modifiés ; renvoie les types de sources qui ont changé."""
+        sources = self._sources()
+        known = pd.read_csv(self.index_path) if os.path.exists(self.index_path) and not force else None
+        if known is not None:
+            merged = sources.merge(known, on=['Kind', 'File'], how='left', suffixes=('', ' Known'))
+            stale = ~((merged['Mtime'] == merged['Mtime Known']) & (merged['Size'] == merged['Size Known']))
+            removed = known.merge(sources[['Kind', 'File']], how='left', indicator=True)
+            removed = removed[removed['_merge'] == 'left_only']
+        else:
+            stale = pd.Series(True, index=sources.index)
+            removed = sources.iloc[:0]
+        # Une construction interrompue a pu laisser l'index à jour sans la table partielle
+        missing = [not os.path.exists(self._partial_path(kind, f)) for kind, f in zip(sources['Kind'], sources['File'])]
+
+        todo = sources[stale.to_numpy() | np.array(missing, dtype=bool)]
+        tasks = [(kind, os.path.join(self.directories[kind], f)) for kind, f in zip(todo['Kind'], todo['File'])]
+        partials = season_map(_extract, tasks, processes)
+        for kind, file_name, partial in zip(todo['Kind'], todo['File'], partials):
+            path = self._partial_path(kind, file_name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            pd.to_pickle(partial, path)
+        for kind, file_name in zip(removed['Kind'], removed['File']):
+            if os.path.exists(self._partial_path(kind, file_name)):
+                os.remove(self._partial_path(kind, file_name))
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+        sources.to_csv(self.index_path, index=False)
+        return set(todo['Kind']) | set(removed['Kind'])
+
+    def _partials(self, kind: str, table: str) -> List[pd.DataFrame]:
+        """Tables partielles d'un type de source, dans l'ordre des fichiers."""
+        files = sorted(f for f in os.listdir(self.directories[kind]) if f.endswith(SOURCE_SUFFIXES[kind]))
+        return [self._partial(kind, f)[table] for f in files]
+
+    def _partial(self, kind: str, file_name: str) -> Dict[str, pd.DataFrame]:
+        """Tables partielles d'un fichier source, réextraites si elles manquent (fichier ajouté depuis
+        la mise à jour ou construction interrompue)."""
+        path = self._partial_path(kind, file_name)
+        if os.path.exists(path):
+            return pd.read_pickle(path)
+        print(f"Table partielle absente, réextraction : {file_name}")
+        partial = _extract((kind, os.path.join(self.directories[kind], file_name)))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pd.to_pickle(partial, path)
+        return partial
+
+    def _player_names(self, player_ids) -> List[str]:
+        """Orthographe de référence (celle du registre) de chaque identifiant joueur."""
+        return [self.registry.name('player', i) for i in player_ids]
+
+    def event_counts(self) -> pd.DataFrame:
+        """Nombre d'événements de chaque type par joueur sur la saison (une ligne par identifiant joueur)."""
+        counts = pd.concat(self._partials('events', 'counts'), ignore_index=True)
+        counts['Player ID'] = self.registry.ids('player', counts['Player Name'])
+        table = counts.pivot_table(index='Player ID', columns='Event Name', values='Count',
+                                   aggfunc='sum', fill_value=0, sort=False)
+        # Ordre de première apparition dans la saison, comme le dictionnaire du notebook
+        table = table.reindex(index=pd.unique(counts['Player ID']), columns=pd.unique(counts['Event Name']))
+        table.columns.name = None
+        table.index.name = 'Player ID'
+        return table.astype(int)
+
+    def _player_rows(self) -> pd.DataFrame:
+        rows = pd.concat(self._partials('players', 'players'), ignore_index=True)
+        rows['Player ID'] = self.registry.ids('player', rows['Player Name'])
+        return rows
+
+    def performance(self) -> pd.DataFrame:
+        """Statistiques des joueurs de champ sur la saison (sommes et moyennes par match)."""
+        grouped = self._player_rows().groupby('Player ID', sort=False)
+        table = grouped[PERFORMANCE_COLUMNS].sum()
+        table[MEAN_ATTRIBUTES] = table[MEAN_ATTRIBUTES].div(grouped.size(), axis=0)
+        table.insert(0, 'Player Name', self._player_names(table.index))
+        table['Team'] = grouped['Team'].first()
+        table = table.reset_index()
+        outfield = (table['Average X'] >= GOALKEEPER_MAX_AVERAGE_X) & ~table['Player Name'].isin(GOALKEEPER_EXCEPTIONS)
+        return table[outfield].reset_index(drop=True)
+
+    def appearances(self) -> pd.DataFrame:
+        """Matchs joués, buts encaissés et dernière équipe de chaque joueur (index : identifiant joueur)."""
+        grouped = self._player_rows().groupby('Player ID', sort=False)
+        return pd.DataFrame({
+            'Received Goals': grouped['Score Opposition'].sum(),
+            'Games Played': grouped.size(),
+            'Team': grouped['Team'].last(),
+        })
+
+    def _merge_players(self, counts: pd.DataFrame, performance: pd.DataFrame) -> pd.DataFrame:
+        """Jointure externe des comptages et des performances sur l'identifiant joueur."""
+        merged = counts.reset_index().merge(performance.drop(columns='Player Name'), on='Player ID', how='outer')
+        merged.insert(0, 'Player Name', self._player_names(merged['Player ID']))
+        merged['Goalkeeper'] = merged['Goalkeeper'].fillna('Yes')
+        return merged
+
+    def players_tables(self, counts: pd.DataFrame, performance: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """players.csv (comptages normalisés) et players_not_scaled.csv (comptages bruts)."""
+        scaled_performance = performance.copy()
+        scaled_columns = [c for c in PERFORMANCE_COLUMNS if c not in ('Average X', 'Average Y')]
+        scaled_performance[scaled_columns] = min_max_scale(scaled_performance[scaled_columns])
+        scaled_performance['Goalkeeper'] = 'No'
+
+        scaled = add_ipd(self._merge_players(min_max_scale(counts), scaled_performance))
+
+        # Les comptages de cartons gardent le suffixe _x ; les colonnes finales viennent des cartons
+        not_scaled = counts.rename(columns={'Yellow Card': 'Yellow Card_x', 'Red Card': 'Red Card_x'})
+        event_columns = list(not_scaled.columns)
+        not_scaled = self._merge_players(not_scaled, performance.assign(Goalkeeper='No'))
+        by_id = not_scaled['Player ID']
+        not_scaled['IPD'] = by_id.map(scaled.set_index('Player ID')['IPD'])
+        not_scaled['Goals'] = not_scaled['Goals'].fillna(0).astype(int)
+        for card in ('Yellow Card', 'Red Card'):
+            not_scaled[card] = not_scaled.get(card + '_x', pd.Series(0, index=not_scaled.index)).fillna(0).astype(int)
+
+        appearances = self.appearances()
+        not_scaled['Received Goals'] = by_id.map(appearances['Received Goals']).fillna(0).astype(int)
+        not_scaled['Games Played'] = by_id.map(appearances['Games Played']).fillna(0).astype(int)
+        not_scaled['Team'] = by_id.map(appearances['Team']).fillna(not_scaled['Team'])
+        not_scaled['gk_coef'] = not_scaled['Received Goals'] / not_scaled['Games Played']
+        not_scaled = not_scaled.sort_values('Pass', ascending=False).drop_duplicates('Player ID')
+
+        last_columns = ['Yellow Card', 'Red Card', 'Received Goals', 'Games Played', 'gk_coef']
+        first_columns = event_columns + ['Player Name']
+        ordered = first_columns + [c for c in not_scaled.columns if c not in first_columns + last_columns] + last_columns
+        return {'players.csv': scaled, 'players_not_scaled.csv': not_scaled[ordered]}
+
+    def _with_ids(self, name: str, table: pd.DataFrame) -> pd.DataFrame:
+        """Ajoute les identifiants joueur, équipe et match aux colonnes de noms d'une table produite."""
+        for column, kind in ID_SOURCE_COLUMNS.get(name, {}).items():
+            table = with_ids(table, column, kind, registry=self.registry)
+        # Identifiants en dernières colonnes, après les colonnes historiques
+        id_columns = [c for c in ID_COLUMNS.values() if c in table.columns]
+        return table[[c for c in table.columns if c not in id_columns] + id_columns]
+
+    def build(self, force: bool = False, processes: Optional[int] = None) -> List[str]:
+        """Met à jour les tables partielles puis réécrit les tables dérivées concernées."""
+        changed = self.update_partials(force, processes)
+        targets = [
+            name for name, kinds in TARGETS.items()
+            if force or kinds & changed or not os.path.exists(os.path.join(self.output_directory, name))
+        ]
+        if not targets:
+            return []
+
+        tables: Dict[str, pd.DataFrame] = {}
+        if 'Shots_cords.csv' in targets:
+            tables['Shots_cords.csv'] = pd.concat(self._partials('events', 'shots'), ignore_index=True)
+        if 'Touch_cords.csv' in targets:
+            tables['Touch_cords.csv'] = pd.concat(self._partials('events', 'touches'), ignore_index=True)
+        if 'shots.csv' in targets:
+            tables['shots.csv'] = pd.concat(self._partials('events', 'xg_shots'), ignore_index=True)
+
+        performance = self.performance()
+        if 'players_performance_not_scaled.csv' in targets:
+            tables['players_performance_not_scaled.csv'] = performance
+        if 'players_performance.csv' in targets:
+            scaled = performance.copy()
+            scaled_columns = [c for c in PERFORMANCE_COLUMNS if c not in ('Average X', 'Average Y')]
+            scaled[scaled_columns] = min_max_scale(scaled[scaled_columns])
+            tables['players_performance.csv'] = scaled
+        if {'players.csv', 'players_not_scaled.csv'} & set(targets):
+            players = self.players_tables(self.event_counts(), performance)
+            tables.update({name: table for name, table in players.items() if name in targets})
+
+        os.makedirs(self.output_directory, exist_ok=True)
+        for name, table in tables.items():
+            table = self._with_ids(name, table)
+            # Les tables de performances gardent leur colonne d'index, comme celles des notebooks
+            keep_index = name.startswith('players_performance')
+            table.to_csv(os.path.join(self.output_directory, name), index=keep_index)
+        return list(tables)
+
+
+if __name__ == "__main__":
+    # Usage : python -m src.data.pipeline "../EPL 2011-12/Events" "../EPL 2011-12/Players" . [--force]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    events_directory = args[0] if len(args) > 0 else "../EPL 2011-12/Events"
+    players_directory = args[1] if len(args) > 1 else "../EPL 2011-12/Players"
+    output_directory = args[2] if len(args) > 2 else "."
+    pipeline = BuildPipeline(events_directory, players_directory, output_directory)
+    written = pipeline.build(force="--force" in sys.argv, processes=SEASON_PROCESSES)
+    print(f"{len(written)} table(s) reconstruite(s) : {', '.join(written) or 'aucune'}")
@@ -0,0 +1,175 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import os
+import threading
+import numpy as np
+import pandas as pd
+from src.data.registry import REGISTRY_FILE, get_registry, with_ids
+
+
+# Tables joueurs produites par les notebooks (chemins relatifs au répertoire de l'application)
+SCALED_FILE = "players.csv"
+PERFORMANCE_FILE = "players_performance.csv"
+NOT_SCALED_FILE = "players_not_scaled.csv"
+REPOSITORY_FILES = (SCALED_FILE, PERFORMANCE_FILE, NOT_SCALED_FILE)
+
+# Seules ces colonnes de players_performance.csv sont utilisées
+PERFORMANCE_COLUMNS = ["Player Name", "Team", "DP Passes Made"]
+
+CATEGORY_COLUMNS = ["Team", "Goalkeeper"]
+
+
+def repository_inputs(*args, **kwargs) -> List[str]:
+    """Fichiers dont dépendent les résultats tirés du dépôt (entrées du cache disque)."""
+    return list(REPOSITORY_FILES)
+
+
+def top_n_positions(values: np.ndarray, top_n: int, ascending: bool = False) -> np.ndarray:
+    """Positions des `top_n` meilleures valeurs de chaque colonne, par sélection partielle.
+
+    `values` est un vecteur ou une matrice (une colonne par métrique). Le résultat a `top_n`
+    lignes (moins si la table est plus courte) ; les ex aequo gardent l'ordre des lignes et
+    les valeurs manquantes passent en dernier, comme avec un tri stable.
+    """
+    values = np.asarray(values, dtype=float)
+    vector = values.ndim == 1
+    keys = values.reshape(len(values), -1) if vector else values
+    keys = keys if ascending else -keys
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    top_n = min(top_n, len(keys))
+    if top_n <= 0:
+        return np.empty((0,) if vector else (0, keys.shape[1]), dtype=np.intp)
+
+    # Seuil de chaque colonne (k-ième plus petite clé), en O(n) pour toutes les colonnes
+    thresholds = np.partition(keys, top_n - 1, axis=0)[top_n - 1]
+    positions = np.empty((top_n, keys.shape[1]), dtype=np.intp)
+    for column in range(keys.shape[1]):
+        candidates = np.flatnonzero(keys[:, column] <= thresholds[column])
+        order = np.lexsort((candidates, keys[candidates, column]))
+        positions[:, column] = candidates[order[:top_n]]
+    return positions[:, 0] if vector else positions
+
+
+def _compact(table: pd.DataFrame) -> pd.DataFrame:
+    """Réduit les types : catégories pour les colonnes répétées, float32 et entiers sur 32 bits.
+
+    Les entiers ne descendent pas sous int32 : des comptes en int8/int16 débordent
+    silencieusement dès qu'on les additionne.
+    """
+    table = table.drop(columns=[c for c in table.columns if c.startswith("Unnamed")])
+    for column in table.columns:
+        if column in CATEGORY_COLUMNS:
+            table[column] = table[column].astype("category")
+        elif pd.api.types.is_float_dtype(table[column]):
+            table[column] = table[column].astype(np.float32)
+        elif pd.api.types.is_integer_dtype(table[column]):
+            values = table[column]
+            info = np.iinfo(np.int32)
+            if values.empty or (info.min <= values.min() and values.max() <= info.max):
+                table[column] = values.astype(np.int32)
+    return table
+
+
+class PlayerRepository:
+    """Tables joueurs de la saison chargées une seule fois et indexées par joueur et par équipe."""
+
+    def __init__(self, directory: str = "."):
+        self.directory = directory
+        self.mtimes = self._mtimes()
+
+        self.scaled = _compact(pd.read_csv(self._path(SCALED_FILE)))
+        self.performance = _compact(pd.read_csv(self._path(PERFORMANCE_FILE), usecols=PERFORMANCE_COLUMNS))
+        self.not_scaled = _compact(pd.read_csv(self._path(NOT_SCALED_FILE)))
+
+        # Identifiants entiers des joueurs et des équipes, communs à toutes les tables (lecture seule :
+        # le registre voisin des tables n'est écrit que par le pipeline)
+        self.registry = get_registry(self._path(REGISTRY_FILE))
+        for table in (self.scaled, self.performance, self.not_scaled):
+            with_ids(table, "Player Name", "player", registry=self.registry, assign=False)
+            with_ids(table, "Team", "team", registry=self.registry, assign=False)
+
+        # Position de chaque joueur (par identifiant) dans chaque table
+        self.scaled_rows = self._row_index(self.scaled)
+        self.not_scaled_rows = self._row_index(self.not_scaled)
+
+        # Joueurs de champ par équipe (les gardiens font peu de passes décisives)
+        outfield = self.performance[self.performance["DP Passes Made"] <= 0.3]
+        self.outfield_by_team: Dict[str, List[str]] = {
+            str(team): names.unique().tolist()
+            for team, names in outfield.groupby("Team", observed=True)["Player Name"]
+        }
+        self.goalkeepers = self.scaled.loc[self.scaled["Goalkeeper"] == "Yes", "Player Name"].to_numpy()
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    def _mtimes(self) -> Tuple[float, ...]:
+        return tuple(
+            os.path.getmtime(self._path(f)) for f in REPOSITORY_FILES
+        )
+
+    def is_stale(self) -> bool:
+        """Vrai si l'un des fichiers a été réécrit depuis le chargement."""
+        return self._mtimes() != self.mtimes
+
+    @staticmethod
+    def _row_index(table: pd.DataFrame) -> Dict[int, int]:
+        return {int(player_id): position for position, player_id in enumerate(table["Player ID"])}
+
+    def player_id(self, player_name: str) -> Optional[int]:
+        """Identifiant d'un joueur (None s'il est inconnu)."""
+        return self.registry.lookup("player", player_name)
+
+    def player_names(self, team: str) -> List[str]:
+        """Joueurs de champ d'une équipe."""
+        return list(self.outfield_by_team.get(team, []))
+
+    def scaled_row(self, player_name: str) -> pd.DataFrame:
+        """Ligne normalisée d'un joueur (vide s'il est inconnu)."""
+        position = self.scaled_rows.get(self.player_id(player_name))
+        return self.scaled.iloc[[] if position is None else [position]]
+
+    def not_scaled_row(self, player_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Ligne non normalisée d'un joueur (vide s'il est inconnu)."""
+        position = self.not_scaled_rows.get(self.player_id(player_name))
+        rows = self.not_scaled.iloc[[] if position is None else [position]]
+        return rows if columns is None else rows.loc[:, columns]
+
+    def leaderboards(self, metrics: List[str], top_n: int, table: str = "not_scaled",
+                     team: Optional[str] = None, goalkeeper: Optional[bool] = None,
+                     players: Optional[Iterable[int]] = None) -> Dict[str, pd.DataFrame]:
+        """Classements des `top_n` joueurs pour plusieurs métriques, calculés en un seul passage.
+
+        Args:
+        - metrics: colonnes à classer (ordre décroissant)
+        - table: "not_scaled" (valeurs brutes) ou "scaled" (valeurs normalisées)
+        - team: ne garder que les joueurs de cette équipe
+        - goalkeeper: True pour les gardiens uniquement, False pour les joueurs de champ
+        - players: identifiants des joueurs à garder (par ex. ceux ayant assez de minutes jouées)
+        """
+        frame = self.scaled if table == "scaled" else self.not_scaled
+        mask = np.ones(len(frame), dtype=bool)
+        if team is not None:
+            mask &= (frame["Team ID"] == self.registry.lookup("team", team)).to_numpy()
+        if goalkeeper is not None:
+            mask &= (frame["Goalkeeper"] == ("Yes" if goalkeeper else "No")).to_numpy()
+        if players is not None:
+            mask &= np.isin(frame["Player ID"].to_numpy(), np.fromiter(players, dtype=np.int64))
+
+        rows = np.flatnonzero(mask)
+        positions = top_n_positions(frame[metrics].to_numpy(dtype=float)[rows], top_n)
+        return {metric: frame.iloc[rows[positions[:, i]]] for i, metric in enumerate(metrics)}
+
+
+_repositories: Dict[str, PlayerRepository] = {}
+_lock = threading.Lock()
+
+
+def get_player_repository(directory: str = ".") -> PlayerRepository:
+    """Dépôt partagé par tout le processus, rechargé seulement si un fichier a changé."""
+    key = os.path.abspath(directory)
+    with _lock:
+        repository = _repositories.get(key)
+        if repository is None or repository.is_stale():
+            repository = PlayerRepository(directory)
+            _repositories[key] = repository
+        return repository
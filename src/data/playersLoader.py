@@ -1,12 +1,33 @@
-from typing import List
+from typing import Callable, Dict, List, Optional
+from functools import partial
 import os
 import pandas as pd
 import cv2
 import re
+from src.data.facts import load_player_match_facts
+from src.data.player_repository import get_player_repository, repository_inputs, top_n_positions
+from src.data.registry import get_registry
+from src.data.disk_cache import disk_cached
+from src.data.ingest import Progress, season_map
+
+
+def _players_inputs(loader, *args, **kwargs) -> List[str]:
+    """Fichiers dont dépendent les statistiques tirées des fichiers joueurs."""
+    return [loader.players_directory]
+
+
+def _ingest_players_file(players_directory: str, columns: Optional[List[str]],
+                         reduce: Optional[Callable[[pd.DataFrame, str], object]], file_name: str):
+    """Tâche d'ingestion exécutée dans un processus : lit un fichier joueurs et le réduit."""
+    data = pd.read_csv(os.path.join(players_directory, file_name), usecols=columns)
+    return reduce(data, file_name) if reduce is not None else data
+
 
 class PlayerLoader:
-    def __init__(self, players_directory: str):
+    def __init__(self, players_directory: str, facts_path: Optional[str] = None):
         self.players_directory = players_directory
+        self.facts_path = facts_path
+        self._facts: Optional[pd.DataFrame] = None
 
     def load_match_files(self) -> List[str]:
         """Liste tous les fichiers CSV dans le répertoire des événements."""
@@ -20,36 +41,44 @@ class PlayerLoader:
         return pd.read_csv(file_path)
 
 
+    def ingest_season(self, reduce: Optional[Callable[[pd.DataFrame, str], object]] = None,
+                      columns: Optional[List[str]] = None, files: Optional[List[str]] = None,
+                      processes: Optional[int] = None, chunk_size: Optional[int] = None,
+                      progress: Optional[Progress] = None) -> list:
+        """Lit tous les fichiers joueurs (ou `files`) en parallèle, un lot de fichiers par tâche.
+
+        Même contrat que `DataLoader.ingest_season` : `reduce(données, nom du fichier)` s'exécute
+        dans les processus et les résultats suivent l'ordre des fichiers.
+        """
+        if files is None:
+            files = sorted(f for f in os.listdir(self.players_directory) if f.endswith('.csv'))
+        task = partial(_ingest_players_file, self.players_directory, columns, reduce)
+        return season_map(task, files, processes, chunk_size, progress)
+
+    def get_player_match_facts(self, processes: Optional[int] = None,
+                               progress: Optional[Progress] = None) -> pd.DataFrame:
+        """Table (match, joueur) de toute la saison, construite une fois (en parallèle) puis mise en cache sur disque."""
+        if self._facts is None:
+            self._facts = load_player_match_facts(self.players_directory, self.facts_path, processes, progress)
+        return self._facts
+
+    @staticmethod
+    def _id(kind: str, name: str) -> int:
+        """Identifiant d'un joueur ou d'une équipe (-1, qui ne correspond à rien, s'il est inconnu)."""
+        identifier = get_registry().lookup(kind, name)
+        return -1 if identifier is None else identifier
+
+    @disk_cached(_players_inputs)
     def get_top_scorers_yearly(self, top_n: int) -> dict:
         """Récupère la liste des meilleurs buteurs de l'année avec leurs xG."""
-
-        # Load match files
-        files = self.load_match_files()  # Assuming 'self' context for 'load_match_files'
-        
-        # Load player data for each match
-        matches = [self.load_player_data(file + "- Players.csv") for file in files]
-        
-        # Initialize a dictionary to store player names, goals, and xG counts
-        players = {}
-
-        # Iterate through each match to accumulate goals and xG per player
-        for match in matches:
-            for _, player in match.iterrows():  # Assuming match is a DataFrame
-                player_name = player["Player Name"]
-                goals = player["Goals"]
-                xg = player["xGoals Shot"]
-
-                if player_name in players:
-                    players[player_name]["goals"] += goals  # Increment goal count
-                    players[player_name]["xG"] += xg  # Increment xG count
-                else:
-                    players[player_name] = {"goals": goals, "xG": xg}  # Initialize player stats
-
-        # Sort players by goal count (highest first)
-        sorted_players = sorted(players.items(), key=lambda x: x[1]["goals"], reverse=True)
-        
-        # Return the top N players
-        return dict(sorted_players[:top_n])
+        facts = self.get_player_match_facts()
+        totals = facts.groupby('Player ID', sort=False).agg(
+            name=('Player Name', 'first'), Goals=('Goals', 'sum'), xG=('xG', 'sum'))
+        totals = totals.iloc[top_n_positions(totals['Goals'].to_numpy(), top_n)]
+        return {
+            str(player_name): {"goals": int(goals), "xG": float(xg)}
+            for player_name, goals, xg in zip(totals['name'], totals['Goals'], totals['xG'])
+        }
 
 
 
@@ -58,80 +87,50 @@ class PlayerLoader:
         return data[data["Team"] == team_name]["Player Name"].unique().tolist()
 
 
+    @disk_cached(_players_inputs)
     def get_stats_per_team(self, team: str) -> pd.DataFrame:
         """Récupère les statistiques d'une équipe spécifique, y compris les buts, le score xG et les minutes jouées."""
-        players = {}
-        wins = 0
-        draws = 0
-        looses = 0
-        a_domicile_wins = 0
-        a_domicile_draws = 0
-        a_domicile_looses = 0
-        total_xg = 0  # Variable to accumulate total xG
-        for match in self.load_match_files():
-            if team in match:
-                data = self.load_player_data(match + "- Players.csv")
-                team_data = data[data['Team'] == team]
-
-                matchi = re.search(r"\d{2}\.\d{2}\.\d{2} (.*?) v (.*?) - Players\.csv", match + "- Players.csv")
-                if matchi:
-                    home_team, away_team = matchi.groups()
-
-
-                # Increment a_domicile if the team is the home team
-
-                
-                # Count wins
-                if team_data.iloc[0]['Result'] == 'D':
-                    draws += 1
-                    if home_team == team:
-                        a_domicile_draws += 1
-                elif team_data.iloc[0]['Result'] == 'L':
-                    looses += 1
-                    if home_team == team:
-                        a_domicile_looses += 1
-                else :
-                    wins += 1
-
-                    if home_team == team:
-                        a_domicile_wins += 1
-                
-                # Iterate through the players' data
-                for _, player in team_data.iterrows():
-                    player_name = player['Player Name']
-                    goals = player['Goals']
-                    xg = player['xGoals Shot']  # Assuming 'xG' is a column in your dataset
-                    minutes = player['Minutes Played']
-                    
-                    # Update player stats: goals, xG, and minutes played
-                    if player_name in players:
-                        players[player_name]['Goals'] += goals
-                        players[player_name]['xG'] += xg
-                        players[player_name]['Minutes Played'] += minutes
-                    else:
-                        players[player_name] = {'Goals': goals, 'xG': xg, 'Minutes Played': minutes}
-                    
-                    total_xg += xg  # Accumulate total xG for the team
-
-        # Convert to DataFrame and include Minutes Played in the table
-        player_stats = pd.DataFrame([(player, stats['Goals'], stats['xG'], stats['Minutes Played']) 
-                                    for player, stats in players.items()],
-                                    columns=['Player', 'Goals', 'xG', 'Minutes Played'])
-
-        # Sort by goals
+        facts = self.get_player_match_facts()
+        team_data = facts[facts['Team ID'] == self._id('team', team)]
+
+        # Un résultat par match (le même pour tous les joueurs de l'équipe)
+        results = team_data.drop_duplicates('Match')
+        draws = int((results['Result'] == 'D').sum())
+        looses = int((results['Result'] == 'L').sum())
+        wins = len(results) - draws - looses
+        home_results = results.loc[results['Home'], 'Result']
+        a_domicile_draws = int((home_results == 'D').sum())
+        a_domicile_looses = int((home_results == 'L').sum())
+        a_domicile_wins = len(home_results) - a_domicile_draws - a_domicile_looses
+
+        player_stats = (
+            team_data.groupby('Player ID', sort=False)
+            .agg(Player=('Player Name', 'first'), Goals=('Goals', 'sum'), xG=('xG', 'sum'),
+                 **{'Minutes Played': ('Minutes Played', 'sum')})
+            .reset_index(drop=True)
+        )
+        player_stats['Player'] = player_stats['Player'].astype(str)
         player_stats = player_stats.sort_values(by='Goals', ascending=False)
-        
-        # Return both player stats and the total wins, total xG
+        total_xg = float(team_data['xG'].sum())
+
         return player_stats,total_xg, wins,draws,looses,a_domicile_wins,a_domicile_draws,a_domicile_looses
     
+    def get_leaderboards(self, metrics: List[str], top_n: int, table: str = "not_scaled",
+                         team: Optional[str] = None, goalkeeper: Optional[bool] = None,
+                         min_minutes: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """Top `top_n` joueurs pour chaque métrique, avec filtres sur l'équipe, le poste et les minutes jouées."""
+        players = None
+        if min_minutes is not None:
+            facts = self.get_player_match_facts()
+            minutes = facts.groupby('Player ID')['Minutes Played'].sum()
+            players = minutes.index[minutes >= min_minutes]
+        return get_player_repository().leaderboards(metrics, top_n, table, team, goalkeeper, players)
+
+    @disk_cached(repository_inputs)
     def get_top_performers(self,top_n: int):
-        players_not_scaled = pd.read_csv("players_not_scaled.csv")
-        players_scaled = pd.read_csv("players.csv")
-        top_scorers = players_not_scaled.sort_values(by='Goals', ascending=False).head(top_n)
-        top_passers = players_not_scaled.sort_values(by='Pass', ascending=False).head(top_n)
-        top_shooters = players_not_scaled.sort_values(by='Shot', ascending=False).head(top_n)
-        top_defensers = players_scaled.sort_values(by='IPD', ascending=False).head(top_n)
-        return top_scorers,top_passers,top_shooters,top_defensers
+        leaders = self.get_leaderboards(['Goals', 'Pass', 'Shot'], top_n)
+        top_defensers = self.get_leaderboards(['IPD'], top_n, table="scaled")['IPD']
+        return leaders['Goals'],leaders['Pass'],leaders['Shot'],top_defensers
 
 
     def evolutionary_stat(self, player_name, team_name):
@@ -145,34 +144,21 @@ class PlayerLoader:
         Returns:
         - DataFrame containing the player's stats over time
         """
-        # Load match files
-        files = self.load_match_files()
-        
-        # Initialize an empty list to accumulate the player's stats over time
-        player_stats = []
-        
-        # Iterate through each match to accumulate the player's stats
-        for match in files:
-            if team_name in match:
-                # Load player data for the current match
-                data = self.load_player_data(match + "- Players.csv")
-                
-                # Filter data to get the player's stats
-                player_data = data[data['Player Name'] == player_name]
-              
-                if not player_data.empty:
-                    goals = player_data['Goals'].values[0]
-                    xg = player_data['xGoals Shot'].values[0]
-                    minutes = player_data['Minutes Played'].values[0]
-                    
-                    # Append the player's stats for the match to the list
-                    player_stats.append({'Match': match, 'Goals': goals, 'xG': xg, 'Minutes Played': minutes})
-        
-        # Convert the list of stats into a DataFrame
-        player_stats_df = pd.DataFrame(player_stats)
-        
-        return player_stats_df
-
+        facts = self.get_player_match_facts()
+        team_id = self._id('team', team_name)
+        team_matches = (facts['Team ID'] == team_id) | (facts['Opposition ID'] == team_id)
+        player_data = facts[team_matches & (facts['Player ID'] == self._id('player', player_name))]
+
+        # Une ligne par match, dans l'ordre chronologique des fichiers
+        player_data = player_data.drop_duplicates('Match').sort_values('Match')
+        return pd.DataFrame({
+            'Match': player_data['Match'].astype(str).to_numpy(),
+            'Goals': player_data['Goals'].to_numpy(),
+            'xG': player_data['xG'].to_numpy(),
+            'Minutes Played': player_data['Minutes Played'].to_numpy(),
+        })
+
+    @disk_cached(_players_inputs)
     def evolution_by_month_match(self, player_name, team_name, aggregation="month"):
         # Retrieve the player's stats over time
         df = self.evolutionary_stat(player_name, team_name)
@@ -214,15 +200,12 @@ class PlayerLoader:
     
 
     def goalkeepers_names(self):
-        players = pd.read_csv("players.csv")
-        goalkeepers = players[players['Goalkeeper'] == 'Yes']
-        return goalkeepers['Player Name'].values
+        return get_player_repository().goalkeepers
 
 
 
     def goalkeeper_performance(self, gk_name):
-        players = pd.read_csv("players.csv")
-        gks = players[players['Player Name'] == gk_name]
+        gks = get_player_repository().scaled_row(gk_name)
 
         if gks.empty:
             return None  # No player found
@@ -0,0 +1,117 @@
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, PASS, SHOT_ATTEMPT, event_codes, event_flag
+from src.data.timeline import MatchTimeline
+from src.data.xthreat import PITCH_HALF_LENGTH, attack_directions
+
+
+# Colonnes des fichiers d'événements nécessaires au découpage
+POSSESSION_SOURCE_COLUMNS = [
+    'Match Name', 'Team A', 'Team B', 'Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y', 'Time',
+    'Half', 'Possession Loss', 'Possession Regain', 'Move Start', 'xG Score'
+]
+
+# Tiers du terrain, dans le sens d'attaque de l'équipe en possession
+ZONES = ['Defensive Third', 'Middle Third', 'Final Third']
+
+POSSESSION_COLUMNS = [
+    'Match Name', 'Possession', 'Team', 'Start', 'End', 'Duration', 'Events', 'Passes', 'Moves',
+    'Start Zone', 'End Zone', 'Ends In Shot', 'xG'
+]
+
+
+def assign_possessions(data: pd.DataFrame) -> pd.DataFrame:
+    """Événements du match triés sur l'horloge continue, avec leur numéro de possession.
+
+    Une possession commence au premier événement, à chaque changement d'équipe, à chaque
+    récupération (`Possession Regain`) et après chaque perte (`Possession Loss`). Les
+    événements sans équipe restent dans la possession en cours.
+    """
+    frame = MatchTimeline(data).frame
+    team = frame['Player1 Team'].ffill().bfill().to_numpy()
+    starts = np.ones(len(frame), dtype=bool)
+    if len(frame) > 1:
+        starts[1:] = (team[1:] != team[:-1]) | event_flag(frame, 'Possession Regain')[1:] | event_flag(frame, 'Possession Loss')[:-1]
+    frame['Possession'] = np.cumsum(starts) - 1
+    frame['Possession Team'] = team
+    return frame
+
+
+def _zones(x: np.ndarray) -> pd.Categorical:
+    """Tiers de chaque abscisse (manquant pour une abscisse non finie)."""
+    third = np.full(len(x), -1)
+    finite = np.isfinite(x)
+    third[finite] = np.clip(((x[finite] + PITCH_HALF_LENGTH) / (2 * PITCH_HALF_LENGTH) * 3).astype(int), 0, 2)
+    return pd.Categorical.from_codes(third, categories=ZONES)
+
+
+def _located(x: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """Abscisses de début et de fin de chaque segment : premier et dernier événement du segment
+    qui a des coordonnées (NaN si aucun n'en a)."""
+    located = np.flatnonzero(np.isfinite(x))
+    if not len(located):
+        return np.full(len(starts), np.nan), np.full(len(ends), np.nan)
+    first = located[np.minimum(np.searchsorted(located, starts, side='left'), len(located) - 1)]
+    last = located[np.maximum(np.searchsorted(located, ends, side='right') - 1, 0)]
+    start_x = np.where((first >= starts) & (first <= ends), x[first], np.nan)
+    end_x = np.where((last >= starts) & (last <= ends), x[last], np.nan)
+    return start_x, end_x
+
+
+def possession_table(data: pd.DataFrame, file_name: Optional[str] = None) -> pd.DataFrame:
+    """Une ligne par possession du match (utilisable comme réduction de `ingest_season`).
+
+    Les agrégats sont calculés par segments contigus (`np.add.reduceat`), sans regroupement.
+    Les zones de début et de fin sont celles du premier et du dernier événement localisé de la
+    possession ; elles restent manquantes si aucun événement n'a de coordonnées.
+    """
+    frame = assign_possessions(data)
+    if frame.empty:
+        return pd.DataFrame(columns=POSSESSION_COLUMNS)
+    codes = event_codes(frame)
+    shots = EVENTS.mask(codes, SHOT_ATTEMPT)
+    xg = frame['xG Score'].fillna(0).to_numpy(dtype=float) if 'xG Score' in frame.columns else np.zeros(len(frame))
+    shots |= xg > 0
+
+    possession = frame['Possession'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, possession[1:] != possession[:-1]])
+    ends = np.r_[starts[1:], len(frame)] - 1
+    clock = frame['Time'].to_numpy(dtype=float)
+    team = frame['Possession Team'].to_numpy()
+
+    # Abscisse dans le sens d'attaque de l'équipe en possession (deuxième mi-temps retournée)
+    sign = pd.Series(team).map(attack_directions(frame, shots)).fillna(1.0).to_numpy()
+    x = frame['X'].to_numpy(dtype=float) * np.where(frame['Half'].to_numpy() == 1, -sign, sign)
+    start_x, end_x = _located(x, starts, ends)
+
+    return pd.DataFrame({
+        'Match Name': frame['Match Name'].iloc[0] if 'Match Name' in frame.columns else file_name,
+        'Possession': possession[starts],
+        'Team': team[starts],
+        'Start': clock[starts],
+        'End': clock[ends],
+        'Duration': clock[ends] - clock[starts],
+        'Events': ends - starts + 1,
+        'Passes': np.add.reduceat(EVENTS.mask(codes, PASS).astype(np.int32), starts),
+        'Moves': np.add.reduceat(event_flag(frame, 'Move Start').astype(np.int32), starts),
+        'Start Zone': _zones(start_x),
+        'End Zone': _zones(end_x),
+        'Ends In Shot': np.add.reduceat(shots.astype(np.int32), starts) > 0,
+        'xG': np.add.reduceat(xg, starts),
+    }, columns=POSSESSION_COLUMNS)
+
+
+def season_possessions(loader, processes: Optional[int] = None, progress=None) -> pd.DataFrame:
+    """Possessions de toute la saison, découpées match par match en parallèle."""
+    frames: List[pd.DataFrame] = loader.ingest_season(
+        possession_table, POSSESSION_SOURCE_COLUMNS, processes=processes, progress=progress
+    )
+    if not frames:
+        return pd.DataFrame(columns=POSSESSION_COLUMNS)
+    season = pd.concat(frames, ignore_index=True)
+    for column in ('Match Name', 'Team'):
+        season[column] = season[column].astype('category')
+    season['Start Zone'] = pd.Categorical(season['Start Zone'], categories=ZONES)
+    season['End Zone'] = pd.Categorical(season['End Zone'], categories=ZONES)
+    return season
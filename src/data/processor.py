@@ -1,6 +1,21 @@
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
+from src.data.timeline import MatchTimeline
+from src.data.store import read_table
+from src.data.player_repository import get_player_repository
+from src.data.coordinates import get_coordinate_index
+from src.data.registry import get_registry
+from src.data.disk_cache import disk_cached
+from src.data.xthreat import ExpectedThreat
+from src.data.xg import XGModel, match_shots
+from src.data.possessions import assign_possessions, possession_table, season_possessions
+from src.data.passing import PassingNetwork, TeamNetwork
+from src.data.passflow import PassFlowEngine, PassFlows
+from src.data.loader import DataLoader
+from src.data.ingest import SEASON_PROCESSES, Progress
+from src.data.events import EVENTS, LEGACY_SHOT, PASS, SAVE, ACTIVITY, GOAL, event_codes, event_flag
 
 @dataclass
 class MatchStats:
@@ -34,26 +49,15 @@ class MatchStatsRanking:
     mj : int
 
 class DataProcessor:
-    def __init__(self):
-        self.shot_types = {
-            "Shot", "Direct Free Kick Cross", "Header shot"
-        }
-        self.pass_types = {
-            "Pass", "Cross", "Corner Pass", "Clearance",
-            "Direct Free Kick Pass", "Goal Kick",
-            "GoalKeeper kick", "Indirect Free Kick Pass"
-        }
-        self.saves_types = {
-            "Goalkeeper Save", "Goalkeeper Save Catch"
-        }
+    # Statistique d'équipe alimentée par chaque catégorie d'événements
+    stats_categories = (("shots", LEGACY_SHOT), ("passes", PASS), ("saves", SAVE), ("score", GOAL))
 
-        self.activity_types = {
-            'Pass', 'Touch', 'Tackle', 'Block', 'Dribble','Throw In', 'Header', 'Clearance', 'Cross',
-            'Goal Kick', 'Goalkeeper Pick Up', 'Goalkeeper Kick', 'Shot',
-            'Goalkeeper Save', 'Corner Pass', 'Goal', 'Goalkeeper Throw','Direct Free Kick Pass',
-            'Goalkeeper Save Catch', 'Corner Cross', 'Header Shot',
-            'Goalkeeper Catch', 'Goalkeeper Punch', 'Direct Free Kick Shot','Penalty Shot'
-        }
+    def __init__(self):
+        # Noms d'événements par catégorie, issus du vocabulaire central (src/data/events.py)
+        self.shot_types = EVENTS.members(LEGACY_SHOT)
+        self.pass_types = EVENTS.members(PASS)
+        self.saves_types = EVENTS.members(SAVE)
+        self.activity_types = EVENTS.members(ACTIVITY)
 
     def get_events_types(self, data_choice):
         if data_choice == "Shots":
@@ -63,147 +67,181 @@ class DataProcessor:
         if data_choice == "Activity map":
             return self.activity_types
 
+    def _category_mask(self, data: pd.DataFrame, categories: int, team: str) -> np.ndarray:
+        """Événements d'une équipe appartenant aux catégories demandées (recherche par code)."""
+        return EVENTS.mask(event_codes(data), categories) & (data["Player1 Team"] == team).to_numpy()
+
     def calculate_shots(self, data: pd.DataFrame, team: str) -> int:
         """Calcule le nombre de tirs pour une équipe."""
-        return len(data[
-            data["Event Name"].isin(self.shot_types) & 
-            (data["Player1 Team"] == team)
-        ])
+        return int(self._category_mask(data, LEGACY_SHOT, team).sum())
 
     def calculate_passes(self, data: pd.DataFrame, team: str) -> int:
         """Calcule le nombre total de passes pour une équipe."""
-        return len(data[
-            data["Event Name"].isin(self.pass_types) & 
-            (data["Player1 Team"] == team)
-        ])
+        return int(self._category_mask(data, PASS, team).sum())
     
     def calculate_saves(self, data: pd.DataFrame, team: str) -> int:
         """Calcule le nombre de tirs pour une équipe."""
-        return len(data[
-            data["Event Name"].isin(self.saves_types) & 
-            (data["Player1 Team"] == team)
-        ])
+        return int(self._category_mask(data, SAVE, team).sum())
 
     def calculate_possession_loss(self, data: pd.DataFrame, team: str) -> int:
         """Calcule le nombre de pertes de possession."""
-        return len(data[
-            data["Event Name"].isin(self.pass_types) & 
-            (data["Player1 Team"] == team) & 
-            data["Possession Loss"]
-        ])
+        loss = event_flag(data, "Possession Loss")
+        return int((self._category_mask(data, PASS, team) & loss).sum())
 
     def calculate_successful_passes(self, data: pd.DataFrame, team: str) -> int:
         """Calcule le nombre de passes réussies."""
-        return len(data[
-            data["Event Name"].isin(self.pass_types) & 
-            (data["Player1 Team"] == team) & 
-            (~data["Possession Loss"])
-        ])
+        loss = event_flag(data, "Possession Loss")
+        return int((self._category_mask(data, PASS, team) & ~loss).sum())
+
+    def _stats_category_codes(self) -> np.ndarray:
+        """Statistique d'équipe (ou None) alimentée par chaque code d'événement."""
+        stats = np.full(len(EVENTS.categories), None, dtype=object)
+        for category, bit in self.stats_categories:
+            stats[(EVENTS.categories & bit) != 0] = category
+        return stats
+
+    def count_team_events(self, data: pd.DataFrame, keys: Optional[List[str]] = None) -> pd.DataFrame:
+        """Compte en un seul regroupement les événements par (clés, équipe, catégorie, perte de balle)."""
+        keys = (keys or []) + ["Player1 Team"]
+        category = self._stats_category_codes()[event_codes(data)]
+        relevant = pd.notna(category)
+        grouped = data.loc[relevant, keys].assign(
+            Category=category[relevant],
+            Loss=event_flag(data, "Possession Loss")[relevant]
+        ).groupby(keys + ["Category", "Loss"], observed=True).size()
+        counts = grouped.unstack(["Category", "Loss"], fill_value=0)
+        # Colonnes attendues même si une catégorie est absente du match
+        columns = pd.MultiIndex.from_product([["shots", "passes", "saves", "score"], [False, True]],
+                                             names=["Category", "Loss"])
+        return counts.reindex(columns=columns, fill_value=0)
+
+    def _stats_from_counts(self, counts: pd.DataFrame, key) -> MatchStats:
+        row = counts.loc[key] if key in counts.index else None
+        if row is None:
+            return MatchStats(shots=0, passes=0, successful_passes=0, saves=0, score=0)
+        return MatchStats(
+            shots=int(row["shots"].sum()),
+            passes=int(row["passes"].sum()),
+            successful_passes=int(row[("passes", False)]),
+            saves=int(row["saves"].sum()),
+            score=int(row["score"].sum())
+        )
 
     def get_team_stats(self, data: pd.DataFrame, teams: List[str]) -> Dict[str, MatchStats]:
-        """Calcule toutes les statistiques pour chaque équipe."""
-        return {
-            team: MatchStats(
-                shots=self.calculate_shots(data, team),
-                passes=self.calculate_passes(data, team),
-                successful_passes=self.calculate_successful_passes(data, team),
-                saves=self.calculate_saves(data, team),
-                score = self.calculate_final_score(data, team)
-            ) for team in teams
-        }
+        """Calcule toutes les statistiques pour chaque équipe (un seul passage sur les événements)."""
+        counts = self.count_team_events(data)
+        return {team: self._stats_from_counts(counts, team) for team in teams}
+
+    def get_team_stats_batch(self, matches: List[pd.DataFrame]) -> List[Dict[str, MatchStats]]:
+        """Calcule les statistiques d'équipe de plusieurs matchs en un seul regroupement."""
+        if not matches:
+            return []
+        data = pd.concat(matches, keys=range(len(matches)), names=["Match", None]).reset_index(level="Match")
+        counts = self.count_team_events(data, keys=["Match"])
+        return [
+            {
+                team: self._stats_from_counts(counts, (i, team))
+                for team in (match["Team A"].iloc[0], match["Team B"].iloc[0])
+            }
+            for i, match in enumerate(matches)
+        ]
+
+    def get_team_match_facts(self, path: str, team: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Lit la table de faits (match, équipe) de la saison, éventuellement filtrée sur une équipe."""
+        facts = read_table(path)
+        if facts is None or team is None:
+            return facts
+        return facts[facts["Team"] == team].reset_index(drop=True)
+
+    @disk_cached(lambda processor, events_directory, *args, **kwargs: [events_directory])
+    def get_expected_threat(self, events_directory: str, store_directory: Optional[str] = None,
+                            processes: Optional[int] = None, progress: Optional[Progress] = None) -> ExpectedThreat:
+        """Surface Expected Threat (xT) de la saison, gardée en cache disque (prébuild : `python -m src.data.processor`)."""
+        return ExpectedThreat.from_season(DataLoader(events_directory, None, store_directory), processes, progress)
+
+    def get_xt_added(self, data: pd.DataFrame, model: ExpectedThreat) -> pd.DataFrame:
+        """Passes et conduites d'un match (dans le sens d'attaque) avec leur xT ajouté."""
+        return model.rate(data)
+
+    def get_player_xt(self, data: pd.DataFrame, model: ExpectedThreat) -> pd.DataFrame:
+        """xT ajouté par joueur sur un match, du plus au moins menaçant."""
+        actions = model.rate(data)
+        return (
+            actions.groupby(['Player1 Name', 'Player1 Team'], sort=False)
+            .agg(**{'xT Added': ('xT Added', 'sum'), 'Actions': ('xT Added', 'size')})
+            .reset_index()
+            .sort_values('xT Added', ascending=False, kind='stable')
+            .reset_index(drop=True)
+        )
 
-    def get_events_vector_by_time(self, data: pd.DataFrame, players: list[str], 
+    @disk_cached(lambda processor, events_directory, *args, **kwargs: [events_directory])
+    def get_xg_model(self, events_directory: str, store_directory: Optional[str] = None,
+                     processes: Optional[int] = None, progress: Optional[Progress] = None) -> XGModel:
+        """Modèle xG (géométrie et type de tir) ajusté sur les tirs de la saison, gardé en cache disque."""
+        return XGModel.from_season(DataLoader(events_directory, None, store_directory), processes, progress)
+
+    def score_shots(self, data: pd.DataFrame, model: XGModel) -> pd.DataFrame:
+        """Tirs d'un match avec la distance, l'angle et le xG recalculé (`xG Model`) à côté du xG fourni."""
+        shots = match_shots(data)
+        shots['xG Model'] = model.predict(shots)
+        return shots
+
+    def get_possessions(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Événements du match (ordre chronologique) avec leur numéro de possession."""
+        return assign_possessions(data)
+
+    def get_possession_table(self, loader: DataLoader, file_name: str) -> pd.DataFrame:
+        """Possessions d'un match (durée, passes, zones, tir, xG), calculées une fois par match chargé."""
+        return loader.load_match_object(file_name, "possessions", possession_table)
+
+    @disk_cached(lambda processor, events_directory, *args, **kwargs: [events_directory])
+    def get_season_possessions(self, events_directory: str, store_directory: Optional[str] = None,
+                               processes: Optional[int] = None, progress: Optional[Progress] = None) -> pd.DataFrame:
+        """Possessions de toute la saison, gardées en cache disque."""
+        return season_possessions(DataLoader(events_directory, None, store_directory), processes, progress)
+
+    def get_passing_network(self, loader: DataLoader, file_name: str, start: float = 0,
+                            end: Optional[float] = None) -> List[TeamNetwork]:
+        """Réseaux de passes des deux équipes entre deux minutes.
+
+        Les passes du match sont extraites une fois par match chargé ; chaque plage de minutes
+        n'est ensuite qu'une tranche et quelques `np.bincount`.
+        """
+        network = loader.load_match_object(file_name, "passing_network", PassingNetwork)
+        return network.networks(start, end)
+
+    def get_match_pass_flows(self, loader: DataLoader, file_name: str) -> PassFlows:
+        """Matrices origine-destination des passes des deux équipes d'un match (calculées une fois par match)."""
+        return loader.load_match_object(file_name, "pass_flows", PassFlowEngine().match_flows)
+
+    @disk_cached(lambda processor, events_directory, *args, **kwargs: [events_directory])
+    def get_season_pass_flows(self, events_directory: str, store_directory: Optional[str] = None,
+                              processes: Optional[int] = None, progress: Optional[Progress] = None) -> PassFlows:
+        """Matrices origine-destination de chaque (équipe, match) de la saison, gardées en cache disque."""
+        return PassFlowEngine().season(DataLoader(events_directory, None, store_directory), processes, progress)
+
+    def get_timeline(self, loader: DataLoader, file_name: str) -> MatchTimeline:
+        """Retourne la timeline du match, construite une fois par match chargé (cache du DataLoader)."""
+        return loader.load_match_object(file_name, "timeline", MatchTimeline)
+
+    def get_events_vector_by_time(self, loader: DataLoader, file_name: str, players: list[str],
                   event_types: set, minutes: int = 90, ) -> pd.DataFrame:
-        seconds = minutes * 60
-        
-        # Créer une copie pour ne pas modifier le DataFrame original
-        data_copy = data.copy()
-        
-        # Ajuster le temps pour que la 2ème mi-temps continue après la 1ère
-        # Trouver le temps maximum de la 1ère mi-temps
-        if 0 in data_copy["Half"].unique() and 1 in data_copy["Half"].unique():
-            max_time_first_half = data_copy[data_copy["Half"] == 0]["Time"].max()
-            
-            # Ajouter ce temps à toutes les valeurs de la 2ème mi-temps
-            data_copy.loc[data_copy["Half"] == 1, "Time"] = data_copy.loc[data_copy["Half"] == 1, "Time"] + max_time_first_half
-        
-        # Trier le DataFrame par temps ajusté
-        data_sorted = data_copy.sort_values("Time")
-        
-        # Ajouter un index qui nous servira à trouver l'événement suivant
-        data_sorted = data_sorted.reset_index(drop=True)
-        
-        # Construire le masque de filtrage
-        mask = (
-            (data_sorted["Event Name"].isin(event_types)) & 
-            (data_sorted["Player1 Name"].isin(players)) & 
-            (data_sorted["Time"] <= seconds)
-        )
-        
-        # Obtenir les indices des événements qui nous intéressent
-        filtered_indices = data_sorted[mask].index
-        
-        # Créer le DataFrame filtré
-        filtered_df = data_sorted.loc[filtered_indices].copy()
-        
-        # Pour chaque événement filtré, trouver les coordonnées du prochain événement
-        # dans le jeu de données complet
-        filtered_df["end_x"] = filtered_indices.map(
-            lambda idx: data_sorted.loc[idx + 1, "X"] if idx + 1 in data_sorted.index else data_sorted.loc[idx, "X"]
-        )
-        filtered_df["end_y"] = filtered_indices.map(
-            lambda idx: data_sorted.loc[idx + 1, "Y"] if idx + 1 in data_sorted.index else data_sorted.loc[idx, "Y"]
-        )
-        
-        return filtered_df
+        """Événements filtrés jusqu'à `minutes`, avec les coordonnées de l'événement suivant (end_x, end_y).
+
+        Prend le match par son chargeur et son nom de fichier (et non plus un DataFrame) : la
+        timeline est construite une fois par match. Pour un DataFrame déjà chargé,
+        `MatchTimeline(data).query(players, event_types, minutes)` donne le même résultat.
+        """
+        return self.get_timeline(loader, file_name).query(players, event_types, minutes)
     
-    def get_events_point_by_time(self, data: pd.DataFrame, players: list[str], 
+    def get_events_point_by_time(self, loader: DataLoader, file_name: str, players: list[str],
                       event_types: set, minutes: int = 90, ) -> pd.DataFrame:
-        
-        seconds = minutes * 60
-        
-        # Créer une copie pour ne pas modifier le DataFrame original
-        data_copy = data.copy()
-        
-        # Ajuster le temps pour que la 2ème mi-temps continue après la 1ère
-        # Trouver le temps maximum de la 1ère mi-temps
-        if 1 in data_copy["Half"].unique() and 2 in data_copy["Half"].unique():
-            max_time_first_half = data_copy[data_copy["Half"] == 1]["Time"].max()
-            
-            # Ajouter ce temps à toutes les valeurs de la 2ème mi-temps
-            data_copy.loc[data_copy["Half"] == 2, "Time"] = data_copy.loc[data_copy["Half"] == 2, "Time"] + max_time_first_half
-        
-        # Trier le DataFrame par temps ajusté
-        data_sorted = data_copy.sort_values("Time")
-        
-        # Ajouter un index qui nous servira à trouver l'événement suivant
-        data_sorted = data_sorted.reset_index(drop=True)
-        
-        # Filtrer les événements selon les critères
-        mask = (
-            (data_sorted["Event Name"].isin(event_types)) & 
-            (data_sorted["Player1 Name"].isin(players)) & 
-            (data_sorted["Time"] <= seconds)
-        )
-        
-        # Obtenir les indices des événements qui nous intéressent
-        filtered_indices = data_sorted[mask].index
-        
-        # Créer le DataFrame filtré
-        filtered_df = data_sorted.loc[filtered_indices].copy()
-        
-        return filtered_df
+        """Même sélection que `get_events_vector_by_time` (les cartes de points ignorent end_x/end_y)."""
+        return self.get_events_vector_by_time(loader, file_name, players, event_types, minutes)
 
-    def get_max_minute(self, data: pd.DataFrame) -> int:
-        # Calculer le temps total des deux mi-temps
-        # D'abord, trouver le temps maximum pour chaque mi-temps
-        max_time_half1 = data[data["Half"] == 0]["Time"].max() if 0 in data["Half"].values else 0
-        max_time_half2 = data[data["Half"] == 1]["Time"].max() if 1 in data["Half"].values else 0
-        
-        # Calculer le temps total en minutes
-        total_minutes = int((max_time_half1 + max_time_half2) / 60) + 1
-        
-        return total_minutes
+    def get_max_minute(self, loader: DataLoader, file_name: str) -> int:
+        # Durée totale des deux mi-temps, selon l'horloge de la timeline
+        return self.get_timeline(loader, file_name).max_minute
     
     def calculate_final_score(self, data: pd.DataFrame, team):
         return len(data[(data["Event Name"]=="Goal") & (data["Player1 Team"] == team)])
@@ -222,33 +260,24 @@ class DataProcessor:
 
 
     def get_goal_scorers(self, players: pd.DataFrame, match: pd.DataFrame, team: str) -> List[tuple]:
-        """Récupère les noms des joueurs ayant marqué un but et le nombre de buts."""
+        """Récupère les noms des joueurs ayant marqué un but et les minutes de leurs buts."""
+        registry = get_registry()
 
-        # Filter players who scored goals for the given team
-        scorers = players[
-            (players["Goals"] > 0) & 
-            (players["Team"] == team)
-        ][["Player Name"]].values.tolist()
-
-        returned_tuples = []
-
-        for scorer in scorers:
-            # Find the goal events for the scorer
-            goal_minutes = match[
-                (match["Player1 Name"] == scorer[0]) & 
-                (match["Event Name"] == "Goal")
-            ][["Time", "Half"]].values.tolist()
-
-            minutes = []
-            
-            for goal in goal_minutes:
-                # Adjust time based on half
-                goal_time = goal[0]/60 if goal[1] == 0 else goal[0]/60 + 45
-                minutes.append(goal_time)
-                
-            returned_tuples.append((scorer[0], minutes))
-
-        returned_tuples.sort(key=lambda x: x[1][0])
+        # Buteurs de l'équipe et buts du match, reliés par identifiant de joueur
+        scorers = players[(players["Goals"] > 0) & (players["Team"] == team)]
+        scorer_ids = registry.ids("player", scorers["Player Name"], assign=False)
+        goals = match[EVENTS.mask(event_codes(match), GOAL)]
+        goal_ids = registry.ids("player", goals["Player1 Name"], assign=False)
+
+        # Minute du but, décalée de 45 en seconde période
+        minutes = goals["Time"].to_numpy() / 60 + np.where(goals["Half"].to_numpy() == 0, 0, 45)
+        minutes_by_player = pd.Series(minutes).groupby(goal_ids).agg(list)
+
+        returned_tuples = [
+            (name, minutes_by_player.get(player_id, []))
+            for name, player_id in zip(scorers["Player Name"], scorer_ids.tolist())
+        ]
+        returned_tuples.sort(key=lambda x: x[1][0] if x[1] else float("inf"))
 
         return returned_tuples
 
@@ -276,46 +305,34 @@ class DataProcessor:
 
 
     def get_player_names(self,team):
-        players_df = pd.read_csv("players_performance.csv")
-
-
-        return players_df[(players_df["Team"] == team) & (players_df["DP Passes Made"] <= 0.3)]["Player Name"].unique().tolist()
+        return get_player_repository().player_names(team)
 
     def get_player_metrics(self,player_name):
-        players_df = pd.read_csv("players.csv")
-        return players_df[(players_df["Player Name"] == player_name)]
+        return get_player_repository().scaled_row(player_name)
 
 
     def get_shots_cords(self,player_name,by="match",match_name="") :
-        if by=="match" :
-            shots_cords = pd.read_csv("Shots_cords.csv")
-            match_name = match_name.replace(" - Events.csv", "")
-            print(match_name)
-            player_shots_cords = shots_cords[(shots_cords["Player1 Name"]==player_name) & (shots_cords["Match Name"]==match_name )].loc[:,["X","Y","Half"]]
-        else : 
-            shots_cords = pd.read_csv("Shots_cords.csv")
-            player_shots_cords = shots_cords[(shots_cords["Player1 Name"]==player_name)].loc[:,["X","Y","Half"]]
-        return player_shots_cords
+        return self._player_cords("Shots_cords.csv", player_name, by, match_name)
     
     def get_touch_cords(self,player_name,by="match",match_name="") :
+        return self._player_cords("Touch_cords.csv", player_name, by, match_name)
+
+    def _player_cords(self, path, player_name, by="match", match_name=""):
+        """Coordonnées (X, Y, Half) d'un joueur pour un match ou pour toute la saison."""
+        index = get_coordinate_index(path)
         if by=="match" :
-            touch_cords = pd.read_csv("Touch_cords.csv")
-            match_name = match_name.replace(" - Events.csv", "")
-            player_touch_cords = touch_cords[(touch_cords["Player1 Name"]==player_name) & (touch_cords["Match Name"]==match_name )].loc[:,["X","Y","Half"]]
-        else : 
-            touch_cords = pd.read_csv("Touch_cords.csv")
-            player_touch_cords = touch_cords[(touch_cords["Player1 Name"]==player_name)].loc[:,["X","Y","Half"]]
-        return player_touch_cords
+            return index.player_match(player_name, match_name.replace(" - Events.csv", ""))
+        return index.player(player_name)
     
     def get_stats_by_player(self,player_name):
-        players_df = pd.read_csv("players_not_scaled.csv")
         # retourner { goals, shots, passed, yellow cards, red cards, fouls}
-        player_stats = players_df[(players_df["Player Name"] == player_name)].loc[:,["Goals","Pass","Cross","Yellow Card","Red Card","Foul"]]
-        return player_stats
+        return get_player_repository().not_scaled_row(
+            player_name, ["Goals","Pass","Cross","Yellow Card","Red Card","Foul"]
+        )
 
 
     def get_top_gks(self, top_n: int = 10):
-        players_df = pd.read_csv("players_not_scaled.csv")
+        players_df = get_player_repository().not_scaled
         gks = players_df[players_df["Goalkeeper"] == "Yes"]
         gks = gks.sort_values(by=["gk_coef"], ascending=True)
         gks = gks[gks["Received Goals"] > 10]
@@ -328,17 +345,21 @@ class DataProcessor:
         return gks
 
     def get_cards(self):
-        players_df = pd.read_csv("players_not_scaled.csv")
+        players_df = get_player_repository().not_scaled
         # sum all the yellow cards and red cards
         yellow_cards = players_df["Yellow Card"].sum()
         red_cards = players_df["Red Card"].sum()
         return yellow_cards, red_cards
 
 
-
-
-
-
-    
-
-
+if __name__ == "__main__":
+    # Prébuild des modèles de saison dans le cache disque des pages (à lancer depuis le répertoire de l'application)
+    # Usage : python -m src.data.processor "../EPL 2011-12/Events" "../EPL 2011-12/Store"
+    import sys
+    events_directory = sys.argv[1] if len(sys.argv) > 1 else "../EPL 2011-12/Events"
+    store_directory = sys.argv[2] if len(sys.argv) > 2 else "../EPL 2011-12/Store"
+    season_processor = DataProcessor()
+    for build in (season_processor.get_expected_threat, season_processor.get_xg_model,
+                  season_processor.get_season_possessions, season_processor.get_season_pass_flows):
+        build(events_directory, store_directory, processes=SEASON_PROCESSES)
+        print(f"{build.__name__} : en cache")
@@ -0,0 +1,193 @@
+from typing import Dict, Iterable, List, Optional
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import threading
+import unicodedata
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou entre processus
+    fcntl = None
+
+
+# Nom du fichier de registre, placé à côté des tables qui portent ses identifiants ; construit à
+# l'exécution, il n'est pas versionné
+REGISTRY_FILE = "registry.json"
+
+# Registre par défaut : répertoire de l'application (tables dérivées players.csv, Shots_cords.csv, ...),
+# quel que soit le répertoire courant
+APP_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REGISTRY_PATH = os.path.join(APP_DIRECTORY, REGISTRY_FILE)
+
+KINDS = ("player", "team", "match")
+
+# Colonne d'identifiant ajoutée pour chaque type d'entité
+ID_COLUMNS = {"player": "Player ID", "team": "Team ID", "match": "Match ID"}
+
+
+def normalize_name(name) -> str:
+    """Forme de comparaison d'un nom : accents, casse et espaces ignorés.
+
+    'Wojciech SZCZĘSNY', 'Wojciech Szczesny' et ' wojciech  szczesny' donnent la même clé.
+    """
+    decomposed = unicodedata.normalize("NFKD", str(name))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.split()).casefold()
+
+
+class IdRegistry:
+    """Identifiants entiers stables des joueurs, équipes et matchs de la saison.
+
+    L'identifiant d'un nom est sa position dans la liste de son type ; les listes ne font
+    que grandir, un identifiant attribué ne change donc jamais. Deux orthographes d'un même
+    nom (casse, accents, espaces) reçoivent le même identifiant.
+
+    Seules les constructions (pipeline, tables de faits) enregistrent des noms. Les requêtes
+    (`assign=False`) n'écrivent jamais : un nom inconnu y reçoit un identifiant provisoire
+    négatif (-2, -3, ...), propre au processus, qui sert aux regroupements et aux jointures en
+    mémoire sans toucher au fichier.
+    """
+
+    def __init__(self, path: str = REGISTRY_PATH):
+        self.path = path
+        self.names: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self._keys: Dict[str, Dict[str, int]] = {kind: {} for kind in KINDS}
+        self._provisional: Dict[str, Dict[str, int]] = {kind: {} for kind in KINDS}
+        self._lock = threading.Lock()
+        self._reload()
+
+    def _add(self, kind: str, name: str) -> int:
+        key = normalize_name(name)
+        known = self._keys[kind].get(key)
+        if known is not None:
+            return known
+        self._keys[kind][key] = len(self.names[kind])
+        self.names[kind].append(str(name))
+        return len(self.names[kind]) - 1
+
+    def _reload(self):
+        """Relit le fichier pour reprendre les noms enregistrés entre-temps par un autre processus."""
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+            for kind in KINDS:
+                for name in stored.get(kind, []):
+                    self._add(kind, name)
+
+    @contextmanager
+    def _file_lock(self):
+        """Verrou exclusif entre processus sur le registre (fichier `.lock` voisin)."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def save(self):
+        """Écrit le registre (écriture atomique ; appelé sous le verrou de fichier)."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.names, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, kind: str, name) -> Optional[int]:
+        """Identifiant d'un nom déjà enregistré, ou provisoire (None sinon)."""
+        if name is None or pd.isna(name):
+            return None
+        key = normalize_name(name)
+        known = self._keys[kind].get(key)
+        return known if known is not None else self._provisional[kind].get(key)
+
+    def _provisional_id(self, kind: str, name) -> int:
+        key = normalize_name(name)
+        return self._provisional[kind].setdefault(key, -2 - len(self._provisional[kind]))
+
+    def ids(self, kind: str, names: Iterable, assign: bool = True) -> np.ndarray:
+        """Identifiants (int32) d'une colonne de noms.
+
+        Les valeurs manquantes reçoivent -1. Chaque nom distinct n'est résolu qu'une fois. Avec
+        `assign`, les nouveaux noms sont enregistrés sous le verrou de fichier, après relecture
+        du registre : deux processus qui enregistrent des noms en même temps ne s'écrasent pas.
+        Sans `assign` (requêtes), rien n'est écrit et les nouveaux noms reçoivent un identifiant
+        provisoire.
+        """
+        inverse, uniques = pd.factorize(pd.Series(names, copy=False))
+        with self._lock:
+            if not assign:
+                for name in uniques:
+                    if self._keys[kind].get(normalize_name(name)) is None:
+                        self._provisional_id(kind, name)
+            elif any(self._keys[kind].get(normalize_name(name)) is None for name in uniques):
+                with self._file_lock():
+                    self._reload()
+                    before = len(self.names[kind])
+                    for name in uniques:
+                        self._add(kind, name)
+                    if len(self.names[kind]) != before:
+                        self.save()
+            lookup = np.array([self.lookup(kind, name) for name in uniques] + [-1], dtype=np.int32)
+        return lookup[inverse]
+
+    def version(self) -> Dict[str, list]:
+        """Version du registre : nombre de noms et empreinte de chaque liste, à enregistrer avec une table
+        qui porte des identifiants."""
+        return {kind: [len(self.names[kind]), _digest(self.names[kind])] for kind in KINDS}
+
+    def matches(self, version: Optional[Dict[str, list]]) -> bool:
+        """Vrai si les identifiants attribués sous `version` désignent toujours les mêmes noms.
+
+        Les listes ne font que grandir : le registre actuel doit commencer par les listes de `version`.
+        """
+        if not version:
+            return False
+        with self._lock:
+            if any(version.get(kind, [0])[0] > len(self.names[kind]) for kind in KINDS):
+                self._reload()
+            return all(
+                count <= len(self.names[kind]) and _digest(self.names[kind][:count]) == digest
+                for kind, (count, digest) in ((k, version.get(k, [0, _digest([])])) for k in KINDS)
+            )
+
+    def name(self, kind: str, identifier: int) -> Optional[str]:
+        """Orthographe enregistrée pour un identifiant."""
+        return self.names[kind][identifier] if 0 <= identifier < len(self.names[kind]) else None
+
+
+def _digest(names: List[str]) -> str:
+    return hashlib.sha256(json.dumps(names, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def with_ids(table: pd.DataFrame, column: str, kind: str, id_column: Optional[str] = None,
+             registry: Optional[IdRegistry] = None, assign: bool = True) -> pd.DataFrame:
+    """Ajoute à `table` la colonne d'identifiants de la colonne de noms `column`, si elle manque.
+
+    `assign=False` pour une lecture : les noms inconnus ne sont pas enregistrés (voir `IdRegistry`).
+    """
+    id_column = id_column or ID_COLUMNS[kind]
+    if column in table.columns and id_column not in table.columns:
+        table[id_column] = (registry or get_registry()).ids(kind, table[column], assign)
+    return table
+
+
+_registries: Dict[str, IdRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path: str = REGISTRY_PATH) -> IdRegistry:
+    """Registre partagé par tout le processus."""
+    key = os.path.abspath(path)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = IdRegistry(path)
+        return _registries[key]
@@ -0,0 +1,81 @@
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+
+STANDINGS_COLUMNS = ['Played', 'Won', 'Drawn', 'Lost', 'GF', 'GA', 'GD', 'Points']
+
+
+class StandingsCube:
+    """Classements cumulés journée par journée, calculés en une seule passe vectorisée.
+
+    `totals[j, t, c]` contient la statistique `STANDINGS_COLUMNS[c]` de l'équipe `t`
+    après la journée `j` (la journée 0 correspond au classement initial).
+    """
+
+    def __init__(self, manifest: pd.DataFrame, teams: Optional[List[str]] = None,
+                 total_matchdays: int = 38):
+        if teams is None:
+            teams = sorted(set(manifest['Home']) | set(manifest['Away']))
+        self.teams = list(teams)
+        self.total_matchdays = total_matchdays
+
+        played = manifest[(manifest['Matchday'] >= 1) & (manifest['Matchday'] <= total_matchdays)]
+        home_idx = pd.Categorical(played['Home'], categories=self.teams).codes
+        away_idx = pd.Categorical(played['Away'], categories=self.teams).codes
+        known = (home_idx >= 0) & (away_idx >= 0)
+        home_idx, away_idx = home_idx[known], away_idx[known]
+        matchday = played['Matchday'].to_numpy(dtype=np.int64)[known]
+        home_goals = played['Home Score'].to_numpy(dtype=np.int64)[known]
+        away_goals = played['Away Score'].to_numpy(dtype=np.int64)[known]
+
+        # Contribution de chaque match pour l'équipe à domicile et l'équipe à l'extérieur
+        home_rows = _match_rows(home_goals, away_goals)
+        away_rows = _match_rows(away_goals, home_goals)
+
+        per_day = np.zeros((total_matchdays + 1, len(self.teams), len(STANDINGS_COLUMNS)), dtype=np.int64)
+        np.add.at(per_day, (matchday, home_idx), home_rows)
+        np.add.at(per_day, (matchday, away_idx), away_rows)
+        self.totals = np.cumsum(per_day, axis=0)
+
+        # Classement par points, différence de buts puis buts marqués (ordre alphabétique en dernier)
+        points = self.totals[:, :, STANDINGS_COLUMNS.index('Points')]
+        goal_diff = self.totals[:, :, STANDINGS_COLUMNS.index('GD')]
+        goals_for = self.totals[:, :, STANDINGS_COLUMNS.index('GF')]
+        team_order = np.broadcast_to(np.arange(len(self.teams)), points.shape)
+        self.order = np.lexsort((team_order, -goals_for, -goal_diff, -points), axis=-1)
+        self.positions = np.empty_like(self.order)
+        np.put_along_axis(self.positions, self.order, np.arange(1, len(self.teams) + 1)[None, :], axis=-1)
+
+    def table(self, matchweek: int) -> pd.DataFrame:
+        """Classement trié après la journée demandée."""
+        matchweek = min(max(matchweek, 0), self.total_matchdays)
+        order = self.order[matchweek]
+        table = pd.DataFrame(self.totals[matchweek][order], columns=STANDINGS_COLUMNS)
+        table.insert(0, 'Teams', [self.teams[i] for i in order])
+        return table
+
+    def trajectory(self) -> pd.DataFrame:
+        """Position de chaque équipe après chaque journée (lignes : journées 1..N, colonnes : équipes)."""
+        return pd.DataFrame(
+            self.positions[1:],
+            index=pd.RangeIndex(1, self.total_matchdays + 1, name='Matchday'),
+            columns=self.teams
+        )
+
+
+def _match_rows(goals_for: np.ndarray, goals_against: np.ndarray) -> np.ndarray:
+    """Lignes Played/Won/Drawn/Lost/GF/GA/GD/Points d'une équipe pour chacun de ses matchs."""
+    won = goals_for > goals_against
+    drawn = goals_for == goals_against
+    lost = goals_for < goals_against
+    return np.column_stack([
+        np.ones_like(goals_for),
+        won,
+        drawn,
+        lost,
+        goals_for,
+        goals_against,
+        goals_for - goals_against,
+        3 * won + drawn,
+    ]).astype(np.int64)
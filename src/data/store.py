@@ -0,0 +1,156 @@
+from typing import List, Optional
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow absent : le DataLoader reste sur les CSV
+    pa = None
+    ds = None
+    pq = None
+
+
+class SeasonStore:
+    """Stockage colonnaire (Parquet) des fichiers d'événements, une partition par match."""
+
+    extension = ".parquet"
+
+    def __init__(self, store_directory: str):
+        self.store_directory = store_directory
+
+    @property
+    def available(self) -> bool:
+        """Indique si le moteur Parquet (pyarrow) est installé."""
+        return pq is not None
+
+    def partition_path(self, file_name: str) -> str:
+        """Chemin de la partition Parquet d'un fichier d'événements."""
+        name = os.path.splitext(file_name)[0]
+        return os.path.join(self.store_directory, name + self.extension)
+
+    def has_match(self, file_name: str, source_path: Optional[str] = None) -> bool:
+        """Vérifie qu'une partition existe et n'est pas plus ancienne que le CSV source."""
+        if not self.available:
+            return False
+        path = self.partition_path(file_name)
+        if not os.path.exists(path):
+            return False
+        if source_path is not None and os.path.exists(source_path):
+            return os.path.getmtime(path) >= os.path.getmtime(source_path)
+        return True
+
+    def list_matches(self) -> List[str]:
+        """Liste les fichiers d'événements présents dans le stockage."""
+        if not os.path.isdir(self.store_directory):
+            return []
+        return sorted([
+            f[:-len(self.extension)] + ".csv"
+            for f in os.listdir(self.store_directory)
+            if f.endswith(self.extension)
+        ])
+
+    def ingest_match(self, events_directory: str, file_name: str) -> str:
+        """Convertit un fichier d'événements CSV en partition Parquet."""
+        if not self.available:
+            raise ImportError("pyarrow est requis pour écrire le stockage colonnaire")
+        os.makedirs(self.store_directory, exist_ok=True)
+        data = pd.read_csv(os.path.join(events_directory, file_name), low_memory=False)
+        table = pa.Table.from_pandas(_arrow_safe(data), preserve_index=False)
+        path = self.partition_path(file_name)
+        # Écriture atomique : une lecture concurrente ne voit jamais de fichier partiel
+        tmp_path = path + ".tmp"
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+        return path
+
+    def ingest(self, events_directory: str, force: bool = False) -> List[str]:
+        """Convertit tous les CSV du répertoire, en sautant les partitions à jour."""
+        converted = []
+        for file_name in sorted(os.listdir(events_directory)):
+            if not file_name.endswith(".csv"):
+                continue
+            source_path = os.path.join(events_directory, file_name)
+            if force or not self.has_match(file_name, source_path):
+                self.ingest_match(events_directory, file_name)
+                converted.append(file_name)
+        return converted
+
+    def read_match(self, file_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lit un match en ne chargeant que les colonnes demandées (celles absentes sont ignorées)."""
+        path = self.partition_path(file_name)
+        if columns is not None:
+            columns = _present(columns, pq.read_schema(path).names)
+        return pq.read_table(path, columns=columns).to_pandas()
+
+    def scan(self, columns: Optional[List[str]] = None,
+             files: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lit plusieurs matchs (toute la saison par défaut) en un seul balayage."""
+        files = self.list_matches() if files is None else files
+        if not files:
+            return pd.DataFrame(columns=columns)
+        dataset = ds.dataset([self.partition_path(f) for f in files], format="parquet")
+        if columns is not None:
+            columns = _present(columns, dataset.schema.names)
+        return dataset.to_table(columns=columns).to_pandas()
+
+
+def _present(columns: List[str], names: List[str]) -> List[str]:
+    """Colonnes demandées présentes dans le fichier, dans l'ordre demandé."""
+    names = set(names)
+    return [column for column in columns if column in names]
+
+
+def save_table(table: pd.DataFrame, path: str):
+    """Écrit une table dérivée en Parquet (CSV si pyarrow n'est pas installé)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    try:
+        table.to_parquet(path, index=False)
+    except ImportError:
+        table.to_csv(os.path.splitext(path)[0] + ".csv", index=False)
+
+
+def read_table(path: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """Lit une table dérivée écrite par `save_table` (None si elle n'existe pas)."""
+    csv_path = os.path.splitext(path)[0] + ".csv"
+    if os.path.exists(path):
+        return pd.read_parquet(path, columns=columns)
+    if os.path.exists(csv_path):
+        return pd.read_csv(csv_path, usecols=columns)
+    return None
+
+
+def nullable_booleans(data: pd.DataFrame) -> pd.DataFrame:
+    """Passe en booléen nullable (`boolean`) les colonnes objet ne contenant que des booléens et des
+    valeurs manquantes (`Possession Loss`, `Possession Regain`, `Move Start` des fichiers d'événements)."""
+    for column in data.columns:
+        if data[column].dtype == object:
+            values = data[column].dropna()
+            if len(values) and values.map(lambda v: isinstance(v, (bool, np.bool_))).all():
+                data[column] = data[column].astype("boolean")
+    return data
+
+
+def _arrow_safe(data: pd.DataFrame) -> pd.DataFrame:
+    """Prépare un tableau pour Arrow : booléens nullables, texte pour les colonnes aux types mélangés."""
+    data = nullable_booleans(data)
+    for column in data.columns:
+        if data[column].dtype == object:
+            values = data[column].dropna()
+            if not values.map(lambda v: isinstance(v, str)).all():
+                data[column] = data[column].where(data[column].isna(), data[column].astype(str))
+    return data
+
+
+if __name__ == "__main__":
+    # Usage : python -m src.data.store "../EPL 2011-12/Events" "../EPL 2011-12/Store"
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    events_directory = args[0] if len(args) > 0 else "../EPL 2011-12/Events"
+    store_directory = args[1] if len(args) > 1 else "../EPL 2011-12/Store"
+    converted = SeasonStore(store_directory).ingest(events_directory, force="--force" in sys.argv)
+    print(f"{len(converted)} match(s) converti(s) vers {store_directory}")
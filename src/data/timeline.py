@@ -0,0 +1,67 @@
+from typing import Iterable, Optional
+import numpy as np
+import pandas as pd
+
+
+class MatchTimeline:
+    """Événements d'un match triés sur une horloge continue, prêts pour le filtrage par minute.
+
+    Définition unique de l'horloge du match : les mi-temps valent 0 et 1, et le temps de la
+    deuxième mi-temps est décalé du temps maximum de la première. La colonne `Time` du tableau
+    trié contient cette horloge continue (en secondes).
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        half = data["Half"].to_numpy()
+        time = data["Time"].to_numpy(dtype=float)
+
+        # Décalage de la deuxième mi-temps par la durée de la première
+        first_half = half == 0
+        first_half_end = time[first_half].max() if first_half.any() and (half == 1).any() else 0.0
+        clock = np.where(half == 1, time + first_half_end, time)
+
+        order = np.argsort(clock, kind="stable")
+        frame = data.iloc[order].reset_index(drop=True)
+        frame["Time"] = clock[order]
+
+        # Coordonnées de l'événement suivant (le dernier événement pointe sur lui-même)
+        frame["end_x"] = frame["X"].shift(-1).fillna(frame["X"])
+        frame["end_y"] = frame["Y"].shift(-1).fillna(frame["Y"])
+
+        self.frame = frame
+        self.clock = frame["Time"].to_numpy()
+        self.event_codes, self.event_names = pd.factorize(frame["Event Name"])
+        self.player_codes, self.player_names = pd.factorize(frame["Player1 Name"])
+
+    @property
+    def max_minute(self) -> int:
+        """Durée du match en minutes, arrondie à la minute supérieure."""
+        if len(self.clock) == 0:
+            return 0
+        return int(np.nanmax(self.clock) / 60) + 1
+
+    def prefix(self, minutes: float) -> int:
+        """Nombre d'événements survenus jusqu'à la minute donnée (recherche dichotomique)."""
+        return int(np.searchsorted(self.clock, minutes * 60, side="right"))
+
+    def _lookup(self, names: pd.Index, wanted: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+        """Table booléenne indexée par code : vrai pour les valeurs demandées."""
+        if wanted is None:
+            return None
+        table = np.zeros(len(names) + 1, dtype=bool)  # dernière case : valeurs manquantes (code -1)
+        table[names.get_indexer(list(wanted))] = True
+        table[-1] = False
+        return table
+
+    def query(self, players: Optional[Iterable[str]] = None, event_types: Optional[Iterable[str]] = None,
+              minutes: float = 90) -> pd.DataFrame:
+        """Événements des joueurs et types demandés jusqu'à la minute donnée (avec `end_x`/`end_y`)."""
+        stop = self.prefix(minutes)
+        mask = np.ones(stop, dtype=bool)
+        event_table = self._lookup(self.event_names, event_types)
+        if event_table is not None:
+            mask &= event_table[self.event_codes[:stop]]
+        player_table = self._lookup(self.player_names, players)
+        if player_table is not None:
+            mask &= player_table[self.player_codes[:stop]]
+        return self.frame.iloc[np.flatnonzero(mask)]
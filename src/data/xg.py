@@ -0,0 +1,164 @@
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, GOAL, SHOT_ATTEMPT, event_codes
+from src.data.timeline import MatchTimeline
+
+
+# Buts en x = -52 et x = +52, centrés en y = 0, larges de 8 m
+GOAL_X = 52
+GOAL_WIDTH = 8
+
+# Colonnes des fichiers d'événements nécessaires au modèle
+XG_SOURCE_COLUMNS = ['Match Name', 'Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y', 'Time', 'Half', 'xG Score']
+
+# Type de tir d'après le nom d'événement (les autres tirs sont des tirs dans le jeu)
+SHOT_TYPES = {'Header Shot': 'Header', 'Direct Free Kick Shot': 'Free Kick', 'Penalty Shot': 'Penalty'}
+SHOT_TYPE_NAMES = ['Open Play', 'Header', 'Free Kick', 'Penalty']
+
+# Un but est attribué au dernier tir de l'équipe survenu au plus tant de secondes avant lui
+GOAL_WINDOW = 10.0
+
+FEATURE_NAMES = ['Intercept', 'Distance', 'Angle', 'Header', 'Free Kick', 'Penalty']
+
+
+def shot_geometry(x, y):
+    """Distance (m) et angle de tir (radians) vers le but le plus proche, pour tous les tirs à la fois.
+
+    L'angle est celui sous lequel les deux poteaux sont vus depuis la position du tir.
+    """
+    x = np.abs(np.asarray(x, dtype=float))
+    y = np.asarray(y, dtype=float)
+    depth = GOAL_X - x
+    distance = np.hypot(depth, y)
+    half_width = GOAL_WIDTH / 2
+    angle = np.arctan2(GOAL_WIDTH * depth, depth ** 2 + y ** 2 - half_width ** 2)
+    return distance, np.where(angle < 0, angle + np.pi, angle)
+
+
+def match_shots(data: pd.DataFrame, file_name: Optional[str] = None) -> pd.DataFrame:
+    """Tirs d'un match avec leur géométrie, leur type et leur issue (utilisable avec `ingest_season`).
+
+    Un tir sans position finie est gardé (il peut être le tir d'un but) avec une distance et un
+    angle manquants ; `XGModel` l'écarte de l'ajustement et ne le note pas.
+    """
+    timeline = MatchTimeline(data)
+    frame = timeline.frame
+    codes = event_codes(frame)
+    provider_xg = frame['xG Score'].fillna(0).to_numpy() if 'xG Score' in frame.columns else np.zeros(len(frame))
+    is_shot = EVENTS.mask(codes, SHOT_ATTEMPT)
+    is_goal = EVENTS.mask(codes, GOAL)
+
+    # Chaque but marque le dernier tir de la même équipe dans la fenêtre qui le précède
+    team = frame['Player1 Team'].to_numpy()
+    shots = np.flatnonzero(is_shot)
+    scored = np.zeros(len(shots), dtype=bool)
+    for goal in np.flatnonzero(is_goal):
+        candidates = shots[(shots < goal) & (team[shots] == team[goal])
+                           & (timeline.clock[shots] >= timeline.clock[goal] - GOAL_WINDOW)]
+        if len(candidates):
+            scored[np.searchsorted(shots, candidates[-1])] = True
+
+    selected = frame.iloc[shots]
+    distance, angle = shot_geometry(selected['X'], selected['Y'])
+    return pd.DataFrame({
+        'Match Name': selected['Match Name'].to_numpy() if 'Match Name' in selected.columns else file_name,
+        'Player1 Name': selected['Player1 Name'].to_numpy(),
+        'Player1 Team': team[shots],
+        'Event Name': selected['Event Name'].to_numpy(),
+        'Shot Type': selected['Event Name'].map(SHOT_TYPES).fillna('Open Play').to_numpy(),
+        'X': selected['X'].to_numpy(dtype=float),
+        'Y': selected['Y'].to_numpy(dtype=float),
+        'Distance': distance,
+        'Angle': np.degrees(angle),
+        'Goal': scored,
+        'xG Score': provider_xg[shots],
+    })
+
+
+def shot_features(shots: pd.DataFrame) -> np.ndarray:
+    """Matrice des variables du modèle (une ligne par tir, colonnes de FEATURE_NAMES)."""
+    shot_type = shots['Shot Type'].to_numpy()
+    return np.column_stack([
+        np.ones(len(shots)),
+        shots['Distance'].to_numpy(dtype=float),
+        np.radians(shots['Angle'].to_numpy(dtype=float)),
+        shot_type == 'Header',
+        shot_type == 'Free Kick',
+        shot_type == 'Penalty',
+    ]).astype(float)
+
+
+class XGModel:
+    """Régression logistique (Newton-Raphson, pénalité L2) de la probabilité de but d'un tir.
+
+    Variables : distance, angle de tir et type de tir (tête, coup franc direct, penalty). Les
+    variables continues sont centrées-réduites avant l'ajustement.
+    """
+
+    def __init__(self, l2: float = 1e-2):
+        self.l2 = l2
+        self.coefficients = np.zeros(len(FEATURE_NAMES))
+        self.mean = np.zeros(len(FEATURE_NAMES))
+        self.scale = np.ones(len(FEATURE_NAMES))
+        self.iterations = 0
+
+    def _standardize(self, features: np.ndarray) -> np.ndarray:
+        return (features - self.mean) / self.scale
+
+    def fit(self, shots: pd.DataFrame, max_iterations: int = 50, tolerance: float = 1e-8) -> "XGModel":
+        """Ajuste le modèle sur les tirs dont la distance et l'angle sont finis."""
+        features = shot_features(shots)
+        finite = np.isfinite(features).all(axis=1)
+        features = features[finite]
+        goals = shots['Goal'].to_numpy(dtype=float)[finite]
+        if not len(features):
+            return self
+
+        # Seules la distance et l'angle sont centrés-réduits (l'intercept et les indicateurs restent tels quels)
+        self.mean = np.zeros(features.shape[1])
+        self.scale = np.ones(features.shape[1])
+        self.mean[1:3] = features[:, 1:3].mean(axis=0)
+        self.scale[1:3] = features[:, 1:3].std(axis=0) + 1e-12
+        design = self._standardize(features)
+
+        penalty = self.l2 * np.eye(design.shape[1])
+        penalty[0, 0] = 0.0  # intercept non pénalisé
+        weights = np.zeros(design.shape[1])
+        for iteration in range(1, max_iterations + 1):
+            probability = 1 / (1 + np.exp(-design @ weights))
+            gradient = design.T @ (probability - goals) + penalty @ weights
+            hessian = (design * (probability * (1 - probability))[:, None]).T @ design + penalty
+            step = np.linalg.solve(hessian, gradient)
+            weights -= step
+            if np.max(np.abs(step)) < tolerance:
+                break
+        self.iterations = iteration
+        self.coefficients = weights
+        return self
+
+    def predict(self, shots: pd.DataFrame) -> np.ndarray:
+        """Probabilité de but de chaque tir, en un seul produit matrice-vecteur (NaN sans position finie)."""
+        features = shot_features(shots)
+        finite = np.isfinite(features).all(axis=1)
+        probability = np.full(len(features), np.nan)
+        probability[finite] = 1 / (1 + np.exp(-self._standardize(features[finite]) @ self.coefficients))
+        return probability
+
+    def summary(self) -> pd.Series:
+        """Coefficients du modèle (sur les variables centrées-réduites)."""
+        return pd.Series(self.coefficients, index=FEATURE_NAMES)
+
+    @classmethod
+    def from_season(cls, loader, processes: Optional[int] = None, progress=None, l2: float = 1e-2) -> "XGModel":
+        """Ajuste le modèle sur tous les tirs de la saison (extraits match par match en parallèle)."""
+        return cls(l2).fit(season_shots(loader, processes, progress))
+
+
+def season_shots(loader, processes: Optional[int] = None, progress=None) -> pd.DataFrame:
+    """Tous les tirs de la saison, un match par tâche d'ingestion."""
+    frames: List[pd.DataFrame] = loader.ingest_season(match_shots, XG_SOURCE_COLUMNS, processes=processes,
+                                                      progress=progress)
+    if not frames:
+        return match_shots(pd.DataFrame(columns=XG_SOURCE_COLUMNS))
+    return pd.concat(frames, ignore_index=True)
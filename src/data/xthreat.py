@@ -0,0 +1,199 @@
+from typing import List, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, PASS, SHOT_ATTEMPT, event_codes
+from src.data.timeline import MatchTimeline
+
+
+# Colonnes des fichiers d'événements nécessaires au modèle
+XT_SOURCE_COLUMNS = [
+    'Match Name', 'Team A', 'Team B', 'Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y',
+    'Time', 'Half', 'xG Score'
+]
+
+# Terrain des fichiers d'événements : x dans [-53, 53], y dans [-34.5, 34.5]
+PITCH_HALF_LENGTH = 53.0
+PITCH_HALF_WIDTH = 34.5
+
+# Conduites de balle : le joueur garde le ballon jusqu'à l'événement suivant de son équipe
+CARRY_EVENTS = ('Dribble', 'Touch')
+
+
+class ThreatCounts(NamedTuple):
+    """Comptages par case (aplaties) d'un ou plusieurs matchs."""
+    shots: np.ndarray
+    xg: np.ndarray
+    moves: np.ndarray
+    transitions: np.ndarray  # matrice aplatie (case de départ, case d'arrivée) des actions réussies
+
+    def __add__(self, other: "ThreatCounts") -> "ThreatCounts":
+        return ThreatCounts(*(a + b for a, b in zip(self, other)))
+
+
+def attack_directions(frame: pd.DataFrame, shots: np.ndarray) -> pd.Series:
+    """Sens d'attaque (+1 vers x > 0, -1 sinon) de chaque équipe, après retournement de la deuxième mi-temps.
+
+    Le sens est celui où l'équipe tire ; une équipe sans tir attaque à l'opposé de son adversaire.
+    """
+    teams = [frame['Team A'].iloc[0], frame['Team B'].iloc[0]]
+    x = frame['X'].to_numpy(dtype=float)
+    x = np.where(frame['Half'].to_numpy() == 1, -x, x)
+    team = frame['Player1 Team'].to_numpy()
+    medians = [np.median(x[shots & (team == t)]) if (shots & (team == t)).any() else np.nan for t in teams]
+    if np.isnan(medians[0]) and np.isnan(medians[1]):
+        signs = [1.0, -1.0]
+    elif np.isnan(medians[0]):
+        signs = [-np.sign(medians[1]) or 1.0, np.sign(medians[1]) or -1.0]
+    else:
+        signs = [np.sign(medians[0]) or 1.0, -np.sign(medians[0]) or -1.0]
+    return pd.Series(signs, index=teams)
+
+
+class ExpectedThreat:
+    """Modèle Expected Threat (xT) sur une grille du terrain.
+
+    Pour chaque case : probabilité de tirer, valeur moyenne d'un tir (xG), probabilité de
+    déplacer le ballon (passe ou conduite) et matrice de transition des déplacements réussis.
+    La surface xT est le point fixe de `xT = s * g + m * T @ xT`, obtenu par itération sur
+    les valeurs. Les coordonnées sont ramenées dans le sens d'attaque de l'équipe qui agit.
+    """
+
+    def __init__(self, length_bins: int = 16, width_bins: int = 12):
+        self.length_bins = length_bins
+        self.width_bins = width_bins
+        self.counts: Optional[ThreatCounts] = None
+        self.surface = np.zeros((length_bins, width_bins))
+        self.iterations = 0
+        self._carry_codes = np.array([EVENTS.code(name) for name in CARRY_EVENTS])
+
+    @property
+    def cells(self) -> int:
+        return self.length_bins * self.width_bins
+
+    def cell(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Case (indice aplati) de positions finies exprimées dans le sens d'attaque.
+
+        Les positions hors du terrain sont ramenées sur la case du bord ; les positions non
+        finies n'ont pas de case (`match_actions` les écarte).
+        """
+        ix = np.floor((np.asarray(x, dtype=float) + PITCH_HALF_LENGTH) / (2 * PITCH_HALF_LENGTH) * self.length_bins)
+        iy = np.floor((np.asarray(y, dtype=float) + PITCH_HALF_WIDTH) / (2 * PITCH_HALF_WIDTH) * self.width_bins)
+        ix = np.clip(ix, 0, self.length_bins - 1).astype(np.intp)
+        iy = np.clip(iy, 0, self.width_bins - 1).astype(np.intp)
+        return ix * self.width_bins + iy
+
+    def match_actions(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Actions d'un match dans le sens d'attaque : tirs, passes et conduites, avec leur case.
+
+        Les actions sans position finie sont écartées : un tir sans X/Y, un déplacement sans
+        position de départ ou d'arrivée (événement suivant sans X/Y).
+        """
+        timeline = MatchTimeline(data)
+        frame = timeline.frame
+        codes = event_codes(frame)
+        shots = EVENTS.mask(codes, SHOT_ATTEMPT)
+        if 'xG Score' in frame.columns:
+            shots |= frame['xG Score'].fillna(0).to_numpy() > 0
+        moves = (EVENTS.mask(codes, PASS) | np.isin(codes, self._carry_codes)) & ~shots
+
+        team = frame['Player1 Team'].to_numpy()
+        half = frame['Half'].to_numpy()
+        next_team = np.append(team[1:], None)
+        next_half = np.append(half[1:], half[-1:])
+        sign = frame['Player1 Team'].map(attack_directions(frame, shots)).fillna(1.0).to_numpy()
+
+        # Deuxième mi-temps retournée, puis rotation dans le sens d'attaque de l'équipe qui agit
+        start_sign = np.where(half == 1, -sign, sign)
+        end_sign = np.where(next_half == 1, -sign, sign)
+        x = frame['X'].to_numpy(dtype=float) * start_sign
+        y = frame['Y'].to_numpy(dtype=float) * start_sign
+        end_x = frame['end_x'].to_numpy(dtype=float) * end_sign
+        end_y = frame['end_y'].to_numpy(dtype=float) * end_sign
+
+        actions = pd.DataFrame({
+            'Player1 Name': frame['Player1 Name'].to_numpy(),
+            'Player1 Team': team,
+            'Event Name': frame['Event Name'].to_numpy(),
+            'Minute': timeline.clock / 60,
+            'X': x, 'Y': y, 'end_x': end_x, 'end_y': end_y,
+            'Shot': shots,
+            'Move': moves,
+            'Success': moves & (next_team == team),
+            'xG': frame['xG Score'].fillna(0).to_numpy() if 'xG Score' in frame.columns else 0.0,
+        })
+        located = np.isfinite(x) & np.isfinite(y)
+        arrived = np.isfinite(end_x) & np.isfinite(end_y)
+        return actions[located & (shots | (moves & arrived))].reset_index(drop=True)
+
+    def match_counts(self, data: pd.DataFrame, file_name: Optional[str] = None) -> ThreatCounts:
+        """Comptages par case d'un match (utilisable comme réduction de `ingest_season`)."""
+        actions = self.match_actions(data)
+        start = self.cell(actions['X'], actions['Y'])
+        shots = actions['Shot'].to_numpy()
+        success = actions['Success'].to_numpy()
+        # Arrivée connue seulement pour les déplacements (un tir peut ne pas en avoir)
+        end = self.cell(actions['end_x'].to_numpy()[success], actions['end_y'].to_numpy()[success])
+        return ThreatCounts(
+            np.bincount(start[shots], minlength=self.cells),
+            np.bincount(start[shots], weights=actions['xG'].to_numpy()[shots], minlength=self.cells),
+            np.bincount(start[actions['Move'].to_numpy()], minlength=self.cells),
+            np.bincount(start[success] * self.cells + end, minlength=self.cells * self.cells),
+        )
+
+    def fit(self, counts: List[ThreatCounts], max_iterations: int = 200, tolerance: float = 1e-7) -> "ExpectedThreat":
+        """Estime les probabilités à partir des comptages de la saison puis résout la surface xT."""
+        total = counts[0]
+        for match in counts[1:]:
+            total = total + match
+        self.counts = total
+        return self.solve(max_iterations, tolerance)
+
+    def solve(self, max_iterations: int = 200, tolerance: float = 1e-7) -> "ExpectedThreat":
+        shots, xg, moves, transitions = self.counts
+        actions = shots + moves
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shoot = np.where(actions > 0, shots / actions, 0.0)
+            move = np.where(actions > 0, moves / actions, 0.0)
+            goal = np.where(shots > 0, xg / shots, 0.0)
+            transition = transitions.reshape(self.cells, self.cells) / np.maximum(moves, 1)[:, None]
+
+        # Itération sur les valeurs (produit matrice-vecteur sur toutes les cases à la fois)
+        reward = shoot * goal
+        move_transition = move[:, None] * transition
+        values = np.zeros(self.cells)
+        for iteration in range(1, max_iterations + 1):
+            updated = reward + move_transition @ values
+            converged = np.max(np.abs(updated - values)) < tolerance
+            values = updated
+            if converged:
+                break
+        self.iterations = iteration
+        self.surface = values.reshape(self.length_bins, self.width_bins)
+        return self
+
+    def value(self, x, y) -> np.ndarray:
+        """Valeur xT de positions exprimées dans le sens d'attaque (NaN pour une position non finie)."""
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        values = np.full(finite.shape, np.nan)
+        values[finite] = self.surface.ravel()[self.cell(x[finite], y[finite])]
+        return values
+
+    def rate(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Passes et conduites d'un match avec leur xT ajouté (nul pour une action ratée)."""
+        actions = self.match_actions(data)
+        actions = actions[actions['Move']].drop(columns=['Shot', 'Move', 'xG']).reset_index(drop=True)
+        actions['xT Start'] = self.value(actions['X'], actions['Y'])
+        actions['xT End'] = self.value(actions['end_x'], actions['end_y'])
+        actions['xT Added'] = np.where(actions['Success'], actions['xT End'] - actions['xT Start'], 0.0)
+        return actions
+
+    @classmethod
+    def from_season(cls, loader, processes: Optional[int] = None, progress=None,
+                    length_bins: int = 16, width_bins: int = 12) -> "ExpectedThreat":
+        """Construit la surface de la saison : comptages par match en parallèle, puis résolution."""
+        model = cls(length_bins, width_bins)
+        counts = loader.ingest_season(model.match_counts, XT_SOURCE_COLUMNS, processes=processes, progress=progress)
+        if not counts:
+            return model
+        return model.fit(counts)
@@ -1,6 +1,6 @@
 import plotly.graph_objects as go
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 class ChartCreator:
     max_shot_this_season = 34
@@ -11,9 +11,15 @@ class ChartCreator:
     # Largeur fixe maximum pour chaque type de barre
     bar_max_width = 100
     
-    def __init__(self):
+    def __init__(self, season_facts: Optional[pd.DataFrame] = None):
         self.default_width = 700
         self.default_height = 400
+        # Maxima réels de la saison si la table de faits (match, équipe) est disponible
+        if season_facts is not None and not season_facts.empty:
+            self.max_shot_this_season = int(season_facts['Shots'].max())
+            self.max_passe_this_season = int(season_facts['Passes'].max())
+            self.max_saves_this_season = int(season_facts['Saves'].max())
+            self.max_fouls_this_season = int(season_facts['Fouls'].max())
         # Dictionnaire mapping les métriques avec leurs valeurs max correspondantes
         self.max_values = {
             'Shots': self.max_shot_this_season,
@@ -0,0 +1,45 @@
+import numpy as np
+
+
+class HeatmapEngine:
+    """Calcule une carte de densité gaussienne à partir de coordonnées normalisées (0-100).
+
+    Les points sont d'abord comptés dans une grille (histogramme 2D), puis la gaussienne
+    est appliquée en une convolution séparable : `K @ comptes @ K.T`, où `K` est la matrice
+    de convolution 1D (gaussienne tronquée à 3 sigma, bords à zéro).
+    """
+
+    def __init__(self, grid_size: int = 100, sigma: float = 2.0, extent: float = 100.0):
+        self.grid_size = grid_size
+        self.sigma = sigma
+        self.extent = extent
+        self.kernel_matrix = self._kernel_matrix()
+
+    def _kernel_matrix(self) -> np.ndarray:
+        """Matrice de convolution 1D (grid_size x grid_size) de la gaussienne tronquée."""
+        sigma_cells = self.sigma * self.grid_size / self.extent
+        kernel_size = int(3 * sigma_cells)
+        cells = np.arange(self.grid_size)
+        distance = cells[:, None] - cells[None, :]
+        kernel = np.exp(-(distance ** 2) / (2 * sigma_cells * sigma_cells))
+        kernel[np.abs(distance) > kernel_size] = 0
+        return kernel
+
+    def histogram(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Nombre de points par cellule ; les points hors du terrain sont ignorés."""
+        scale = self.grid_size / self.extent
+        x_idx = np.floor(np.asarray(x, dtype=float) * scale)
+        y_idx = np.floor(np.asarray(y, dtype=float) * scale)
+        inside = (x_idx >= 0) & (x_idx < self.grid_size) & (y_idx >= 0) & (y_idx < self.grid_size)
+        flat = x_idx[inside].astype(np.int64) * self.grid_size + y_idx[inside].astype(np.int64)
+        counts = np.bincount(flat, minlength=self.grid_size * self.grid_size)
+        return counts.reshape(self.grid_size, self.grid_size).astype(float)
+
+    def density(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Matrice de densité indexée [x, y], comme celle de `PitchVisualizer.creat_heat_map`."""
+        counts = self.histogram(x, y)
+        return self.kernel_matrix @ counts @ self.kernel_matrix.T
+
+    def axis(self) -> np.ndarray:
+        """Coordonnées des cellules le long d'un axe du terrain."""
+        return np.linspace(0, self.extent, self.grid_size)
@@ -2,7 +2,10 @@ import plotly.graph_objects as go
 import pandas as pd
 import math
 import numpy as np
-from typing import Dict
+from typing import Dict, List
+from src.visualization.heatmap import HeatmapEngine
+from src.data.xthreat import PITCH_HALF_LENGTH, PITCH_HALF_WIDTH
+from src.data.passing import TeamNetwork
 
 class PitchVisualizer:
     def __init__(self):
@@ -63,59 +66,41 @@ class PitchVisualizer:
         norm_y = (y + 34.5) * (self.pitch_height / self.real_pitch_height)
         return np.clip(norm_x, 0, 100), np.clip(norm_y, 0, 100)
     
-    def create_vector_plot(self, df: pd.DataFrame, title: str, teams) -> go.Figure:
+    def create_vector_plot(self, df: pd.DataFrame, title: str, teams, batched: bool = True) -> go.Figure:
         fig = self._create_base_pitch()
         
         if df.empty:
             self._update_layout(fig, title + ' Locations')
             return fig
         
-        # Préparation des données pour l'affichage
-        vectors = []
-        start_points = []
-        hover_texts = []
-        colors = []
-        
-        for _, row in df.iterrows():
-            # Normaliser les coordonnées originales
-            start_x, start_y = self._normalize_coordinates(row['X'], row['Y'])
-            end_x, end_y = self._normalize_coordinates(row['end_x'], row['end_y'])
-            
-            # Inverser les coordonnées si les événements sont effectués en deuxième mi-temps
-            if row['Half'] == 1:
-                # Pour une inversion correcte, nous devons ajuster par rapport au centre du terrain
-                start_x = 100 - start_x  # Miroir horizontal (axe central à x=50)
-                start_y = 100 - start_y  # Miroir vertical (axe central à y=50)
-                end_x = 100 - end_x
-                end_y = 100 - end_y
-            
-            # Ajouter aux listes pour l'affichage
-            vectors.append((start_x, start_y, end_x, end_y))
-            start_points.append((start_x, start_y))
-            hover_texts.append(
-                f"{row['Player1 Name']}"
-            )
-            colors.append('red' if row['Player1 Team'] == teams[1] else 'green')
+        # Normaliser (et inverser en deuxième mi-temps) les points de départ et d'arrivée
+        start_x, start_y = self._normalize_frame(df, 'X', 'Y')
+        end_x, end_y = self._normalize_frame(df, 'end_x', 'end_y')
+        hover_texts = df['Player1 Name'].astype(str).tolist()
+        colors = np.where(df['Player1 Team'].to_numpy() == teams[1], 'red', 'green')
         
-        # Tracer les vecteurs (flèches)
-        for start_x, start_y, end_x, end_y in vectors:
-            fig.add_trace(go.Scatter(
-                x=[start_x, end_x],
-                y=[start_y, end_y],
-                mode='lines+markers',
-                line=dict(width=2, color='white'),
-                marker=dict(
-                    symbol="arrow",
-                    size=15,
-                    angleref="previous",
-                ),
-                hoverinfo='none'
-            ))
+        if batched:
+            fig.add_trace(self._vector_trace(start_x, start_y, end_x, end_y, marker_color=colors))
+        else:
+            # Tracer les vecteurs (flèches), une trace par vecteur
+            for x0, y0, x1, y1 in zip(start_x, start_y, end_x, end_y):
+                fig.add_trace(go.Scatter(
+                    x=[x0, x1],
+                    y=[y0, y1],
+                    mode='lines+markers',
+                    line=dict(width=2, color='white'),
+                    marker=dict(
+                        symbol="arrow",
+                        size=15,
+                        angleref="previous",
+                    ),
+                    hoverinfo='none'
+                ))
         
         # Ajouter tous les points de départ en une seule trace
         fig.add_trace(go.Scatter(
-            x=[point[0] for point in start_points],
-            y=[point[1] for point in start_points],
+            x=start_x,
+            y=start_y,
             mode='markers',
             marker=dict(
                 size=8,
@@ -129,6 +114,211 @@ class PitchVisualizer:
         self._update_layout(fig, title + ' Locations')
         return fig
     
+    @staticmethod
+    def _vector_trace(start_x, start_y, end_x, end_y, color: str = 'white', marker_color=None) -> go.Scatter:
+        """Tous les vecteurs dans une seule trace : segments séparés par des trous (None),
+        flèche aux deux extrémités de chaque segment comme avec une trace par vecteur.
+
+        `marker_color` (une couleur, ou une par vecteur) colore les flèches ; par défaut `color`.
+        """
+        count = len(start_x)
+        x = np.full(3 * count, None, dtype=object)
+        y = np.full(3 * count, None, dtype=object)
+        x[0::3], x[1::3] = start_x, end_x
+        y[0::3], y[1::3] = start_y, end_y
+        sizes = np.zeros(3 * count)
+        sizes[0::3] = 15
+        sizes[1::3] = 15
+        marker_color = color if marker_color is None else marker_color
+        if not isinstance(marker_color, str):
+            marker_color = np.repeat(np.asarray(marker_color, dtype=object), 3)
+
+        return go.Scatter(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            line=dict(width=2, color=color),
+            marker=dict(
+                symbol="arrow",
+                size=sizes,
+                angleref="previous",
+                color=marker_color,
+            ),
+            connectgaps=False,
+            hoverinfo='none'
+        )
+
+    def add_xt_overlay(self, fig: go.Figure, surface: np.ndarray, opacity: float = 0.6) -> go.Figure:
+        """Ajoute la surface Expected Threat (attaque de gauche à droite) sous forme de heatmap."""
+        return self._add_zone_overlay(fig, surface, 'Viridis', 'xT', 'xT %{z:.3f}<extra></extra>', opacity)
+
+    def _add_zone_overlay(self, fig: go.Figure, surface: np.ndarray, colorscale: str, label: str,
+                          hovertemplate: str, opacity: float = 0.6) -> go.Figure:
+        """Heatmap d'une grille (longueur x largeur) couvrant tout le terrain."""
+        x, y = self._zone_centers(*surface.shape)
+        fig.add_trace(go.Heatmap(
+            z=surface.T,  # Transposée : lignes = largeur du terrain
+            x=x,
+            y=y,
+            colorscale=colorscale,
+            opacity=opacity,
+            showscale=True,
+            colorbar=dict(title=label),
+            hovertemplate=hovertemplate
+        ))
+        return fig
+
+    def _zone_centers(self, length_bins: int, width_bins: int) -> tuple[np.ndarray, np.ndarray]:
+        """Centres (coordonnées d'affichage) des colonnes et des lignes d'une grille du terrain."""
+        x_centers = (np.arange(length_bins) + 0.5) / length_bins * 2 * PITCH_HALF_LENGTH - PITCH_HALF_LENGTH
+        y_centers = (np.arange(width_bins) + 0.5) / width_bins * 2 * PITCH_HALF_WIDTH - PITCH_HALF_WIDTH
+        x, _ = self._normalize_coordinates(x_centers, 0)
+        _, y = self._normalize_coordinates(0, y_centers)
+        return x, y
+
+    def create_flow_map(self, matrix: np.ndarray, length_bins: int, width_bins: int,
+                        title: str = 'Pass Flows', top_n: int = 25) -> go.Figure:
+        """Carte des flux de passes (attaque de gauche à droite) d'une matrice origine-destination.
+
+        Le fond colore le nombre de passes parties de chaque zone ; les `top_n` flux les plus
+        fréquents entre zones différentes sont des flèches d'un centre de zone à l'autre, avec
+        le nombre de passes au survol du milieu de chaque flèche.
+        """
+        fig = self._create_base_pitch()
+        self._add_zone_overlay(fig, matrix.sum(axis=1).reshape(length_bins, width_bins), 'Blues', 'Passes',
+                               'Passes %{z}<extra></extra>', opacity=0.5)
+
+        # Flux entre zones distinctes, du plus au moins fréquent
+        flows = matrix.astype(float).copy()
+        np.fill_diagonal(flows, 0)
+        order = np.argsort(flows, axis=None)[::-1][:top_n]
+        order = order[flows.ravel()[order] > 0]
+        if len(order):
+            origin, destination = np.divmod(order, matrix.shape[1])
+            counts = matrix[origin, destination]
+            centers_x, centers_y = self._zone_centers(length_bins, width_bins)
+            start_x, start_y = centers_x[origin // width_bins], centers_y[origin % width_bins]
+            end_x, end_y = centers_x[destination // width_bins], centers_y[destination % width_bins]
+            fig.add_trace(self._vector_trace(start_x, start_y, end_x, end_y))
+            fig.add_trace(go.Scatter(
+                x=(start_x + end_x) / 2,
+                y=(start_y + end_y) / 2,
+                mode='markers',
+                marker=dict(size=4 + 12 * np.sqrt(counts / counts.max()), color='white', opacity=0.8),
+                text=[f"{count} passes" for count in counts],
+                hoverinfo='text'
+            ))
+
+        self._update_layout(fig, title)
+        return fig
+
+    def create_xt_plot(self, actions: pd.DataFrame, surface: np.ndarray, title: str = 'Expected Threat',
+                       top_n: int = 20) -> go.Figure:
+        """Surface xT et les `top_n` passes / conduites ayant ajouté le plus de menace.
+
+        `actions` vient de `DataProcessor.get_xt_added` : coordonnées déjà dans le sens d'attaque.
+        """
+        fig = self._create_base_pitch()
+        self.add_xt_overlay(fig, surface)
+
+        best = actions[actions['xT Added'] > 0].nlargest(top_n, 'xT Added')
+        if not best.empty:
+            start_x, start_y = self._normalize_coordinates(best['X'].to_numpy(), best['Y'].to_numpy())
+            end_x, end_y = self._normalize_coordinates(best['end_x'].to_numpy(), best['end_y'].to_numpy())
+            fig.add_trace(self._vector_trace(start_x, start_y, end_x, end_y))
+            fig.add_trace(go.Scatter(
+                x=start_x,
+                y=start_y,
+                mode='markers',
+                marker=dict(size=8, color='white', opacity=0.8),
+                text=[
+                    f"{player}<br>{event}<br>xT +{value:.3f}"
+                    for player, event, value in zip(best['Player1 Name'], best['Event Name'], best['xT Added'])
+                ],
+                hoverinfo='text'
+            ))
+
+        self._update_layout(fig, title)
+        return fig
+
+    def create_passing_network(self, networks: List[TeamNetwork], title: str = 'Passing Network', teams=None,
+                               min_passes: int = 2) -> go.Figure:
+        """Réseaux de passes (un par équipe) en deux traces : tous les liens, puis tous les joueurs.
+
+        Les liens d'au moins `min_passes` passes sont des segments séparés par des trous (None) ;
+        le nombre de passes est porté par un marqueur au milieu de chaque segment. La taille
+        des joueurs suit le nombre de passes réussies, placés à leur position moyenne.
+        """
+        fig = self._create_base_pitch()
+        teams = teams or [network.team for network in networks]
+
+        edge_x, edge_y, edge_sizes, edge_texts = [], [], [], []
+        node_x, node_y, node_sizes, node_colors, node_texts, node_labels = [], [], [], [], [], []
+        for network in networks:
+            positions = network.positions
+            x, y = self._normalize_coordinates(positions['X'].to_numpy(dtype=float), positions['Y'].to_numpy(dtype=float))
+            passes = positions['Passes'].to_numpy()
+            color = 'red' if len(teams) > 1 and network.team == teams[1] else 'green'
+
+            # Segments passeur → receveur : départ, milieu, arrivée, trou
+            passer, receiver = np.nonzero(network.adjacency >= min_passes)
+            weights = network.adjacency[passer, receiver]
+            count = len(passer)
+            segment_x = np.full(4 * count, None, dtype=object)
+            segment_y = np.full(4 * count, None, dtype=object)
+            segment_x[0::4], segment_x[1::4], segment_x[2::4] = x[passer], (x[passer] + x[receiver]) / 2, x[receiver]
+            segment_y[0::4], segment_y[1::4], segment_y[2::4] = y[passer], (y[passer] + y[receiver]) / 2, y[receiver]
+            sizes = np.zeros(4 * count)
+            sizes[1::4] = 4 + 2 * np.sqrt(weights)
+            texts = np.full(4 * count, '', dtype=object)
+            texts[1::4] = [
+                f"{network.players[i]} → {network.players[j]}<br>{w} passes"
+                for i, j, w in zip(passer, receiver, weights)
+            ]
+            edge_x.append(segment_x)
+            edge_y.append(segment_y)
+            edge_sizes.append(sizes)
+            edge_texts.append(texts)
+
+            # Joueurs ayant touché le ballon sur la période
+            active = positions['Touches'].to_numpy() > 0
+            node_x.append(x[active])
+            node_y.append(y[active])
+            node_sizes.append(10 + 2 * np.sqrt(passes[active]))
+            node_colors.append(np.full(active.sum(), color, dtype=object))
+            node_labels.append(positions['Player'].to_numpy()[active])
+            node_texts.append([
+                f"{player}<br>{int(p)} passes<br>{int(t)} ballons touchés"
+                for player, p, t in zip(positions['Player'][active], passes[active], positions['Touches'][active])
+            ])
+
+        if edge_x:
+            fig.add_trace(go.Scatter(
+                x=np.concatenate(edge_x),
+                y=np.concatenate(edge_y),
+                mode='lines+markers',
+                line=dict(width=1.5, color='rgba(255, 255, 255, 0.6)'),
+                marker=dict(size=np.concatenate(edge_sizes), color='white'),
+                text=np.concatenate(edge_texts),
+                hoverinfo='text',
+                connectgaps=False
+            ))
+            fig.add_trace(go.Scatter(
+                x=np.concatenate(node_x),
+                y=np.concatenate(node_y),
+                mode='markers+text',
+                marker=dict(size=np.concatenate(node_sizes), color=np.concatenate(node_colors),
+                            line=dict(width=1, color='white')),
+                text=[name.split()[-1] if name.split() else name for name in np.concatenate(node_labels)],
+                textposition='top center',
+                textfont=dict(color='white', size=10),
+                hovertext=[text for texts in node_texts for text in texts],
+                hoverinfo='text'
+            ))
+
+        self._update_layout(fig, title)
+        return fig
+
     def create_point_plot(self, df: pd.DataFrame, title: str, teams) -> go.Figure:
         fig = self._create_base_pitch()
         
@@ -178,34 +368,29 @@ class PitchVisualizer:
         self._update_layout(fig, title + ' Locations')
         return fig
     
-    def creat_heat_map(self, df: pd.DataFrame, title: str):
+    def _normalize_frame(self, df: pd.DataFrame, x_column: str = 'X', y_column: str = 'Y') -> tuple[np.ndarray, np.ndarray]:
+        """Normalise et retourne (miroir en deuxième mi-temps) toutes les coordonnées d'un DataFrame."""
+        x, y = self._normalize_coordinates(df[x_column].to_numpy(dtype=float), df[y_column].to_numpy(dtype=float))
+        second_half = df['Half'].to_numpy() == 1
+        x = np.where(second_half, 100 - x, x)
+        y = np.where(second_half, 100 - y, y)
+        return x, y
+
+    def creat_heat_map(self, df: pd.DataFrame, title: str, grid_size: int = 100, sigma: float = 2.0):
         fig = self._create_base_pitch()
         
-        # Créer une matrice qui correspond précisément aux dimensions du terrain (100x100)
-        mat = np.zeros((100, 100))
+        # Coordonnées normalisées (inversées en deuxième mi-temps) de tous les événements
+        x, y = self._normalize_frame(df)
         
-        for _, row in df.iterrows():
-            # Normaliser les coordonnées
-            x, y = self._normalize_coordinates(row['X'], row['Y'])
-            
-            # Inverser les coordonnées si l'événement est en deuxième mi-temps
-            if row['Half'] == 1:
-                x = 100 - x
-                y = 100 - y
-            
-            # Convertir en entiers pour indexer la matrice
-            x_idx = int(x)
-            y_idx = int(y)
-            
-            # Ajouter une distribution gaussienne centrée sur ce point
-            # Utiliser des indices directs de la matrice plutôt que d'appliquer des décalages
-            self._add_gaussian(mat, x_idx, y_idx, sigma=2.0)
+        # Histogramme 2D des événements puis convolution gaussienne séparable
+        engine = HeatmapEngine(grid_size=grid_size, sigma=sigma)
+        mat = engine.density(x, y)
         
         # Ajout de la visualisation de la heatmap
         heatmap = go.Heatmap(
             z=mat.T,  # Transposée pour correspondre aux coordonnées du terrain
-            x=np.linspace(0, 100, 100),  # Utiliser des coordonnées qui correspondent précisément au terrain
-            y=np.linspace(0, 100, 100),
+            x=engine.axis(),  # Utiliser des coordonnées qui correspondent précisément au terrain
+            y=engine.axis(),
             colorscale='Jet',
             showscale=True,
             opacity=0.7,
@@ -220,44 +405,6 @@ class PitchVisualizer:
         self._update_layout(fig, title + ' heatmap')
         return fig
 
-    def _add_gaussian(self, M, x_center, y_center, sigma=100):
-        """
-        Ajoute une distribution gaussienne 2D centrée sur (x_center, y_center)
-        
-        Paramètres:
-        - M: la matrice 100x100 sur laquelle ajouter la gaussienne
-        - x_center, y_center: coordonnées du centre de la gaussienne (déjà normalisées)
-        - sigma: écart-type de la gaussienne
-        """
-        # Vérifier que le centre est dans les limites
-        if not (0 <= x_center < 100 and 0 <= y_center < 100):
-            return M
-        
-        # Définir la zone d'influence (3*sigma couvre ~99.7% de la distribution)
-        kernel_size = int(3 * sigma)
-        
-        # Limites de la région à mettre à jour
-        x_min = max(0, x_center - kernel_size)
-        x_max = min(99, x_center + kernel_size)
-        y_min = max(0, y_center - kernel_size)
-        y_max = min(99, y_center + kernel_size)
-        
-        # Appliquer la gaussienne
-        for i in range(x_min, x_max + 1):
-            for j in range(y_min, y_max + 1):
-                # Distance au carré depuis le centre
-                dx = i - x_center
-                dy = j - y_center
-                distance_squared = dx*dx + dy*dy
-                
-                # Formule de la gaussienne 2D
-                factor = np.exp(-distance_squared / (2 * sigma * sigma))
-                
-                # Ajouter cette valeur
-                M[i, j] += factor
-        
-        return M
-
     def _update_layout(self, fig: go.Figure, title: str):
         """Met à jour la mise en page de la figure."""
         fig.update_layout(
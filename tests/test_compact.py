@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+from src.data.compact import UNKNOWN_VALUE, SeasonDictionaries
+
+
+def test_apply_is_read_only_and_reserves_a_code_for_unknown_values(tmp_path):
+    path = tmp_path / "dictionaries.json"
+    dictionaries = SeasonDictionaries(str(path))
+    dictionaries.build(pd.DataFrame({"Player1 Name": ["A", "B"], "Event Name": ["Pass", "Shot"]}))
+    stored = path.read_text(encoding="utf-8")
+
+    match = pd.DataFrame({"Player1 Name": ["B", "C", np.nan], "Event Name": ["Shot", "Pass", "Pass"]})
+    compact = SeasonDictionaries(str(path)).apply(match)
+    players = compact["Player1 Name"]
+    assert players.cat.categories.tolist() == ["A", "B", UNKNOWN_VALUE]
+    assert players.cat.codes.tolist() == [1, 2, -1]
+    assert path.read_text(encoding="utf-8") == stored
+
+    # L'extension (ingestion) ajoute les valeurs à la fin : les codes existants ne bougent pas
+    assert dictionaries.extend(match)
+    players = SeasonDictionaries(str(path)).apply(match)["Player1 Name"]
+    assert players.cat.codes.tolist() == [1, 2, -1]
+    assert players.cat.categories.tolist() == ["A", "B", "C", UNKNOWN_VALUE]
@@ -0,0 +1,63 @@
+import os
+import numpy as np
+import pandas as pd
+from src.data.disk_cache import PAYLOAD_MIN_BYTES, DiskCache
+
+
+def test_corrupt_payload_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    frame = pd.DataFrame({"a": np.arange(200_000)})  # au-delà de PAYLOAD_MIN_BYTES : écrit en Arrow
+    assert cache.get_or_compute("f", (), {}, [], lambda: frame).equals(frame)
+
+    entry = cache.entries()["Path"].iloc[0]
+    for name in os.listdir(entry):
+        if name != "value.pkl":
+            with open(os.path.join(entry, name), "wb") as f:
+                f.write(b"not arrow")
+    assert cache.get_or_compute("f", (), {}, [], lambda: frame).equals(frame)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.get_or_compute("f", (), {}, [], lambda: None).equals(frame)
+
+
+def test_key_hashes_content_not_repr(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    big = np.zeros(10000)
+    changed = big.copy()
+    changed[5000] = 1  # invisible dans le repr tronqué
+    assert repr(big) == repr(changed)
+    assert cache.key("f", (big,), {}, []) != cache.key("f", (changed,), {}, [])
+    assert cache.key("f", (), {"a": 1, "b": 2}, []) == cache.key("f", (), {"b": 2, "a": 1}, [])
+
+
+def test_eviction_is_throttled(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=10 ** 6)
+    scans = []
+    original = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: scans.append(1) or original())
+    for i in range(5):
+        cache.get_or_compute("f", (i,), {}, [], lambda: i)
+    assert len(scans) == 1
+
+    cache.max_bytes = 1
+    cache.get_or_compute("f", (99,), {}, [], lambda: 99)
+    assert len(scans) == 2 and len(cache.entries()) == 0
+
+
+class _Model:
+    def __init__(self):
+        self.small = np.zeros(4)
+        self.large = np.zeros(PAYLOAD_MIN_BYTES // 8 + 1)
+        self.table = pd.DataFrame({"a": np.zeros(PAYLOAD_MIN_BYTES // 8 + 1)})
+
+
+def test_results_are_writable_after_a_hit(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.get_or_compute("model", (), {}, [], _Model)
+    for _ in range(2):
+        model = cache.get_or_compute("model", (), {}, [], _Model)
+        assert model.small.sum() == 0 and model.large.sum() == 0 and model.table["a"].sum() == 0
+        model.small += 1
+        model.large[:10] = 1
+        model.table.loc[0, "a"] = 1
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert sorted(os.listdir(cache.entries()["Path"].iloc[0])) == ["0.npy", "1.arrow", "value.pkl"]
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from src.data.events import EVENTS, LEGACY_SHOT, SHOT_ATTEMPT, event_flag
+from src.data.processor import DataProcessor
+
+
+def test_event_flag_reads_every_storage_format():
+    expected = [True, False, False]
+    for values in ([True, np.nan, False],
+                   pd.array([True, None, False], dtype="boolean"),
+                   pd.Series(["True", np.nan, "False"], dtype="str")):
+        frame = pd.DataFrame({"Possession Loss": values})
+        assert event_flag(frame, "Possession Loss").tolist() == expected
+    assert event_flag(pd.DataFrame({"X": [1.0, 2.0]}), "Move Start").tolist() == [False, False]
+
+
+def test_successful_passes_ignore_false_strings():
+    data = pd.DataFrame({
+        "Event Name": ["Pass", "Pass", "Pass", "Shot"],
+        "Player1 Team": ["Arsenal"] * 4,
+        "Possession Loss": pd.Series(["True", "False", np.nan, "False"], dtype="str"),
+    })
+    processor = DataProcessor()
+    assert processor.calculate_possession_loss(data, "Arsenal") == 1
+    assert processor.calculate_successful_passes(data, "Arsenal") == 2
+    stats = processor.get_team_stats(data, ["Arsenal"])["Arsenal"]
+    assert (stats.passes, stats.successful_passes) == (3, 2)
+
+
+def test_shot_attempts_differ_from_legacy_match_shots():
+    names = ["Shot", "Header Shot", "Direct Free Kick Shot", "Penalty Shot", "Direct Free Kick Cross", "Pass"]
+    codes = EVENTS.encode(names)
+    assert EVENTS.mask(codes, SHOT_ATTEMPT).tolist() == [True, True, True, True, False, False]
+    assert EVENTS.mask(codes, LEGACY_SHOT).tolist() == [True, True, False, False, True, False]
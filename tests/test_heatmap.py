@@ -0,0 +1,44 @@
+import numpy as np
+from src.visualization.heatmap import HeatmapEngine
+
+
+def _add_gaussian(M, x_center, y_center, sigma):
+    """Version d'origine de PitchVisualizer._add_gaussian (boucle par cellule sur une grille 100x100)."""
+    if not (0 <= x_center < 100 and 0 <= y_center < 100):
+        return M
+    kernel_size = int(3 * sigma)
+    x_min = max(0, x_center - kernel_size)
+    x_max = min(99, x_center + kernel_size)
+    y_min = max(0, y_center - kernel_size)
+    y_max = min(99, y_center + kernel_size)
+    for i in range(x_min, x_max + 1):
+        for j in range(y_min, y_max + 1):
+            dx = i - x_center
+            dy = j - y_center
+            M[i, j] += np.exp(-(dx * dx + dy * dy) / (2 * sigma * sigma))
+    return M
+
+
+def _baseline(x, y, sigma):
+    mat = np.zeros((100, 100))
+    for x_value, y_value in zip(x, y):
+        _add_gaussian(mat, int(x_value), int(y_value), sigma)
+    return mat
+
+
+def test_density_matches_per_event_gaussian():
+    # Coins, bords, points voisins cumulés et un point hors terrain
+    x = np.array([0.0, 99.9, 0.4, 50.2, 50.7, 3.0, 120.0, 96.5])
+    y = np.array([0.0, 99.9, 99.0, 50.5, 50.1, 97.2, 10.0, 2.0])
+    for sigma in (2.0, 2.5):
+        engine = HeatmapEngine(grid_size=100, sigma=sigma)
+        np.testing.assert_allclose(engine.density(x, y), _baseline(x, y, sigma), atol=1e-12)
+
+
+def test_kernel_is_truncated_at_three_sigma():
+    # sigma = 2.5 : int(3 sigma) = 7, la cellule à distance 8 doit rester nulle
+    engine = HeatmapEngine(grid_size=100, sigma=2.5)
+    mat = engine.density(np.array([50.0]), np.array([50.0]))
+    assert mat[57, 50] > 0 and mat[50, 43] > 0
+    assert mat[58, 50] == 0 and mat[50, 42] == 0
+    assert mat[57, 57] > 0 and mat[58, 57] == 0
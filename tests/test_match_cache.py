@@ -0,0 +1,35 @@
+import os
+import src.data.match_cache as match_cache
+from src.data.match_cache import MatchCache
+
+
+def _touch(path, delta_ns):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta_ns))
+
+
+def test_default_signature_never_hashes(tmp_path, monkeypatch):
+    monkeypatch.setattr(match_cache, "file_hash", lambda path: (_ for _ in ()).throw(AssertionError(path)))
+    path = tmp_path / "match.csv"
+    path.write_text("a\n1\n")
+    cache = MatchCache()
+
+    assert cache.get(str(path), "rows", lambda: 1) == 1
+    assert cache.get(str(path), "rows", lambda: 2) == 1
+    path.write_text("a\n1\n2\n")
+    assert cache.get(str(path), "rows", lambda: 2) == 2
+    assert cache.stats()[:4] == (1, 2, 0, 1)
+
+
+def test_verify_hash_keeps_touched_files(tmp_path):
+    path = tmp_path / "match.csv"
+    path.write_text("a\n1\n")
+    cache = MatchCache(verify_hash=True)
+
+    cache.get(str(path), "rows", lambda: 1)
+    _touch(path, 10 ** 9)
+    assert cache.get(str(path), "rows", lambda: 2) == 1
+
+    path.write_text("a\n9\n")
+    _touch(path, 2 * 10 ** 9)
+    assert cache.get(str(path), "rows", lambda: 3) == 3
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from src.data.passflow import PassFlowEngine
+
+
+def _match(match_name='11.08.13 Arsenal v Fulham'):
+    """Arsenal attaque vers x > 0 (son tir), Fulham en sens inverse ; grille 2 x 1.
+
+    Passes réussies : Arsenal 0 -> 1 et 1 -> 1, Fulham 0 -> 1 (x = 20, soit -20 dans son repère) et 1 -> 1.
+    La conduite d'Arsenal et la passe interceptée de Fulham ne comptent pas.
+    """
+    rows = [
+        ('Pass', 'Arteta', 'Arsenal', -20.0),
+        ('Pass', 'Song', 'Arsenal', 20.0),
+        ('Touch', 'Walcott', 'Arsenal', 30.0),
+        ('Shot', 'Walcott', 'Arsenal', 40.0),
+        ('Pass', 'Dembele', 'Fulham', 20.0),
+        ('Pass', 'Murphy', 'Fulham', -20.0),
+        ('Pass', 'Dempsey', 'Fulham', -30.0),
+        ('Touch', 'Arteta', 'Arsenal', -10.0),
+    ]
+    frame = pd.DataFrame(rows, columns=['Event Name', 'Player1 Name', 'Player1 Team', 'X'])
+    frame['Y'] = 0.0
+    frame['Time'] = np.arange(len(frame)) * 10.0
+    frame['Half'] = 0
+    frame['xG Score'] = [np.nan, np.nan, np.nan, 0.1, np.nan, np.nan, np.nan, np.nan]
+    frame['Match Name'] = match_name
+    frame['Team A'] = 'Arsenal'
+    frame['Team B'] = 'Fulham'
+    return frame
+
+
+def test_origin_destination_counts():
+    flows = PassFlowEngine(2, 1).match_flows(_match())
+    assert flows.index['Team'].tolist() == ['Arsenal', 'Fulham']
+    assert flows.matrices[0].tolist() == [[0, 1], [0, 1]]
+    assert flows.matrices[1].tolist() == [[0, 1], [0, 1]]
+
+
+def test_select_sums_matches():
+    engine = PassFlowEngine(2, 1)
+    flows = engine.combine([engine.match_flows(_match()), engine.match_flows(_match('11.08.20 Fulham v Arsenal'))])
+    assert flows.select('Arsenal').tolist() == [[0, 2], [0, 2]]
+    assert flows.select('Arsenal', ['11.08.20 Fulham v Arsenal']).tolist() == [[0, 1], [0, 1]]
+    assert flows.select().tolist() == [[0, 4], [0, 4]]
+    assert flows.select('Chelsea').tolist() == [[0, 0], [0, 0]]
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from src.data.passing import PassingNetwork
+
+
+def _match():
+    """Passes d'Arsenal Arteta -> Song (minutes 0 et 6) et Song -> Walcott (minute 1) ;
+    la passe de Walcott est interceptée, celle de Murphy vers lui-même n'est pas un lien."""
+    rows = [
+        ('Pass', 'Arteta', 'Arsenal', -20.0, 0.0),
+        ('Pass', 'Song', 'Arsenal', -10.0, 5.0),
+        ('Pass', 'Walcott', 'Arsenal', 0.0, 10.0),
+        ('Pass', 'Dembele', 'Fulham', 10.0, -5.0),
+        ('Pass', 'Murphy', 'Fulham', 20.0, np.nan),
+        ('Touch', 'Murphy', 'Fulham', 30.0, -10.0),
+        ('Pass', 'Arteta', 'Arsenal', -30.0, 0.0),
+        ('Shot', 'Song', 'Arsenal', 40.0, 0.0),
+    ]
+    frame = pd.DataFrame(rows, columns=['Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y'])
+    frame['Time'] = np.arange(len(frame)) * 60.0
+    frame['Half'] = 0
+    frame['Team A'] = 'Arsenal'
+    frame['Team B'] = 'Fulham'
+    return frame
+
+
+def test_adjacency_counts():
+    network = PassingNetwork(_match())
+    arsenal = network.team('Arsenal')
+    assert arsenal.players == ['Arteta', 'Song', 'Walcott']
+    assert arsenal.adjacency.tolist() == [[0, 2, 0], [0, 0, 1], [0, 0, 0]]
+    assert arsenal.edges.values.tolist() == [['Arteta', 'Song', 2], ['Song', 'Walcott', 1]]
+    assert arsenal.positions['Touches'].tolist() == [2, 2, 1]
+    assert arsenal.positions['Passes'].tolist() == [2, 1, 0]
+    np.testing.assert_allclose(arsenal.positions['X'], [-25.0, 15.0, 0.0])
+
+    fulham = network.team('Fulham')
+    assert fulham.adjacency.tolist() == [[0, 1], [0, 0]]
+    # Position moyenne de Murphy sur ses seuls événements localisés
+    np.testing.assert_allclose(fulham.positions[['X', 'Y']].to_numpy(), [[10.0, -5.0], [30.0, -10.0]])
+
+
+def test_minute_ranges():
+    network = PassingNetwork(_match())
+    assert network.team('Arsenal', 0, 1).adjacency.tolist() == [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    assert network.team('Arsenal', 2, 6).adjacency.tolist() == [[0, 1, 0], [0, 0, 0], [0, 0, 0]]
+    assert network.team('Arsenal', 2, 5).adjacency.sum() == 0
+    assert network.team('Chelsea').adjacency.shape == (0, 0)
+    assert [n.team for n in network.networks()] == ['Arsenal', 'Fulham']
@@ -0,0 +1,68 @@
+import os
+import pandas as pd
+import pytest
+from src.data import pipeline
+from src.data.pipeline import PERFORMANCE_COLUMNS, BuildPipeline
+
+MATCHES = {
+    "11.08.13 Arsenal v Fulham": ("Arsenal", "Fulham"),
+    "11.08.20 Fulham v Arsenal": ("Fulham", "Arsenal"),
+}
+EVENT_NAMES = ["Pass", "Shot", "Touch", "Tackle", "Block", "Clearance", "Foul", "Yellow Card"]
+
+
+def _write_events(directory, match, extra_shots=0):
+    home, away = MATCHES[match]
+    rows = []
+    for i, event in enumerate(EVENT_NAMES * 2 + ["Shot"] * extra_shots):
+        team = home if i % 2 == 0 else away
+        player = f"{team} {i % 3}"
+        rows.append((match, event, player, team, -40.0 + 5 * i, 10.0 - i, i % 2, 0.1 if event == "Shot" else 0.0))
+    pd.DataFrame(rows, columns=pipeline.EVENT_SOURCE_COLUMNS).to_csv(
+        os.path.join(directory, f"{match} - Events.csv"), index=False)
+
+
+def _write_players(directory, match):
+    rows = []
+    for team in MATCHES[match]:
+        for n in range(3):
+            row = {"Player Name": f"{team} {n}", "Team": team, "Score Opposition": 1}
+            row.update({column: float(n + len(team)) for column in PERFORMANCE_COLUMNS})
+            row["Average X"] = -10.0 + n
+            rows.append(row)
+    pd.DataFrame(rows).to_csv(os.path.join(directory, f"{match} - Players.csv"), index=False)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    events, players = tmp_path / "Events", tmp_path / "Players"
+    events.mkdir()
+    players.mkdir()
+    for match in MATCHES:
+        _write_events(events, match)
+        _write_players(players, match)
+    return str(events), str(players)
+
+
+def test_rebuild_only_recomputes_the_touched_file(sources, tmp_path, monkeypatch):
+    events, players = sources
+    output = str(tmp_path / "incremental")
+    BuildPipeline(events, players, output).build()
+
+    extracted = []
+    extract = pipeline._extract
+    monkeypatch.setattr(pipeline, "_extract", lambda task: extracted.append(os.path.basename(task[1])) or extract(task))
+
+    assert BuildPipeline(events, players, output).build() == []
+    assert extracted == []
+
+    match = "11.08.20 Fulham v Arsenal"
+    _write_events(events, match, extra_shots=2)
+    written = BuildPipeline(events, players, output).build()
+    assert extracted == [f"{match} - Events.csv"]
+    assert sorted(written) == sorted(name for name, kinds in pipeline.TARGETS.items() if "events" in kinds)
+
+    full = str(tmp_path / "full")
+    BuildPipeline(events, players, full).build(force=True)
+    for name in pipeline.TARGETS:
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(output, name)), pd.read_csv(os.path.join(full, name)))
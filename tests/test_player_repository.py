@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from src.data.player_repository import _compact, top_n_positions
+
+
+def test_top_n_positions_matches_stable_sort_with_ties():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 4, size=(60, 3)).astype(float)
+    values[[5, 17, 40], 1] = np.nan
+    frame = pd.DataFrame(values, columns=["Goals", "Assists", "Shots"])
+    for top_n in (1, 5, 12, 60, 80):
+        for ascending in (False, True):
+            positions = top_n_positions(values, top_n, ascending=ascending)
+            for i, column in enumerate(frame.columns):
+                expected = frame[column].sort_values(ascending=ascending, kind="stable").head(top_n).index
+                assert positions[:, i].tolist() == expected.tolist()
+    vector = top_n_positions(values[:, 0], 7)
+    assert vector.tolist() == frame["Goals"].sort_values(ascending=False, kind="stable").head(7).index.tolist()
+
+
+def test_compact_keeps_integer_counts_at_least_int32():
+    table = _compact(pd.DataFrame({
+        "Team": ["Arsenal", "Fulham", "Arsenal"],
+        "Goals": [1, 2, 3],
+        "Touches": [120, 90, 100],
+        "Big": [0, 1, 2 ** 40],
+        "xG": [0.1, 0.2, 0.3],
+    }))
+    assert table["Goals"].dtype == np.int32 and table["Touches"].dtype == np.int32
+    assert table["Big"].dtype == np.int64
+    assert table["xG"].dtype == np.float32
+    assert isinstance(table["Team"].dtype, pd.CategoricalDtype)
+    # Une somme de comptes ne doit pas déborder
+    assert (table["Touches"] * 1000).sum() == 310000
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+from src.data.possessions import assign_possessions, possession_table
+
+
+def _match():
+    """Arsenal attaque vers x > 0 (son tir), Fulham en sens inverse.
+
+    Possessions attendues : [0, 0] passes d'Arsenal jusqu'à la perte, [1, 1] reprise d'Arsenal
+    après la perte puis événement sans équipe, [2] Fulham, [3] récupération de Fulham, [4] tir d'Arsenal.
+    """
+    rows = [
+        ('Pass', 'Arteta', 'Arsenal', -30.0, False, False),
+        ('Pass', 'Song', 'Arsenal', 0.0, True, False),
+        ('Touch', 'Walcott', 'Arsenal', 10.0, False, False),
+        ('Ball Out', None, None, np.nan, False, False),
+        ('Pass', 'Dembele', 'Fulham', 20.0, False, False),
+        ('Pass', 'Murphy', 'Fulham', -20.0, False, True),
+        ('Shot', 'Walcott', 'Arsenal', 30.0, False, False),
+    ]
+    frame = pd.DataFrame(rows, columns=['Event Name', 'Player1 Name', 'Player1 Team', 'X',
+                                        'Possession Loss', 'Possession Regain'])
+    frame['Y'] = 0.0
+    frame['Time'] = np.arange(len(frame)) * 5.0
+    frame['Half'] = 0
+    frame['Move Start'] = [True, False, False, False, True, False, False]
+    frame['xG Score'] = [np.nan] * 6 + [0.2]
+    frame['Match Name'] = '11.08.13 Arsenal v Fulham'
+    frame['Team A'] = 'Arsenal'
+    frame['Team B'] = 'Fulham'
+    return frame
+
+
+def test_possession_boundaries():
+    frame = assign_possessions(_match())
+    assert frame['Possession'].tolist() == [0, 0, 1, 1, 2, 3, 4]
+    assert frame['Possession Team'].tolist() == ['Arsenal'] * 4 + ['Fulham'] * 2 + ['Arsenal']
+
+
+def test_possession_table():
+    table = possession_table(_match())
+    assert table['Team'].tolist() == ['Arsenal', 'Arsenal', 'Fulham', 'Fulham', 'Arsenal']
+    assert table['Events'].tolist() == [2, 2, 1, 1, 1]
+    assert table['Passes'].tolist() == [2, 0, 1, 1, 0]
+    assert table['Moves'].tolist() == [1, 0, 1, 0, 0]
+    assert table['Duration'].tolist() == [5.0, 5.0, 0.0, 0.0, 0.0]
+    assert table['Ends In Shot'].tolist() == [False, False, False, False, True]
+    np.testing.assert_allclose(table['xG'], [0, 0, 0, 0, 0.2])
+    # Abscisses dans le sens d'attaque de l'équipe en possession ; l'événement sans position est ignoré
+    assert table['Start Zone'].tolist() == ['Defensive Third', 'Middle Third', 'Defensive Third', 'Final Third', 'Final Third']
+    assert table['End Zone'].tolist() == ['Middle Third', 'Middle Third', 'Defensive Third', 'Final Third', 'Final Third']
@@ -0,0 +1,53 @@
+import json
+from src.data.registry import IdRegistry
+
+
+def test_concurrent_writers_merge_instead_of_overwriting(tmp_path):
+    path = str(tmp_path / "registry.json")
+    first, second = IdRegistry(path), IdRegistry(path)
+
+    assert first.ids("player", ["Robin VAN PERSIE"]).tolist() == [0]
+    # `second` a été créé avant l'écriture de `first` : il relit le fichier avant d'ajouter ses noms
+    assert second.ids("player", ["Wayne ROONEY", "robin van persie"]).tolist() == [1, 0]
+    assert first.ids("player", ["Wayne Rooney"]).tolist() == [1]
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["player"] == ["Robin VAN PERSIE", "Wayne ROONEY"]
+
+
+def test_version_survives_growth_but_not_reordering(tmp_path):
+    registry = IdRegistry(str(tmp_path / "registry.json"))
+    registry.ids("team", ["Arsenal", "Fulham"])
+    version = registry.version()
+
+    registry.ids("team", ["Chelsea"])
+    assert registry.matches(version)
+
+    rebuilt = IdRegistry(str(tmp_path / "other.json"))
+    rebuilt.ids("team", ["Fulham", "Arsenal"])
+    assert not rebuilt.matches(version)
+    assert not registry.matches(None)
+
+
+def test_queries_never_write_the_registry(tmp_path):
+    path = tmp_path / "registry.json"
+    registry = IdRegistry(str(path))
+    registry.ids("player", ["Robin VAN PERSIE"])
+    stored = path.read_text(encoding="utf-8")
+
+    ids = registry.ids("player", ["robin van persie", "Wayne ROONEY", "Demba BA", "wayne rooney", None], assign=False)
+    assert ids.tolist() == [0, -2, -3, -2, -1]
+    assert registry.lookup("player", "Demba Ba") == -3
+    assert path.read_text(encoding="utf-8") == stored
+
+    # Une construction enregistre ensuite le nom : l'identifiant définitif l'emporte
+    assert registry.ids("player", ["Wayne ROONEY"]).tolist() == [1]
+    assert registry.lookup("player", "Wayne Rooney") == 1
+
+
+def test_default_registry_does_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    import os
+    from src.data import registry
+    monkeypatch.chdir(tmp_path)
+    assert os.path.isabs(registry.REGISTRY_PATH)
+    assert os.path.dirname(registry.REGISTRY_PATH) == registry.APP_DIRECTORY
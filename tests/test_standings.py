@@ -0,0 +1,57 @@
+import pandas as pd
+from src.data.standings import STANDINGS_COLUMNS, StandingsCube
+
+TEAMS = ['Arsenal', 'Chelsea', 'Everton', 'Fulham', 'Wigan']
+
+# Journée 1 : Arsenal et Everton à égalité de points et de différence, départagés aux buts marqués
+# Journée 2 : Everton et Chelsea à égalité de points, départagés à la différence de buts
+MANIFEST = pd.DataFrame([
+    (1, 'Arsenal', 'Chelsea', 3, 1),
+    (1, 'Everton', 'Fulham', 2, 0),
+    (2, 'Chelsea', 'Wigan', 1, 0),
+    (2, 'Fulham', 'Arsenal', 3, 3),
+    (3, 'Wigan', 'Everton', 2, 2),
+    (3, 'Arsenal', 'Fulham', 0, 1),
+], columns=['Matchday', 'Home', 'Away', 'Home Score', 'Away Score'])
+
+
+def _replay(matchweek):
+    """Classement rejoué match par match jusqu'à la journée demandée."""
+    stats = {team: dict.fromkeys(STANDINGS_COLUMNS, 0) for team in TEAMS}
+    for row in MANIFEST[MANIFEST['Matchday'] <= matchweek].itertuples():
+        for team, scored, conceded in ((row.Home, row._4, row._5), (row.Away, row._5, row._4)):
+            entry = stats[team]
+            entry['Played'] += 1
+            entry['Won'] += scored > conceded
+            entry['Drawn'] += scored == conceded
+            entry['Lost'] += scored < conceded
+            entry['GF'] += scored
+            entry['GA'] += conceded
+            entry['GD'] += scored - conceded
+            entry['Points'] += 3 * (scored > conceded) + (scored == conceded)
+    order = sorted(TEAMS, key=lambda t: (-stats[t]['Points'], -stats[t]['GD'], -stats[t]['GF'], TEAMS.index(t)))
+    return order, stats
+
+
+def test_table_matches_replay():
+    cube = StandingsCube(MANIFEST, TEAMS, total_matchdays=3)
+    for matchweek in range(4):
+        order, stats = _replay(matchweek)
+        table = cube.table(matchweek)
+        assert table['Teams'].tolist() == order
+        for row in table.itertuples(index=False):
+            assert [getattr(row, column) for column in STANDINGS_COLUMNS] == list(stats[row.Teams].values())
+    assert cube.table(1)['Teams'].tolist()[:2] == ['Arsenal', 'Everton']
+    assert cube.table(2)['Teams'].tolist()[:3] == ['Arsenal', 'Everton', 'Chelsea']
+
+
+def test_positions_and_trajectory_match_replay():
+    cube = StandingsCube(MANIFEST, TEAMS, total_matchdays=3)
+    trajectory = cube.trajectory()
+    assert trajectory.index.tolist() == [1, 2, 3]
+    for matchweek in range(4):
+        order, _ = _replay(matchweek)
+        expected = [order.index(team) + 1 for team in TEAMS]
+        assert cube.positions[matchweek].tolist() == expected
+        if matchweek:
+            assert trajectory.loc[matchweek].tolist() == expected
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.loader import DataLoader
+from src.data.match_cache import MatchCache
+
+pytest.importorskip("pyarrow")
+
+FILE_NAME = "11.08.13 Arsenal v Fulham - Events.csv"
+
+
+@pytest.fixture
+def events_directory(tmp_path):
+    directory = tmp_path / "Events"
+    directory.mkdir()
+    pd.DataFrame({
+        "Match Name": ["11.08.13 Arsenal v Fulham"] * 3,
+        "Team A": ["Arsenal"] * 3,
+        "Team B": ["Fulham"] * 3,
+        "Event Name": ["Pass", "Substitution", "Shot"],
+        "Player1 Name": ["A", "B", None],
+        "X": [1.5, np.nan, -20.0],
+        "Half": [0, 0, 1],
+        "Possession Loss": [True, None, False],
+        "Possession Regain": [False, False, True],
+        "Move Start": [None, None, True],
+    }).to_csv(directory / FILE_NAME, index=False)
+    return str(directory)
+
+
+def test_csv_and_parquet_reads_match(events_directory, tmp_path):
+    store_directory = str(tmp_path / "Store")
+    csv = DataLoader(events_directory, None, cache=MatchCache()).load_match_data(FILE_NAME)
+    loader = DataLoader(events_directory, None, store_directory, cache=MatchCache())
+    assert loader.build_store() == [FILE_NAME]
+    parquet = loader.load_match_data(FILE_NAME)
+
+    pd.testing.assert_frame_equal(csv, parquet)
+    assert parquet["Possession Loss"].dtype == "boolean"
+    assert parquet["Possession Loss"].tolist() == [True, pd.NA, False]
+
+    # Projection de colonnes et balayage de la saison : mêmes types que la lecture complète
+    columns = ["Event Name", "Possession Loss", "Move Start"]
+    pd.testing.assert_frame_equal(loader.store.read_match(FILE_NAME, columns), csv[columns])
+    pd.testing.assert_frame_equal(loader.store.scan(columns), csv[columns])
+
+
+def test_missing_columns_are_ignored(events_directory, tmp_path):
+    columns = ["Match Name", "Event Name", "xG Score", "Possession Loss"]
+    csv = DataLoader(events_directory, None, cache=MatchCache()).load_match_data(FILE_NAME, columns)
+    loader = DataLoader(events_directory, None, str(tmp_path / "Store"), cache=MatchCache())
+    loader.build_store()
+    parquet = loader.load_match_data(FILE_NAME, columns)
+
+    assert list(csv.columns[:3]) == ["Match Name", "Event Name", "Possession Loss"]
+    pd.testing.assert_frame_equal(csv, parquet)
+    assert list(loader.store.scan(columns).columns) == ["Match Name", "Event Name", "Possession Loss"]
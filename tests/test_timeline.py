@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from src.data.timeline import MatchTimeline
+
+# Première mi-temps jusqu'à 47 min (temps additionnel), deuxième mi-temps jusqu'à 48:20 de son horloge
+EVENTS = pd.DataFrame({
+    'Event Name': ['Pass', 'Shot', 'Pass', 'Cross', 'Pass', 'Shot', 'Pass', 'Goal'],
+    'Player1 Name': ['Rooney', 'Rooney', 'Young', 'Young', 'Rooney', 'Young', 'Rooney', 'Rooney'],
+    'Time': [2700.0, 60.0, 2820.0, 600.0, 10.0, 2900.0, 1500.0, 2750.0],
+    'Half': [0, 0, 0, 0, 1, 1, 1, 1],
+    'X': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+    'Y': [-1.0, -2.0, -3.0, -4.0, -5.0, -6.0, -7.0, -8.0],
+})
+
+
+def _old_query(data, players, event_types, minutes):
+    """Filtrage d'origine de DataProcessor.get_events_vector_by_time (copie, tri et masque à chaque appel)."""
+    data_sorted = data.copy()
+    first_half_end = data_sorted[data_sorted['Half'] == 0]['Time'].max()
+    data_sorted.loc[data_sorted['Half'] == 1, 'Time'] += first_half_end
+    data_sorted = data_sorted.sort_values('Time').reset_index(drop=True)
+    mask = (data_sorted['Event Name'].isin(event_types) & data_sorted['Player1 Name'].isin(players)
+            & (data_sorted['Time'] <= minutes * 60))
+    indices = data_sorted[mask].index
+    filtered = data_sorted.loc[indices].copy()
+    last = len(data_sorted) - 1
+    filtered['end_x'] = [data_sorted.loc[min(i + 1, last), 'X'] for i in indices]
+    filtered['end_y'] = [data_sorted.loc[min(i + 1, last), 'Y'] for i in indices]
+    return filtered
+
+
+def test_query_matches_per_call_filtering():
+    timeline = MatchTimeline(EVENTS)
+    for players in (['Rooney'], ['Young'], ['Rooney', 'Young', 'Nobody']):
+        for event_types in (['Pass'], ['Shot', 'Goal'], ['Pass', 'Cross', 'Shot', 'Goal']):
+            for minutes in (0, 1, 47, 48, 72, 94, 95, 97, 120):
+                result = timeline.query(players, event_types, minutes)
+                expected = _old_query(EVENTS, players, event_types, minutes)
+                pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+def test_second_half_stoppage_time_and_last_event():
+    timeline = MatchTimeline(EVENTS)
+    # 2820 s de première mi-temps + 2900 s de deuxième : 95:20, soit 96 minutes de curseur
+    assert timeline.max_minute == 96
+    assert timeline.max_minute == int((2820 + 2900) / 60) + 1
+    assert timeline.query(['Young'], ['Shot'], 95).empty
+    last = timeline.query(['Young'], ['Shot'], 96)
+    assert last['Time'].tolist() == [5720.0]
+    # Le dernier événement du match pointe sur lui-même
+    assert (last['end_x'].iloc[0], last['end_y'].iloc[0]) == (6.0, -6.0)
+    assert np.isclose(timeline.query(['Rooney'], ['Goal'], 96)['end_x'].iloc[0], 6.0)
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from src.data.processor import DataProcessor
+from src.data.xg import XGModel, match_shots
+
+
+def _synthetic_match(seed=0, shots=200):
+    """Tirs alternés des deux équipes ; les tirs proches du but marquent plus souvent."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    time = 0.0
+    for i in range(shots):
+        team = "Home" if i % 2 == 0 else "Away"
+        x = rng.uniform(30, 50) * (1 if team == "Home" else -1)
+        y = rng.uniform(-15, 15)
+        rows.append(("Shot", team, x, y, time))
+        if rng.random() < (0.6 if abs(x) > 44 else 0.05):
+            rows.append(("Goal", team, x, y, time + 1))
+        time += 20
+    rows.append(("Shot", "Home", np.nan, np.nan, time))
+    rows.append(("Direct Free Kick Cross", "Home", 30.0, 20.0, time + 20))
+    frame = pd.DataFrame(rows, columns=["Event Name", "Player1 Team", "X", "Y", "Time"])
+    frame["Match Name"] = "11.08.13 Home v Away"
+    frame["Player1 Name"] = frame["Player1 Team"] + " 9"
+    frame["Half"] = 0
+    frame["xG Score"] = np.nan
+    return frame
+
+
+def test_shots_exclude_crosses_and_keep_unlocated_shots():
+    shots = match_shots(_synthetic_match())
+    assert "Direct Free Kick Cross" not in set(shots["Event Name"])
+    assert shots["Distance"].isna().sum() == 1
+
+
+def test_fit_ignores_non_finite_shots():
+    shots = match_shots(_synthetic_match())
+    model = XGModel().fit(shots)
+    assert np.isfinite(model.coefficients).all()
+
+    predicted = model.predict(shots)
+    located = shots["Distance"].notna().to_numpy()
+    assert np.isnan(predicted[~located]).all()
+    assert ((predicted[located] > 0) & (predicted[located] < 1)).all()
+    close = located & (shots["Distance"] < 10).to_numpy()
+    far = located & (shots["Distance"] > 18).to_numpy()
+    assert predicted[close].mean() > predicted[far].mean()
+
+
+def test_score_shots_adds_model_column():
+    data = _synthetic_match(seed=1)
+    model = XGModel().fit(match_shots(_synthetic_match(seed=2)))
+    scored = DataProcessor().score_shots(data, model)
+    assert len(scored) == 201
+    assert scored["xG Model"].notna().sum() == 200
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from src.data.xthreat import ExpectedThreat
+
+
+def _match():
+    """Arsenal attaque vers x > 0 (ses tirs) ; Fulham, sans tir, attaque en sens inverse.
+
+    Sur une grille 2 x 1 (case 0 : x < 0, case 1 : x >= 0) :
+    - passe réussie d'Arsenal 0 -> 1, puis 1 -> 1, tir (xG 0.3) en case 1 ;
+    - passe ratée de Fulham en x = 20, soit -20 dans son sens d'attaque (case 0) ;
+    - tir d'Arsenal (xG 0.5) en case 1.
+    """
+    rows = [
+        ('Pass', 'Arteta', 'Arsenal', -20.0, 0.0),
+        ('Pass', 'Song', 'Arsenal', 20.0, 0.0),
+        ('Shot', 'Arteta', 'Arsenal', 30.0, 0.0),
+        ('Pass', 'Dembele', 'Fulham', 20.0, 0.0),
+        ('Shot', 'Arteta', 'Arsenal', 40.0, 0.0),
+    ]
+    frame = pd.DataFrame(rows, columns=['Event Name', 'Player1 Name', 'Player1 Team', 'X', 'Y'])
+    frame['Time'] = np.arange(len(frame)) * 10.0
+    frame['Half'] = 0
+    frame['xG Score'] = [np.nan, np.nan, 0.3, np.nan, 0.5]
+    frame['Match Name'] = '11.08.13 Arsenal v Fulham'
+    frame['Team A'] = 'Arsenal'
+    frame['Team B'] = 'Fulham'
+    return frame
+
+
+def test_match_counts_per_cell():
+    counts = ExpectedThreat(2, 1).match_counts(_match())
+    assert counts.shots.tolist() == [0, 2]
+    np.testing.assert_allclose(counts.xg, [0.0, 0.8])
+    assert counts.moves.tolist() == [2, 1]
+    assert counts.transitions.reshape(2, 2).tolist() == [[0, 1], [0, 1]]
+
+
+def test_value_iteration_steps():
+    counts = [ExpectedThreat(2, 1).match_counts(_match())]
+    # Case 1 : tir 2/3 x xG moyen 0.4 ; case 0 : déplacement sûr, une fois sur deux vers la case 1
+    reward = [0.0, 2 / 3 * 0.4]
+    np.testing.assert_allclose(ExpectedThreat(2, 1).fit(counts, max_iterations=1).surface.ravel(), reward)
+    one_step = [0.5 * reward[1], reward[1] + reward[1] / 3]
+    np.testing.assert_allclose(ExpectedThreat(2, 1).fit(counts, max_iterations=2).surface.ravel(), one_step)
+    # Point fixe : v1 = 0.8 / 3 + v1 / 3, v0 = v1 / 2
+    model = ExpectedThreat(2, 1).fit(counts)
+    np.testing.assert_allclose(model.surface.ravel(), [0.2, 0.4], atol=1e-6)
+
+    rated = model.rate(_match())
+    assert rated['Success'].tolist() == [True, True, False]
+    np.testing.assert_allclose(rated['xT Added'], [0.2, 0.0, 0.0], atol=1e-6)